@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import argparse
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import scapy.all as scapy
+
+from fit_acquisition.capture_backend import (
+    CAPTURE_BACKEND_RAW,
+    CAPTURE_BACKEND_SCAPY,
+    CAPTURE_BACKEND_SUBPROCESS,
+    RawSocketSniffer,
+    SubprocessSniffer,
+    find_capture_program,
+)
+from fit_acquisition.pcap_writer import PcapFileWriter, StreamingPacketWriter
+
+
+def open_writer(directory, name, queue_size):
+    filename = os.path.join(directory, f"{name}.pcap")
+    return StreamingPacketWriter(
+        lambda: PcapFileWriter(open(filename, "wb")), max_queue=queue_size
+    )
+
+
+def synthetic_frames(count, payload_size):
+    frame = bytes(
+        scapy.Ether()
+        / scapy.IP(dst="192.0.2.1")
+        / scapy.TCP(dport=443)
+        / (b"x" * payload_size)
+    )
+    return [frame] * count
+
+
+# Offline mode replays the same frames through both paths, so only the
+# per-packet cost of dissection is measured.
+def run_offline(count, payload_size, queue_size):
+    frames = synthetic_frames(count, payload_size)
+
+    def scapy_path(writer, frame, timestamp):
+        packet = scapy.Ether(frame)
+        writer.put(bytes(packet), timestamp, 1)
+
+    def raw_path(writer, frame, timestamp):
+        writer.put(frame, timestamp, 1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, handler in (
+            (CAPTURE_BACKEND_SCAPY, scapy_path),
+            (CAPTURE_BACKEND_RAW, raw_path),
+        ):
+            writer = open_writer(directory, name, queue_size)
+            writer.start()
+            start = time.perf_counter()
+            for frame in frames:
+                handler(writer, frame, time.time())
+            elapsed = time.perf_counter() - start
+            writer.close()
+
+            print(
+                f"{name:<10} {count / elapsed:12.0f} packets/s "
+                f"written={writer.packets_written} dropped={writer.dropped}"
+            )
+
+
+def send_udp(port, seconds, payload_size):
+    sent = 0
+    payload = b"x" * payload_size
+    deadline = time.monotonic() + seconds
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        while time.monotonic() < deadline:
+            s.sendto(payload, ("127.0.0.1", port))
+            sent += 1
+    return sent
+
+
+def live_backends():
+    backends = [CAPTURE_BACKEND_SCAPY, CAPTURE_BACKEND_RAW]
+    if find_capture_program():
+        backends.append(CAPTURE_BACKEND_SUBPROCESS)
+    return backends
+
+
+# Live mode needs capture privileges: it floods the loopback interface and
+# compares what each backend wrote with what was sent.
+def run_live(iface, seconds, payload_size, queue_size, port):
+    capture_filter = f"udp port {port}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in live_backends():
+            writer = open_writer(directory, name, queue_size)
+            writer.start()
+
+            if name == CAPTURE_BACKEND_SCAPY:
+                sniffer = scapy.AsyncSniffer(
+                    prn=lambda p: writer.put(bytes(p), float(p.time), 1),
+                    store=False,
+                    filter=capture_filter,
+                    iface=iface,
+                )
+            elif name == CAPTURE_BACKEND_RAW:
+                sniffer = RawSocketSniffer(
+                    writer.put, scapy.conf.L2listen, filter=capture_filter, iface=iface
+                )
+            else:
+                sniffer = SubprocessSniffer(
+                    writer.put,
+                    find_capture_program(),
+                    filter=capture_filter,
+                    iface=iface,
+                )
+
+            sniffer.start()
+            time.sleep(1)
+            result = dict()
+            sender = threading.Thread(
+                target=lambda: result.update(
+                    sent=send_udp(port, seconds, payload_size)
+                )
+            )
+            sender.start()
+            sender.join()
+            time.sleep(1)
+            sniffer.stop()
+            writer.close()
+
+            lost = max(result["sent"] - writer.packets_written, 0)
+            print(
+                f"{name:<10} sent={result['sent']} "
+                f"written={writer.packets_written} "
+                f"({writer.packets_written / seconds:.0f} packets/s) "
+                f"queue_dropped={writer.dropped} lost={lost}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the scapy capture path with the raw-bytes backends."
+    )
+    parser.add_argument("--packets", type=int, default=200000)
+    parser.add_argument("--payload", type=int, default=512)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument(
+        "--live", action="store_true", help="capture real traffic (needs root)"
+    )
+    parser.add_argument("--iface", default="lo")
+    parser.add_argument("--seconds", type=int, default=10)
+    parser.add_argument("--port", type=int, default=54321)
+    args = parser.parse_args()
+
+    if args.live:
+        run_live(args.iface, args.seconds, args.payload, args.queue_size, args.port)
+    else:
+        run_offline(args.packets, args.payload, args.queue_size)
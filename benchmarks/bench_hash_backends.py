@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+
+from fit_acquisition.hash_engine import (
+    BACKENDS,
+    DEFAULT_ALGORITHMS,
+    hash_file,
+    throughput_mb_s,
+)
+
+
+def legacy_hash(filename, algorithms):
+    digests = {}
+    for algorithm in algorithms:
+        with open(filename, "rb") as f:
+            file_hash = hashlib.new(algorithm)
+            while chunk := f.read(8192):
+                file_hash.update(chunk)
+            digests[algorithm] = file_hash.hexdigest()
+    return digests
+
+
+def write_synthetic_file(filename, size_mb):
+    block = os.urandom(1024 * 1024)
+    with open(filename, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block)
+
+
+def run(size_mb, repeat, algorithms):
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "synthetic.bin")
+        write_synthetic_file(filename, size_mb)
+        size = os.path.getsize(filename)
+
+        candidates = {"legacy (3 passes, 8 KiB)": legacy_hash}
+        for backend in BACKENDS:
+            candidates[backend] = (
+                lambda path, algos, backend=backend: hash_file(
+                    path, algos, backend=backend
+                )
+            )
+
+        expected = None
+        for name, function in candidates.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                digests = function(filename, algorithms)
+                timings.append(time.perf_counter() - start)
+
+            expected = expected or digests
+            assert digests == expected, f"{name} produced different digests"
+
+            best = min(timings)
+            print(
+                f"{name:<26} best={best:8.3f}s "
+                f"throughput={throughput_mb_s(size, best):8.1f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare hash I/O backends on a synthetic file."
+    )
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--algorithms", nargs="+", default=list(DEFAULT_ALGORITHMS))
+    args = parser.parse_args()
+
+    run(args.size_mb, args.repeat, args.algorithms)
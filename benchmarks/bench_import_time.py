@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "scapy.all",
+    "requests",
+    "whois",
+    "nslookup",
+    "rfc3161ng",
+    "fit_common.core.pdf_report_builder",
+)
+
+CORE_TASK_PACKAGES = (
+    "fit_acquisition.tasks.infinite_loop",
+    "fit_acquisition.tasks.network_tools",
+    "fit_acquisition.tasks.post_acquisition",
+)
+
+# Every sample runs in a fresh interpreter, since a module is only imported
+# once per process.
+PROBE = """
+import json, resource, sys, time
+from importlib import import_module
+
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+print(json.dumps({{
+    "elapsed": elapsed,
+    "rss_kb": rss,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def discovery_body():
+    return "\n".join(
+        [
+            "from fit_acquisition.tasks.task_discovery import TaskDiscovery",
+            f"for package in {CORE_TASK_PACKAGES!r}:",
+            "    TaskDiscovery().discover(package)",
+        ]
+    )
+
+
+def sample(body, repeat):
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(body=body, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "elapsed": statistics.median(result["elapsed"] for result in results),
+        "rss_kb": statistics.median(result["rss_kb"] for result in results),
+        "heavy": results[-1]["heavy"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure import time and RSS of task discovery and heavy dependencies."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    discovery = sample(discovery_body(), args.repeat)
+    print(
+        f"{'task discovery':36s} {discovery['elapsed'] * 1000:9.1f} ms "
+        f"{discovery['rss_kb'] / 1024:8.1f} MiB"
+    )
+    print(f"  heavy modules loaded: {', '.join(discovery['heavy']) or 'none'}")
+
+    for module in HEAVY_MODULES:
+        try:
+            result = sample(f"import_module({module!r})", args.repeat)
+        except subprocess.CalledProcessError:
+            print(f"{module:36s} {'not installed':>12s}")
+            continue
+        print(
+            f"{module:36s} {result['elapsed'] * 1000:9.1f} ms "
+            f"{result['rss_kb'] / 1024:8.1f} MiB"
+        )
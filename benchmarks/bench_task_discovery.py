@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import argparse
+import time
+
+from fit_acquisition.tasks.task_discovery import TaskDiscovery
+from fit_acquisition.tasks.tasks_handler import TasksHandler
+from fit_acquisition.tasks.tasks_manager import TasksManager
+
+CORE_TASK_PACKAGES = (
+    "fit_acquisition.tasks.infinite_loop",
+    "fit_acquisition.tasks.network_tools",
+    "fit_acquisition.tasks.post_acquisition",
+)
+
+
+def load_tasks_manager():
+    manager = TasksManager(TasksHandler())
+    for package in CORE_TASK_PACKAGES:
+        manager.register_task_package(package)
+    manager.load_all_task_modules()
+    return manager
+
+
+def measure(iterations, cached):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if not cached:
+            TaskDiscovery().clear()
+        load_tasks_manager()
+    return (time.perf_counter() - start) / iterations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure task discovery cost when building a TasksManager."
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    load_tasks_manager()
+    cold = time.perf_counter() - start
+
+    walked = measure(args.iterations, cached=False)
+    cached = measure(args.iterations, cached=True)
+
+    print(f"first load (imports included) {cold * 1000:9.2f} ms")
+    print(f"walk and introspect packages  {walked * 1000:9.3f} ms/manager")
+    print(f"cached discovery              {cached * 1000:9.3f} ms/manager")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from fit_common.gui.utils import State
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from fit_acquisition.tasks.task import Task
+from fit_acquisition.tasks.task_worker import TaskWorker
+
+
+class NullLogger:
+    def info(self, message):
+        pass
+
+
+class NoopWorker(TaskWorker):
+    def start(self):
+        self.started.emit()
+        self.finished.emit()
+
+
+class NoopTask(Task):
+    def __init__(self):
+        super().__init__(NullLogger(), None, None, worker_class=NoopWorker)
+        self.options = dict()
+
+
+# Reproduces the fixed wait every Task used to add before tearing down its
+# worker thread, so both variants run through the same code path.
+def legacy_finished(delay_ms):
+    finished = Task._finished
+
+    def _finished(self, *args, **kwargs):
+        loop = QEventLoop()
+        QTimer.singleShot(delay_ms, loop.quit)
+        loop.exec()
+        finished(self, *args, **kwargs)
+
+    return _finished
+
+
+def run_chain(app, tasks_count):
+    tasks = [NoopTask() for _ in range(tasks_count)]
+    for current, following in zip(tasks, tasks[1:]):
+        current.finished.connect(lambda task=following: task.start_task(""))
+
+    start = time.perf_counter()
+    tasks[0].start_task("")
+    while tasks[-1].state != State.COMPLETED:
+        app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents, 50)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the end-to-end latency of a serial task chain."
+    )
+    parser.add_argument("--tasks", type=int, default=14)
+    parser.add_argument("--legacy-delay-ms", type=int, default=1000)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+
+    current = run_chain(app, args.tasks)
+    original = Task._finished
+    Task._finished = legacy_finished(args.legacy_delay_ms)
+    try:
+        legacy = run_chain(app, args.tasks)
+    finally:
+        Task._finished = original
+
+    print(f"tasks={args.tasks}")
+    print(f"legacy ({args.legacy_delay_ms} ms wait) {legacy:8.3f}s")
+    print(f"worker-driven teardown      {current:8.3f}s")
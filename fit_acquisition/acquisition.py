@@ -21,11 +21,15 @@ from PySide6.QtCore import QObject, Signal
 from shiboken6 import isValid
 
 from fit_acquisition.class_names import class_names
+from fit_acquisition.hash_registry import DigestRegistry
 from fit_acquisition.lang import load_translations
 from fit_acquisition.logger import LogConfigTools
-from fit_acquisition.logger_names import LoggerName
+from fit_acquisition.logger_names import LoggerName, scoped_logger_name
 from fit_acquisition.post import PostAcquisition
+from fit_acquisition.tasks.network_tools_runner import NetworkToolsRunner
+from fit_acquisition.tasks.tasks_handler import TasksHandler
 from fit_acquisition.tasks.tasks_manager import TasksManager
+from fit_acquisition.tasks.worker_pool import BoundedWorkerPool, WorkerPool
 
 
 class AcquisitionStatus(Enum):
@@ -47,10 +51,13 @@ class Acquisition(QObject):
         self,
         logger,
         packages=[],
+        logger_scope=None,
     ):
         super().__init__()
 
         self.logger = logger
+        self.logger_scope = logger_scope
+        self.log_confing = None
         self.__options = None
         self.__progress_bar = None
         self.__status_bar = None
@@ -80,7 +87,8 @@ class Acquisition(QObject):
             },
         ]
 
-        self.tasks_manager = TasksManager()
+        self.task_handler = TasksHandler()
+        self.tasks_manager = TasksManager(self.task_handler)
 
         core_task_packages = [
             "fit_acquisition.tasks.infinite_loop",
@@ -88,7 +96,7 @@ class Acquisition(QObject):
             "fit_acquisition.tasks.post_acquisition",
         ]
 
-        packages += core_task_packages
+        packages = list(packages) + core_task_packages
 
         for package in packages:
             self.tasks_manager.register_task_package(package)
@@ -112,7 +120,9 @@ class Acquisition(QObject):
 
         self.external_tasks = list()
 
-        self.post_acquisition = PostAcquisition()
+        self.network_tools_runner = NetworkToolsRunner()
+
+        self.post_acquisition = PostAcquisition(self.task_handler)
         self.post_acquisition.finished.connect(self.post_acquisition_finished.emit)
         self.destroyed.connect(lambda: self.__destroyed_handler(self.__dict__))
 
@@ -180,11 +190,31 @@ class Acquisition(QObject):
     def load_tasks(self):
         self.log_confing = LogConfigTools()
 
-        if self.logger.name == LoggerName.SCRAPER_WEB.value:
+        if self.logger.name == scoped_logger_name(
+            self.logger_scope, LoggerName.SCRAPER_WEB.value
+        ):
             self.log_confing.set_dynamic_loggers()
 
         self.log_confing.change_filehandlers_path(self.options["acquisition_directory"])
-        logging.config.dictConfig(self.log_confing.config)
+        if self.logger_scope:
+            self.options["logger_scope"] = self.logger_scope
+            self.log_confing.configure_scope(self.logger_scope)
+        else:
+            logging.config.dictConfig(self.log_confing.config)
+
+        if self.options.get("hash_reuse_precomputed"):
+            self.task_handler.digest_registry = DigestRegistry(
+                self.options.get("hash_algorithms")
+            )
+        else:
+            self.task_handler.digest_registry = None
+        # A thread cap only bounds this acquisition; without one its tasks run
+        # on the process wide pool.
+        max_worker_threads = self.options.get("max_worker_threads")
+        if max_worker_threads:
+            self.task_handler.worker_pool = BoundedWorkerPool(max_worker_threads)
+        else:
+            self.task_handler.worker_pool = WorkerPool()
 
         all_tasks = (
             self.start_tasks
@@ -202,6 +232,8 @@ class Acquisition(QObject):
             if isValid(task):
                 task.deleteLater()
         self.tasks_manager.clear_tasks()
+        if self.logger_scope and self.log_confing is not None:
+            self.log_confing.release_scope(self.logger_scope)
         self._start_emitted = False
         self._stop_emitted = False
 
@@ -233,6 +265,7 @@ class Acquisition(QObject):
         if len(tasks) == 0:
             self.stop_tasks_finished.emit()
         else:
+            network_tools = list()
             for task in tasks:
                 task.finished.connect(self.__finished_task_handler)
                 task.options = self.options
@@ -241,7 +274,13 @@ class Acquisition(QObject):
                 if task.is_infinite_loop:
                     task.stop()
                 else:
-                    task.start()
+                    network_tools.append(task)
+
+            self.network_tools_runner.run(
+                network_tools,
+                max_concurrent=self.options.get("network_tools_max_concurrent", 0),
+                deadline=self.options.get("network_tools_deadline", 0),
+            )
 
     def __finished_task_handler(self):
         if (
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import copy
+import logging
+import os
+import re
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+from fit_common.core import debug, get_context, log_exception
+from PySide6.QtCore import QEventLoop, QObject, QTimer, Signal
+
+from fit_acquisition.acquisition import Acquisition
+from fit_acquisition.class_names import class_names
+from fit_acquisition.logger_names import LoggerName, scoped_logger_name
+from fit_acquisition.tasks.worker_pool import WorkerPool
+
+DEFAULT_STOP_TASKS = (
+    class_names.WHOIS,
+    class_names.NSLOOKUP,
+    class_names.HEADERS,
+    class_names.SSLCERTIFICATE,
+    class_names.TRACEROUTE,
+)
+
+
+def acquisition_directory_name(index, target):
+    host = urlparse(target).hostname or target
+    return f"{index:04d}_" + re.sub(r"[^A-Za-z0-9._-]+", "_", host).strip("_")
+
+
+def acquisitions_per_hour(completed, elapsed):
+    if elapsed <= 0:
+        return 0.0
+    return completed * 3600 / elapsed
+
+
+class BatchAcquisitionRunner(QObject):
+    acquisition_finished = Signal(object)
+    finished = Signal(object)
+    _acquired = Signal(int, str)
+
+    def __init__(
+        self,
+        output_directory,
+        options=None,
+        acquire=None,
+        max_concurrent=4,
+        start_tasks=(),
+        stop_tasks=DEFAULT_STOP_TASKS,
+        packages=(),
+        logger_name=LoggerName.SCRAPER_WEB.value,
+    ):
+        super().__init__()
+        self.output_directory = output_directory
+        self.options = options or dict()
+        self.acquire = acquire
+        self.max_concurrent = max(1, max_concurrent)
+        self.start_tasks = list(start_tasks)
+        self.stop_tasks = list(stop_tasks)
+        self.packages = list(packages)
+        self.logger_name = logger_name
+
+        self.__pending = deque()
+        self.__running = dict()
+        self.__started_at = None
+        self.__done = True
+        self.results = list()
+
+        self._acquired.connect(self.__acquired)
+
+    @property
+    def is_running(self):
+        return bool(self.__pending or self.__running)
+
+    def start(self, targets):
+        self.__pending = deque(enumerate(targets, start=1))
+        self.__running = dict()
+        self.__started_at = time.monotonic()
+        self.__done = False
+        self.results = list()
+        self.__start_next()
+
+    def run(self, targets):
+        loop = QEventLoop()
+        report = dict()
+        self.finished.connect(report.update)
+        self.finished.connect(loop.quit)
+        self.start(targets)
+        if self.is_running:
+            loop.exec()
+        self.finished.disconnect(loop.quit)
+        self.finished.disconnect(report.update)
+        return report
+
+    def __start_next(self):
+        while self.__pending and len(self.__running) < self.max_concurrent:
+            index, target = self.__pending.popleft()
+            self.__start_acquisition(index, target)
+
+        if not self.__done and not self.is_running:
+            self.__done = True
+            self.__finish()
+
+    def __start_acquisition(self, index, target):
+        directory = os.path.join(
+            self.output_directory, acquisition_directory_name(index, target)
+        )
+        scope = f"batch.{index}"
+
+        options = copy.deepcopy(self.options)
+        options["url"] = target
+        options["acquisition_directory"] = directory
+
+        acquisition = Acquisition(
+            logging.getLogger(scoped_logger_name(scope, self.logger_name)),
+            list(self.packages),
+            logger_scope=scope,
+        )
+        acquisition.options = options
+        acquisition.start_tasks = list(self.start_tasks)
+        acquisition.stop_tasks = list(self.stop_tasks)
+
+        self.__running[index] = {
+            "acquisition": acquisition,
+            "target": target,
+            "directory": directory,
+            "started": time.monotonic(),
+            "error": None,
+        }
+
+        acquisition.start_tasks_finished.connect(lambda: self.__run_acquire(index))
+        acquisition.stop_tasks_finished.connect(acquisition.start_post_acquisition)
+        acquisition.post_acquisition_finished.connect(
+            lambda: self.__acquisition_completed(index)
+        )
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            acquisition.load_tasks()
+            acquisition.log_start_message()
+        except Exception as e:
+            log_exception(e, context=get_context(self))
+            self.__running[index]["error"] = str(e)
+            self.__acquisition_completed(index)
+            return
+
+        acquisition.run_start_tasks()
+
+    def __run_acquire(self, index):
+        item = self.__running[index]
+        if self.acquire is None:
+            self.__acquired(index, "")
+            return
+
+        def _acquire():
+            try:
+                self.acquire(item["target"], item["directory"])
+                self._acquired.emit(index, "")
+            except Exception as e:
+                log_exception(e, context=get_context(self))
+                self._acquired.emit(index, str(e))
+
+        WorkerPool().submit(_acquire)
+
+    def __acquired(self, index, error):
+        item = self.__running.get(index)
+        if item is None:
+            return
+
+        item["error"] = error or None
+        # Stop and post acquisition tasks still run after a failed capture,
+        # so the directory is sealed with whatever was collected.
+        item["acquisition"].log_stop_message()
+        item["acquisition"].run_stop_tasks()
+
+    def __acquisition_completed(self, index):
+        item = self.__running.pop(index, None)
+        if item is None:
+            return
+
+        acquisition = item.pop("acquisition")
+        if item["error"] is None:
+            acquisition.log_end_message()
+        acquisition.unload_tasks()
+        acquisition.deleteLater()
+
+        item["duration"] = time.monotonic() - item.pop("started")
+        self.results.append(item)
+        self.acquisition_finished.emit(dict(item))
+
+        # Deferred, so acquisitions whose tasks all complete synchronously do
+        # not start the next one from inside their own signal handlers.
+        QTimer.singleShot(0, self.__start_next)
+
+    def __finish(self):
+        elapsed = time.monotonic() - self.__started_at
+        completed = [result for result in self.results if result["error"] is None]
+        report = {
+            "targets": len(self.results),
+            "completed": len(completed),
+            "failed": len(self.results) - len(completed),
+            "elapsed": elapsed,
+            "acquisitions_per_hour": acquisitions_per_hour(len(completed), elapsed),
+            "results": sorted(self.results, key=lambda result: result["directory"]),
+        }
+        debug(
+            f"ℹ️ BatchAcquisitionRunner: {report['completed']}/{report['targets']} "
+            f"acquisitions in {elapsed:.1f}s "
+            f"({report['acquisitions_per_hour']:.1f} acquisitions/hour)",
+            context=get_context(self),
+        )
+        self.finished.emit(report)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import os
+import select
+import shutil
+import socket
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+
+from fit_acquisition.lazy_import import LazyImport
+from fit_acquisition.pcap_writer import DEFAULT_SNAPLEN, iter_pcap_records
+
+conf = LazyImport("scapy.config", "conf")
+
+CAPTURE_BACKEND_SCAPY = "scapy"
+CAPTURE_BACKEND_RAW = "raw"
+CAPTURE_BACKEND_SUBPROCESS = "subprocess"
+CAPTURE_BACKENDS = (
+    CAPTURE_BACKEND_SCAPY,
+    CAPTURE_BACKEND_RAW,
+    CAPTURE_BACKEND_SUBPROCESS,
+)
+
+CAPTURE_PROGRAMS = ("dumpcap", "tcpdump")
+
+SOL_PACKET = getattr(socket, "SOL_PACKET", 263)
+PACKET_STATISTICS = 6
+
+# dumpcap and tcpdump fail within milliseconds on a missing permission, an
+# unknown interface or an invalid filter.
+DEFAULT_STARTUP_TIMEOUT = 0.3
+MAX_ERROR_MESSAGE = 2000
+
+
+def find_capture_program(programs=CAPTURE_PROGRAMS):
+    for program in programs:
+        path = shutil.which(program)
+        if path:
+            return path
+    return None
+
+
+def capture_command(program, iface=None, capture_filter=None, snaplen=DEFAULT_SNAPLEN):
+    # Both tools write a classic pcap stream to stdout, flushed per packet.
+    if "dumpcap" in program:
+        command = [program, "-q", "-P", "-s", str(snaplen), "-w", "-"]
+        command += ["-i", iface or "any"]
+        if capture_filter:
+            command += ["-f", capture_filter]
+    else:
+        command = [program, "-U", "-n", "-s", str(snaplen), "-w", "-"]
+        command += ["-i", iface or "any"]
+        if capture_filter:
+            command.append(capture_filter)
+    return command
+
+
+class RawSocketSniffer:
+    def __init__(self, prn, socket_factory, filter=None, iface=None, timeout=0.2):
+        self.__prn = prn
+        self.__socket_factory = socket_factory
+        self.__filter = filter
+        self.__iface = iface
+        self.__timeout = timeout
+        self.__socket = None
+        self.__thread = None
+        self.__stop_event = threading.Event()
+        self.__kernel_drops = 0
+        self.__kernel_drops_lock = threading.Lock()
+        self.packets = 0
+
+    def kernel_drops(self):
+        # PACKET_STATISTICS counters are reset by every read on Linux, and both
+        # the metrics thread and the pcapng writer read them.
+        with self.__kernel_drops_lock:
+            raw_socket = getattr(self.__socket, "ins", None)
+            if raw_socket is None:
+                return self.__kernel_drops
+            try:
+                _, drops = struct.unpack(
+                    "=II", raw_socket.getsockopt(SOL_PACKET, PACKET_STATISTICS, 8)
+                )
+            except (OSError, struct.error):
+                return self.__kernel_drops
+            self.__kernel_drops += drops
+            return self.__kernel_drops
+
+    def start(self):
+        arguments = dict()
+        if self.__filter:
+            arguments["filter"] = self.__filter
+        if self.__iface:
+            arguments["iface"] = self.__iface
+
+        self.__socket = self.__socket_factory(**arguments)
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(
+            target=self.__run, name="fit-raw-capture", daemon=True
+        )
+        self.__thread.start()
+
+    def __run(self):
+        layer2num = conf.l2types.layer2num
+        while not self.__stop_event.is_set():
+            ready, _, _ = select.select([self.__socket], [], [], self.__timeout)
+            if not ready:
+                continue
+
+            # recv_raw() returns the frame bytes without building scapy layers.
+            cls, data, timestamp = self.__socket.recv_raw()
+            if data:
+                self.packets += 1
+                self.__prn(
+                    data,
+                    timestamp if timestamp is not None else time.time(),
+                    layer2num.get(cls),
+                )
+
+    def stop(self):
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        if self.__socket is not None:
+            self.kernel_drops()
+            self.__socket.close()
+            self.__socket = None
+
+
+class SubprocessSniffer:
+    def __init__(
+        self,
+        prn,
+        program,
+        filter=None,
+        iface=None,
+        snaplen=DEFAULT_SNAPLEN,
+        startup_timeout=None,
+    ):
+        self.__prn = prn
+        self.__program = program
+        self.__command = capture_command(program, iface, filter, snaplen)
+        self.__startup_timeout = (
+            DEFAULT_STARTUP_TIMEOUT if startup_timeout is None else startup_timeout
+        )
+        self.__process = None
+        self.__stderr = None
+        self.__thread = None
+        self.packets = 0
+        self.error = None
+
+    @property
+    def command(self):
+        return self.__command
+
+    def start(self):
+        self.error = None
+        # stderr goes to a file rather than a pipe, so a chatty tool can never
+        # block on it while nobody reads.
+        self.__stderr = tempfile.TemporaryFile()
+        self.__process = subprocess.Popen(
+            self.__command, stdout=subprocess.PIPE, stderr=self.__stderr
+        )
+
+        try:
+            returncode = self.__process.wait(timeout=self.__startup_timeout)
+        except subprocess.TimeoutExpired:
+            returncode = None
+
+        if returncode:
+            error = self.__exit_error(returncode)
+            self.__release()
+            raise error
+
+        self.__thread = threading.Thread(
+            target=self.__run, name="fit-subprocess-capture", daemon=True
+        )
+        self.__thread.start()
+
+    def __run(self):
+        try:
+            for data, timestamp, linktype, wirelen in iter_pcap_records(
+                self.__process.stdout
+            ):
+                self.packets += 1
+                self.__prn(data, timestamp, linktype, wirelen)
+        except ValueError as e:
+            self.error = e
+
+    def __exit_error(self, returncode):
+        message = ""
+        if self.__stderr is not None:
+            self.__stderr.seek(0)
+            message = self.__stderr.read().decode("utf-8", "replace").strip()
+        message = message[-MAX_ERROR_MESSAGE:] or "no error output"
+        return RuntimeError(
+            f"{os.path.basename(self.__program)} exited with status "
+            f"{returncode}: {message}"
+        )
+
+    def __release(self):
+        self.__process.stdout.close()
+        self.__stderr.close()
+        self.__process = None
+        self.__stderr = None
+        self.__thread = None
+
+    def stop(self):
+        if self.__process is None:
+            return
+
+        # A capture program that is gone before it was asked to stop has
+        # failed; its exit status is only meaningful in that case.
+        returncode = self.__process.poll()
+        if returncode is None:
+            self.__process.terminate()
+            try:
+                self.__process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.__process.kill()
+                self.__process.wait()
+        elif returncode:
+            self.error = self.error or self.__exit_error(returncode)
+
+        self.__thread.join()
+        self.__release()
+
+        if self.error is not None:
+            raise self.error
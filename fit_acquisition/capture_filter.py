@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import ipaddress
+import socket
+from urllib.parse import urlparse
+
+DNS_PORT = 53
+
+
+def target_host(url):
+    return urlparse(url).hostname if url else None
+
+
+def resolve_host(host) -> list:
+    try:
+        addresses = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError):
+        return []
+    return sorted({address[4][0] for address in addresses})
+
+
+def split_hosts(hosts) -> list:
+    if not hosts:
+        return []
+    if isinstance(hosts, str):
+        hosts = hosts.replace(";", ",").split(",")
+    return [host.strip() for host in hosts if host and host.strip()]
+
+
+def host_primitive(host, resolver=resolve_host) -> list:
+    try:
+        network = ipaddress.ip_network(host, strict=False)
+    except ValueError:
+        return [f"host {address}" for address in resolver(host)]
+
+    if network.num_addresses == 1:
+        return [f"host {network.network_address}"]
+    return [f"net {network}"]
+
+
+def build_capture_filter(url, extra_hosts=(), include_dns=True, resolver=resolve_host):
+    primitives = []
+    for host in [target_host(url)] + split_hosts(extra_hosts):
+        if host:
+            for primitive in host_primitive(host, resolver):
+                if primitive not in primitives:
+                    primitives.append(primitive)
+
+    # Without a resolved target the filter would only keep DNS traffic, so the
+    # capture falls back to recording everything.
+    if not primitives:
+        return None
+
+    if include_dns:
+        primitives.append(f"port {DNS_PORT}")
+
+    return " or ".join(primitives)
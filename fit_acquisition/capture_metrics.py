@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import time
+
+DEFAULT_METRICS_INTERVAL = 1.0
+
+
+def format_bytes(size) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KB", "MB"):
+        size /= 1024
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} GB"
+
+
+class CaptureMetrics:
+    def __init__(self, writer, kernel_drops=None, clock=time.monotonic):
+        self.__writer = writer
+        self.__kernel_drops = kernel_drops
+        self.__clock = clock
+        self.__last_time = clock()
+        self.__last_packets = 0
+        self.__last_bytes = 0
+        self.__latest = self.__snapshot(0.0, 0.0)
+
+    @property
+    def latest(self):
+        return dict(self.__latest)
+
+    def __snapshot(self, packets_per_second, bytes_per_second):
+        return {
+            "packets_per_second": packets_per_second,
+            "bytes_per_second": bytes_per_second,
+            "queue_depth": self.__writer.queue_depth,
+            "packets_written": self.__writer.packets_written,
+            "bytes_written": self.__writer.bytes_written,
+            "dropped": self.__writer.dropped,
+            "kernel_drops": self.__kernel_drops() if self.__kernel_drops else None,
+        }
+
+    def sample(self):
+        now = self.__clock()
+        elapsed = now - self.__last_time
+        packets = self.__writer.packets_written
+        written = self.__writer.bytes_written
+
+        # Rates come from the writer side: what actually reached the file.
+        if elapsed > 0:
+            packets_per_second = (packets - self.__last_packets) / elapsed
+            bytes_per_second = (written - self.__last_bytes) / elapsed
+        else:
+            packets_per_second = bytes_per_second = 0.0
+
+        self.__last_time = now
+        self.__last_packets = packets
+        self.__last_bytes = written
+        self.__latest = self.__snapshot(packets_per_second, bytes_per_second)
+        return self.latest
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+DEFAULT_ALGORITHMS = ("md5", "sha1", "sha256")
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+BACKEND_BUFFERED = "buffered"
+BACKEND_MMAP = "mmap"
+BACKEND_FILE_DIGEST = "file_digest"
+BACKENDS = (BACKEND_BUFFERED, BACKEND_MMAP, BACKEND_FILE_DIGEST)
+DEFAULT_LARGE_FILE_THRESHOLD = 64 * 1024 * 1024
+
+ALGORITHM_LABELS = {
+    "md5": "MD5",
+    "sha1": "SHA-1",
+    "sha224": "SHA-224",
+    "sha256": "SHA-256",
+    "sha384": "SHA-384",
+    "sha512": "SHA-512",
+    "sha3_256": "SHA3-256",
+    "sha3_512": "SHA3-512",
+    "blake2b": "BLAKE2b",
+    "blake2s": "BLAKE2s",
+}
+
+
+def _check_algorithm(algorithm: str) -> str:
+    algorithm = algorithm.lower()
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    # SHAKE digests take their length as a hexdigest() argument, so they
+    # cannot be reported alongside fixed-length algorithms.
+    if hashlib.new(algorithm).digest_size == 0:
+        raise ValueError(f"Variable-length hash algorithm not supported: {algorithm}")
+    return algorithm
+
+
+def register_algorithm(algorithm: str, label: str | None = None):
+    algorithm = _check_algorithm(algorithm)
+    ALGORITHM_LABELS[algorithm] = label or algorithm.upper()
+
+
+def get_algorithm_label(algorithm: str) -> str:
+    return ALGORITHM_LABELS.get(algorithm, algorithm.upper())
+
+
+def normalize_algorithms(algorithms) -> tuple:
+    if not algorithms:
+        return DEFAULT_ALGORITHMS
+
+    normalized = []
+    for algorithm in algorithms:
+        algorithm = _check_algorithm(algorithm)
+        if algorithm not in normalized:
+            normalized.append(algorithm)
+
+    return tuple(normalized)
+
+
+class MultiDigest:
+    def __init__(self, algorithms=DEFAULT_ALGORITHMS):
+        self.__algorithms = normalize_algorithms(algorithms)
+        self.__digests = [hashlib.new(algorithm) for algorithm in self.__algorithms]
+
+    @property
+    def algorithms(self) -> tuple:
+        return self.__algorithms
+
+    def update(self, data):
+        for digest in self.__digests:
+            digest.update(data)
+
+    def hexdigests(self) -> dict:
+        return {
+            algorithm: digest.hexdigest()
+            for algorithm, digest in zip(self.__algorithms, self.__digests)
+        }
+
+
+def select_backend(
+    size: int,
+    large_file_backend=BACKEND_BUFFERED,
+    threshold=DEFAULT_LARGE_FILE_THRESHOLD,
+) -> str:
+    if large_file_backend not in BACKENDS:
+        raise ValueError(f"Unsupported hash backend: {large_file_backend}")
+    if size >= threshold:
+        return large_file_backend
+    return BACKEND_BUFFERED
+
+
+def _update_from_buffer(f, multi_digest, buffer_size):
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while size := f.readinto(buffer):
+        multi_digest.update(view[:size])
+
+
+def _update_from_mmap(f, multi_digest, buffer_size):
+    if os.fstat(f.fileno()).st_size == 0:
+        return
+
+    # Feed every digest window by window, so that each page is faulted in
+    # once instead of once per algorithm on files larger than the page cache.
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            for offset in range(0, len(view), buffer_size):
+                multi_digest.update(view[offset : offset + buffer_size])
+
+
+def hash_file(
+    filename,
+    algorithms=DEFAULT_ALGORITHMS,
+    buffer_size=DEFAULT_BUFFER_SIZE,
+    backend=BACKEND_BUFFERED,
+) -> dict:
+    multi_digest = MultiDigest(algorithms)
+
+    with open(filename, "rb", buffering=0) as f:
+        if backend == BACKEND_BUFFERED:
+            _update_from_buffer(f, multi_digest, buffer_size)
+        elif backend == BACKEND_MMAP:
+            _update_from_mmap(f, multi_digest, buffer_size)
+        elif backend == BACKEND_FILE_DIGEST:
+            # file_digest only calls update() on the object it is given.
+            hashlib.file_digest(f, cast(Any, lambda: multi_digest))
+        else:
+            raise ValueError(f"Unsupported hash backend: {backend}")
+
+    return multi_digest.hexdigests()
+
+
+def resolve_max_workers(max_workers, jobs: int) -> int:
+    if max_workers is None or max_workers == "auto":
+        max_workers = os.cpu_count() or 1
+    return max(1, min(int(max_workers), jobs))
+
+
+def hash_files(
+    filenames,
+    algorithms=DEFAULT_ALGORITHMS,
+    max_workers=1,
+    hasher=hash_file,
+) -> list:
+    filenames = list(filenames)
+    max_workers = resolve_max_workers(max_workers, len(filenames))
+
+    if max_workers == 1:
+        return [hasher(filename, algorithms) for filename in filenames]
+
+    # hashlib releases the GIL while digesting, so threads are enough here.
+    # Executor.map yields in submission order, keeping the report deterministic.
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="fit-hash"
+    ) as executor:
+        return list(
+            executor.map(lambda filename: hasher(filename, algorithms), filenames)
+        )
+
+
+def throughput_mb_s(total_bytes: int, elapsed: float) -> float:
+    if elapsed <= 0:
+        return 0.0
+    return total_bytes / (1024 * 1024) / elapsed
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import csv
+import json
+import os
+
+MANIFEST_FORMAT_JSONL = "jsonl"
+MANIFEST_FORMAT_CSV = "csv"
+MANIFEST_FORMATS = (MANIFEST_FORMAT_JSONL, MANIFEST_FORMAT_CSV)
+MANIFEST_BASENAME = "acquisition.hash"
+
+RECORD_FIELDS = ("path", "size", "mtime_ns", "inode")
+
+
+def manifest_filename(manifest_format=MANIFEST_FORMAT_JSONL) -> str:
+    if manifest_format not in MANIFEST_FORMATS:
+        raise ValueError(f"Unsupported manifest format: {manifest_format}")
+    return f"{MANIFEST_BASENAME}.{manifest_format}"
+
+
+def walk_files(directory, exclude=()) -> list:
+    exclude = set(exclude)
+    paths = []
+
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        relative_root = os.path.relpath(root, directory)
+        for file in sorted(files):
+            path = os.path.normpath(os.path.join(relative_root, file))
+            path = path.replace(os.sep, "/")
+            if path not in exclude:
+                paths.append(path)
+
+    return paths
+
+
+def build_record(path, file_stats, digests) -> dict:
+    return {
+        "path": path,
+        "size": file_stats.st_size,
+        "mtime_ns": file_stats.st_mtime_ns,
+        "inode": file_stats.st_ino,
+        "digests": dict(digests),
+    }
+
+
+def write_manifest(filename, records, manifest_format=MANIFEST_FORMAT_JSONL):
+    if manifest_format == MANIFEST_FORMAT_JSONL:
+        with open(filename, "w", encoding="utf-8", newline="\n") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, sort_keys=True))
+                f.write("\n")
+    elif manifest_format == MANIFEST_FORMAT_CSV:
+        algorithms = []
+        for record in records:
+            for algorithm in record["digests"]:
+                if algorithm not in algorithms:
+                    algorithms.append(algorithm)
+
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(RECORD_FIELDS) + algorithms)
+            for record in records:
+                writer.writerow(
+                    [record[field] for field in RECORD_FIELDS]
+                    + [record["digests"].get(algorithm, "") for algorithm in algorithms]
+                )
+    else:
+        raise ValueError(f"Unsupported manifest format: {manifest_format}")
+
+
+def load_manifest(filename) -> dict:
+    index = dict()
+
+    if str(filename).endswith(f".{MANIFEST_FORMAT_CSV}"):
+        with open(filename, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                record = {"path": row.pop("path")}
+                for field in RECORD_FIELDS[1:]:
+                    record[field] = int(row.pop(field))
+                record["digests"] = {key: value for key, value in row.items() if value}
+                index[record["path"]] = record
+    else:
+        with open(filename, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    index[record["path"]] = record
+
+    return index
+
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import io
+import os
+import threading
+
+from fit_acquisition.hash_engine import MultiDigest, normalize_algorithms
+
+
+class DigestRegistry:
+    def __init__(self, algorithms=None):
+        self.__records = dict()
+        self.__lock = threading.Lock()
+        self.__algorithms = normalize_algorithms(algorithms)
+
+    @property
+    def algorithms(self):
+        return self.__algorithms
+
+    @algorithms.setter
+    def algorithms(self, algorithms):
+        self.__algorithms = normalize_algorithms(algorithms)
+
+    def record(self, filename, digests):
+        filename = os.path.abspath(filename)
+        try:
+            file_stats = os.stat(filename)
+        except OSError:
+            return
+        with self.__lock:
+            self.__records[filename] = {
+                "size": file_stats.st_size,
+                "mtime_ns": file_stats.st_mtime_ns,
+                "digests": dict(digests),
+            }
+
+    def lookup(self, filename, algorithms):
+        filename = os.path.abspath(filename)
+        with self.__lock:
+            record = self.__records.get(filename)
+
+        if record is None:
+            return None
+
+        # A digest is only trusted while the file is exactly as it was when
+        # its writer closed it.
+        try:
+            file_stats = os.stat(filename)
+        except OSError:
+            return None
+
+        if (
+            file_stats.st_size != record["size"]
+            or file_stats.st_mtime_ns != record["mtime_ns"]
+            or any(algorithm not in record["digests"] for algorithm in algorithms)
+        ):
+            return None
+
+        return {algorithm: record["digests"][algorithm] for algorithm in algorithms}
+
+    def discard(self, filename):
+        with self.__lock:
+            self.__records.pop(os.path.abspath(filename), None)
+
+    def discard_directory(self, directory):
+        directory = os.path.join(os.path.abspath(directory), "")
+        with self.__lock:
+            for filename in [f for f in self.__records if f.startswith(directory)]:
+                self.__records.pop(filename)
+
+    def clear(self):
+        with self.__lock:
+            self.__records = dict()
+
+
+class HashingFile(io.RawIOBase):
+    def __init__(self, filename, algorithms=None, registry=None):
+        super().__init__()
+        self.__registry = registry
+        self.__filename = filename
+        if algorithms is None and registry is not None:
+            algorithms = registry.algorithms
+        self.__digest = MultiDigest(algorithms)
+        self.__position = 0
+        self.__file = open(filename, "wb", buffering=0)
+
+    @property
+    def name(self):
+        return self.__filename
+
+    def writable(self):
+        return True
+
+    def fileno(self):
+        return self.__file.fileno()
+
+    def tell(self):
+        return self.__position
+
+    def write(self, data):
+        written = self.__file.write(data)
+        if written:
+            self.__digest.update(memoryview(data).cast("B")[:written])
+            self.__position += written
+        return written
+
+    def hexdigests(self):
+        return self.__digest.hexdigests()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            super().close()
+        finally:
+            self.__file.close()
+            if self.__registry is not None:
+                self.__registry.record(self.__filename, self.__digest.hexdigests())
+
+
+def open_hashed(filename, mode="wb", encoding=None, algorithms=None, registry=None):
+    if mode not in ("w", "wb"):
+        raise ValueError(f"Unsupported mode for a hashed file: {mode}")
+
+    # Nobody would read the digests back, so the file is written as is.
+    if registry is None and algorithms is None:
+        return open(filename, mode, encoding=encoding)
+
+    buffered = io.BufferedWriter(HashingFile(filename, algorithms, registry))
+    if mode == "wb":
+        return buffered
+
+    return io.TextIOWrapper(buffered, encoding=encoding)
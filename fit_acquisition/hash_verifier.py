@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import json
+import os
+from fnmatch import fnmatch
+from typing import Any
+
+from fit_acquisition.hash_engine import ALGORITHM_LABELS, hash_file, hash_files
+from fit_acquisition.hash_manifest import (
+    MANIFEST_BASENAME,
+    MANIFEST_FORMATS,
+    load_manifest,
+    manifest_filename,
+    walk_files,
+)
+
+DEFAULT_EXCLUDE = (
+    MANIFEST_BASENAME,
+    "acquisition.log",
+    "sslkey.log",
+) + tuple(manifest_filename(manifest_format) for manifest_format in MANIFEST_FORMATS)
+
+# Written by the report, timestamp and PEC steps after the manifest, so they
+# are never listed in it.
+POST_HASH_OUTPUTS = (
+    "acquisition_report.pdf",
+    "timestamp.tsr",
+    "tsa.crt",
+    "*.eml",
+)
+
+
+def is_post_hash_output(path, patterns=POST_HASH_OUTPUTS) -> bool:
+    return "/" not in path and any(fnmatch(path, pattern) for pattern in patterns)
+
+
+def load_legacy_hash(filename) -> dict:
+    algorithms = {label: algorithm for algorithm, label in ALGORITHM_LABELS.items()}
+    index = dict()
+    record: dict[str, Any] | None = None
+
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            key, separator, value = line.rstrip("\n").partition(": ")
+            if not separator:
+                continue
+            if key == "Name":
+                record = {"path": value, "digests": dict()}
+                index[value] = record
+            elif record is None:
+                continue
+            elif key == "Size":
+                record["size"] = int(value)
+            else:
+                record["digests"][algorithms.get(key, key.lower())] = value
+
+    return index
+
+
+def find_manifest(directory):
+    for manifest_format in MANIFEST_FORMATS:
+        filename = os.path.join(directory, manifest_filename(manifest_format))
+        if os.path.isfile(filename):
+            return filename
+
+    filename = os.path.join(directory, MANIFEST_BASENAME)
+    if os.path.isfile(filename):
+        return filename
+
+    return None
+
+
+def load_any_manifest(filename) -> dict:
+    if os.path.basename(filename) == MANIFEST_BASENAME:
+        return load_legacy_hash(filename)
+    return load_manifest(filename)
+
+
+class VerificationCache:
+    def __init__(self, filename=None):
+        self.__filename = filename
+        self.__records = dict()
+
+        if filename and os.path.isfile(filename):
+            with open(filename, "r", encoding="utf-8") as f:
+                self.__records = json.load(f)
+
+    def is_fresh(self, filename, file_stats, digests) -> bool:
+        record = self.__records.get(os.path.abspath(filename))
+        return (
+            record is not None
+            and record["size"] == file_stats.st_size
+            and record["mtime_ns"] == file_stats.st_mtime_ns
+            and record["inode"] == file_stats.st_ino
+            and record["digests"] == digests
+        )
+
+    def update(self, filename, file_stats, digests):
+        self.__records[os.path.abspath(filename)] = {
+            "size": file_stats.st_size,
+            "mtime_ns": file_stats.st_mtime_ns,
+            "inode": file_stats.st_ino,
+            "digests": dict(digests),
+        }
+
+    def discard(self, filename):
+        self.__records.pop(os.path.abspath(filename), None)
+
+    def save(self):
+        if not self.__filename:
+            return
+
+        temporary_filename = self.__filename + ".tmp"
+        with open(temporary_filename, "w", encoding="utf-8") as f:
+            json.dump(self.__records, f)
+        os.replace(temporary_filename, self.__filename)
+
+
+class VerificationReport:
+    def __init__(self, directory, manifest):
+        self.directory = directory
+        self.manifest = manifest
+        self.verified = list()
+        self.skipped = list()
+        self.modified = list()
+        self.missing = list()
+        self.added = list()
+
+    @property
+    def is_valid(self) -> bool:
+        return not (self.modified or self.missing or self.added)
+
+    def summary(self) -> str:
+        return (
+            f"verified={len(self.verified)} skipped={len(self.skipped)} "
+            f"modified={len(self.modified)} missing={len(self.missing)} "
+            f"added={len(self.added)}"
+        )
+
+
+def verify_directory(
+    directory,
+    manifest=None,
+    cache=None,
+    full=False,
+    max_workers=1,
+    exclude=DEFAULT_EXCLUDE,
+    post_hash_outputs=POST_HASH_OUTPUTS,
+    hasher=hash_file,
+) -> VerificationReport:
+    manifest = manifest or find_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(f"No hash manifest found in {directory}")
+
+    cache = cache or VerificationCache()
+    index = load_any_manifest(manifest)
+    report = VerificationReport(directory, manifest)
+
+    exclude = set(exclude) | {os.path.relpath(manifest, directory)}
+    # A legacy acquisition.hash only lists the top level files.
+    if os.path.basename(manifest) == MANIFEST_BASENAME:
+        current = [
+            f.name for f in os.scandir(directory) if f.is_file() and f.name not in exclude
+        ]
+    else:
+        current = walk_files(directory, exclude)
+    report.added = sorted(
+        path
+        for path in set(current) - set(index)
+        if not is_post_hash_output(path, post_hash_outputs)
+    )
+
+    pending = []
+    for path, record in index.items():
+        filename = os.path.join(directory, path)
+        try:
+            file_stats = os.stat(filename)
+        except FileNotFoundError:
+            report.missing.append(path)
+            cache.discard(filename)
+            continue
+
+        if "size" in record and file_stats.st_size != record["size"]:
+            report.modified.append(path)
+            cache.discard(filename)
+        elif not full and cache.is_fresh(filename, file_stats, record["digests"]):
+            report.skipped.append(path)
+        else:
+            pending.append((path, filename, file_stats, record["digests"]))
+
+    # Only files that changed since the last successful check are read again.
+    results = hash_files(
+        [filename for _, filename, _, _ in pending],
+        sorted({algorithm for *_, digests in pending for algorithm in digests}),
+        max_workers=max_workers,
+        hasher=hasher,
+    )
+
+    for (path, filename, file_stats, digests), computed in zip(pending, results):
+        if all(computed[algorithm] == digest for algorithm, digest in digests.items()):
+            report.verified.append(path)
+            cache.update(filename, file_stats, digests)
+        else:
+            report.modified.append(path)
+            cache.discard(filename)
+
+    return report
+
+
+def verify_directories(
+    directories,
+    cache_filename=None,
+    full=False,
+    max_workers=1,
+    exclude=DEFAULT_EXCLUDE,
+):
+    cache = VerificationCache(cache_filename)
+    try:
+        for directory in directories:
+            try:
+                yield directory, verify_directory(
+                    directory,
+                    cache=cache,
+                    full=full,
+                    max_workers=max_workers,
+                    exclude=exclude,
+                )
+            except (OSError, ValueError) as e:
+                yield directory, e
+    finally:
+        cache.save()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import threading
+from importlib import import_module
+
+
+class LazyImport:
+    def __init__(self, module, attribute=None):
+        object.__setattr__(self, "_LazyImport__module", module)
+        object.__setattr__(self, "_LazyImport__attribute", attribute)
+        object.__setattr__(self, "_LazyImport__target", None)
+        object.__setattr__(self, "_LazyImport__lock", threading.Lock())
+
+    def __resolve(self):
+        if self.__target is None:
+            with self.__lock:
+                if self.__target is None:
+                    target = import_module(self.__module)
+                    if self.__attribute is not None:
+                        target = getattr(target, self.__attribute)
+                    object.__setattr__(self, "_LazyImport__target", target)
+        return self.__target
+
+    def __getattr__(self, name):
+        return getattr(self.__resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.__resolve(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.__resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.__resolve()(*args, **kwargs)
+
+    def __dir__(self):
+        return dir(self.__resolve())
+
+    def __repr__(self):
+        name = self.__module
+        if self.__attribute is not None:
+            name = f"{name}.{self.__attribute}"
+        state = "loaded" if self.__target is not None else "not loaded"
+        return f"<LazyImport {name} ({state})>"
+
+
+def is_loaded(lazy):
+    return lazy._LazyImport__target is not None
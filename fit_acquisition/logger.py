@@ -15,7 +15,7 @@ from fit_configurations.controller.tabs.network.network_tool import (
     NetworkToolController,
 )
 
-from fit_acquisition.logger_names import LoggerName
+from fit_acquisition.logger_names import LoggerName, scoped_logger_name
 
 # Produce RFC 3339 timestamps
 logging.Formatter.formatTime = (
@@ -173,3 +173,44 @@ class LogConfigTools:
                 self.config["handlers"].pop("fnslookup")
             if "nslookup" in self.config["loggers"]:
                 self.config["loggers"].pop("nslookup")
+
+    # dictConfig() closes every handler in the process, so acquisitions
+    # running side by side get their own copy of the configured loggers
+    # under a scope prefix instead.
+    def configure_scope(self, scope):
+        formatters = {
+            name: logging.Formatter(formatter.get("format"))
+            for name, formatter in self.config["formatters"].items()
+        }
+        handlers = dict()
+
+        for name, logger_config in self.config["loggers"].items():
+            logger = logging.getLogger(scoped_logger_name(scope, name))
+            self.__remove_handlers(logger)
+
+            for handler_name in logger_config.get("handlers", []):
+                if handler_name not in handlers:
+                    handler_config = self.config["handlers"][handler_name]
+                    if "filename" in handler_config:
+                        handler = logging.FileHandler(
+                            handler_config["filename"],
+                            mode=handler_config.get("mode", "a"),
+                        )
+                    else:
+                        handler = logging.NullHandler()
+                    if "formatter" in handler_config:
+                        handler.setFormatter(formatters[handler_config["formatter"]])
+                    handlers[handler_name] = handler
+                logger.addHandler(handlers[handler_name])
+
+            logger.setLevel(logger_config.get("level", logging.NOTSET))
+            logger.propagate = False
+
+    def release_scope(self, scope):
+        for name in self.config["loggers"]:
+            self.__remove_handlers(logging.getLogger(scoped_logger_name(scope, name)))
+
+    def __remove_handlers(self, logger):
+        for handler in logger.handlers.copy():
+            logger.removeHandler(handler)
+            handler.close()
@@ -17,3 +17,7 @@ class LoggerName(str, Enum):
     SCRAPER_VIDEO = 'scraper.video'
     SCRAPER_ENTIRE_WEBSITE = 'scraper.entire_website'
     HASHREPORT = 'hashreport'
+
+
+def scoped_logger_name(scope, name):
+    return f"{scope}.{name}" if scope else name
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import os
+import queue
+import struct
+import threading
+import time
+
+DLT_EN10MB = 1
+DEFAULT_SNAPLEN = 262144
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+PCAP_MAGIC = 0xA1B2C3D4
+PCAP_MAGIC_NANOSECONDS = 0xA1B23C4D
+
+CAPTURE_FORMAT_PCAP = "pcap"
+CAPTURE_FORMAT_PCAPNG = "pcapng"
+CAPTURE_FORMATS = (CAPTURE_FORMAT_PCAP, CAPTURE_FORMAT_PCAPNG)
+
+PCAPNG_SHB = 0x0A0D0D0A
+PCAPNG_IDB = 0x00000001
+PCAPNG_ISB = 0x00000005
+PCAPNG_EPB = 0x00000006
+PCAPNG_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+
+OPT_COMMENT = 1
+SHB_HARDWARE = 2
+SHB_OS = 3
+SHB_USERAPPL = 4
+IF_TSRESOL = 9
+ISB_STARTTIME = 2
+ISB_ENDTIME = 3
+ISB_IFRECV = 4
+ISB_IFDROP = 5
+ISB_OSDROP = 7
+ISB_USRDELIV = 8
+
+
+class PcapFileWriter:
+    def __init__(self, fileobj, linktype=None, snaplen=DEFAULT_SNAPLEN):
+        self.__fileobj = fileobj
+        self.__linktype = linktype
+        self.__snaplen = snaplen
+        self.__header_written = False
+
+    @property
+    def linktype(self):
+        return self.__linktype
+
+    def __write_header(self, linktype):
+        self.__linktype = self.__linktype or linktype or DLT_EN10MB
+        self.__fileobj.write(
+            struct.pack(
+                "=IHHiIII", PCAP_MAGIC, 2, 4, 0, 0, self.__snaplen, self.__linktype
+            )
+        )
+        self.__header_written = True
+
+    def write_packet(self, data, timestamp, linktype=None, wirelen=None):
+        if not self.__header_written:
+            self.__write_header(linktype)
+
+        caplen = min(len(data), self.__snaplen)
+        seconds = int(timestamp)
+        microseconds = int(round((timestamp - seconds) * 1000000))
+        if microseconds >= 1000000:
+            seconds += 1
+            microseconds -= 1000000
+
+        self.__fileobj.write(
+            struct.pack(
+                "=IIII",
+                seconds,
+                microseconds,
+                caplen,
+                wirelen if wirelen is not None else len(data),
+            )
+        )
+        self.__fileobj.write(data[:caplen])
+        return 16 + caplen
+
+    def flush(self):
+        self.__fileobj.flush()
+
+    def close(self):
+        # An empty capture is still a valid pcap file.
+        if not self.__header_written:
+            self.__write_header(None)
+        self.__fileobj.close()
+
+
+def _pcapng_option(code, value):
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    padding = b"\x00" * (-len(value) % 4)
+    return struct.pack("=HH", code, len(value)) + value + padding
+
+
+def _pcapng_options(options):
+    if not options:
+        return b""
+    return b"".join(_pcapng_option(code, value) for code, value in options) + (
+        struct.pack("=HH", 0, 0)
+    )
+
+
+def _pcapng_block(block_type, body):
+    length = 12 + len(body)
+    return struct.pack("=II", block_type, length) + body + struct.pack("=I", length)
+
+
+def _pcapng_timestamp(timestamp):
+    microseconds = int(round(timestamp * 1000000))
+    return microseconds >> 32, microseconds & 0xFFFFFFFF
+
+
+class PcapngFileWriter:
+    def __init__(
+        self,
+        fileobj,
+        snaplen=DEFAULT_SNAPLEN,
+        comments=(),
+        application=None,
+        statistics=None,
+    ):
+        self.__fileobj = fileobj
+        self.__snaplen = snaplen
+        self.__statistics = statistics
+        self.__interfaces = dict()
+        self.__first_timestamp = None
+        self.__last_timestamp = None
+
+        options = [(OPT_COMMENT, comment) for comment in comments if comment]
+        if application:
+            options.append((SHB_USERAPPL, application))
+        self.__fileobj.write(
+            _pcapng_block(
+                PCAPNG_SHB,
+                struct.pack("=IHHq", PCAPNG_BYTE_ORDER_MAGIC, 1, 0, -1)
+                + _pcapng_options(options),
+            )
+        )
+
+    # pcapng can mix link types in one file: every link type seen gets its
+    # own interface description.
+    def __interface_id(self, linktype):
+        linktype = linktype or DLT_EN10MB
+        if linktype not in self.__interfaces:
+            self.__interfaces[linktype] = len(self.__interfaces)
+            self.__fileobj.write(
+                _pcapng_block(
+                    PCAPNG_IDB,
+                    struct.pack("=HHI", linktype, 0, self.__snaplen)
+                    + _pcapng_options([(IF_TSRESOL, b"\x06")]),
+                )
+            )
+        return self.__interfaces[linktype]
+
+    def write_packet(self, data, timestamp, linktype=None, wirelen=None):
+        interface_id = self.__interface_id(linktype)
+        caplen = min(len(data), self.__snaplen)
+
+        if self.__first_timestamp is None:
+            self.__first_timestamp = timestamp
+        self.__last_timestamp = timestamp
+
+        block = _pcapng_block(
+            PCAPNG_EPB,
+            struct.pack(
+                "=IIIII",
+                interface_id,
+                *_pcapng_timestamp(timestamp),
+                caplen,
+                wirelen if wirelen is not None else len(data),
+            )
+            + data[:caplen]
+            + b"\x00" * (-caplen % 4),
+        )
+        self.__fileobj.write(block)
+        return len(block)
+
+    def __write_statistics(self):
+        received, dropped, kernel_drops = self.__statistics()
+        now = time.time()
+        first = self.__first_timestamp if self.__first_timestamp is not None else now
+        last = self.__last_timestamp if self.__last_timestamp is not None else now
+
+        # Counters cover the whole capture up to the moment this file closes.
+        # Kernel drops never reached the capture, so they count as received
+        # by the interface; drops from the write queue were lost by fit
+        # itself. A backend that cannot report kernel drops leaves them out.
+        options = [
+            (ISB_STARTTIME, struct.pack("=II", *_pcapng_timestamp(first))),
+            (ISB_ENDTIME, struct.pack("=II", *_pcapng_timestamp(last))),
+            (ISB_IFRECV, struct.pack("=Q", received + (kernel_drops or 0))),
+        ]
+        if kernel_drops is not None:
+            options.append((ISB_IFDROP, struct.pack("=Q", kernel_drops)))
+        options += [
+            (ISB_OSDROP, struct.pack("=Q", dropped)),
+            (ISB_USRDELIV, struct.pack("=Q", received - dropped)),
+            (
+                OPT_COMMENT,
+                f"received={received} dropped={dropped} kernel_drops={kernel_drops}",
+            ),
+        ]
+        options = _pcapng_options(options)
+        for interface_id in self.__interfaces.values():
+            self.__fileobj.write(
+                _pcapng_block(
+                    PCAPNG_ISB,
+                    struct.pack("=III", interface_id, *_pcapng_timestamp(now))
+                    + options,
+                )
+            )
+
+    def flush(self):
+        self.__fileobj.flush()
+
+    def close(self):
+        # An empty capture still describes one interface.
+        if not self.__interfaces:
+            self.__interface_id(None)
+        if self.__statistics is not None:
+            self.__write_statistics()
+        self.__fileobj.close()
+
+
+def _read_exactly(fileobj, size):
+    data = b""
+    while len(data) < size:
+        chunk = fileobj.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def iter_pcap_records(fileobj):
+    header = _read_exactly(fileobj, 24)
+    if header is None:
+        return
+
+    for byte_order in ("<", ">"):
+        (magic,) = struct.unpack(byte_order + "I", header[:4])
+        if magic in (PCAP_MAGIC, PCAP_MAGIC_NANOSECONDS):
+            break
+    else:
+        raise ValueError("Not a pcap stream")
+
+    resolution = 1000000000 if magic == PCAP_MAGIC_NANOSECONDS else 1000000
+    (linktype,) = struct.unpack(byte_order + "I", header[20:24])
+
+    # A truncated last record is what an interrupted writer leaves behind.
+    while (record := _read_exactly(fileobj, 16)) is not None:
+        seconds, fraction, caplen, wirelen = struct.unpack(byte_order + "IIII", record)
+        data = _read_exactly(fileobj, caplen)
+        if data is None:
+            return
+        yield data, seconds + fraction / resolution, linktype, wirelen
+
+
+def segment_filename(filename, index) -> str:
+    root, extension = os.path.splitext(filename)
+    return f"{root}_{index:05d}{extension}"
+
+
+class SegmentedPacketWriter:
+    def __init__(
+        self,
+        filename,
+        open_segment,
+        max_bytes=0,
+        max_seconds=0,
+        keep=0,
+        on_segment_removed=None,
+    ):
+        self.__filename = filename
+        self.__open_segment = open_segment
+        self.__max_bytes = max_bytes
+        self.__max_seconds = max_seconds
+        self.__keep = keep
+        self.__on_segment_removed = on_segment_removed
+
+        self.__index = 0
+        self.__writer = None
+        self.__segment_bytes = 0
+        self.__segment_start = None
+        self.segments = list()
+
+    def __next_segment(self):
+        self.__close_segment()
+        self.__index += 1
+        filename = segment_filename(self.__filename, self.__index)
+        self.__writer = self.__open_segment(filename)
+        self.__segment_bytes = 0
+        self.__segment_start = None
+        self.segments.append(filename)
+
+        # Ring buffer mode: only the newest segments are kept on disk.
+        while self.__keep and len(self.segments) > self.__keep:
+            filename = self.segments.pop(0)
+            os.remove(filename)
+            if self.__on_segment_removed is not None:
+                self.__on_segment_removed(filename)
+
+    def __close_segment(self):
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+
+    def __must_rotate(self, size, timestamp):
+        if self.__writer is None:
+            return True
+        if self.__segment_start is None:
+            return False
+        if self.__max_bytes and self.__segment_bytes + size > self.__max_bytes:
+            return True
+        return bool(
+            self.__max_seconds and timestamp - self.__segment_start >= self.__max_seconds
+        )
+
+    def write_packet(self, data, timestamp, linktype=None, wirelen=None):
+        if self.__must_rotate(16 + len(data), timestamp):
+            self.__next_segment()
+
+        if self.__segment_start is None:
+            self.__segment_start = timestamp
+
+        written = self.__writer.write_packet(data, timestamp, linktype, wirelen)
+        self.__segment_bytes += written
+        return written
+
+    def flush(self):
+        if self.__writer is not None:
+            self.__writer.flush()
+
+    def close(self):
+        if self.__writer is None:
+            self.__next_segment()
+        self.__close_segment()
+
+
+class StreamingPacketWriter:
+    def __init__(
+        self,
+        writer_factory,
+        max_queue=DEFAULT_QUEUE_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.__writer_factory = writer_factory
+        self.__queue = queue.Queue(maxsize=max_queue)
+        self.__flush_interval = flush_interval
+        self.__thread = None
+        self.__error = None
+        self.__lock = threading.Lock()
+
+        self.packets_written = 0
+        self.bytes_written = 0
+        self.dropped = 0
+
+    @property
+    def received(self):
+        return self.packets_written + self.dropped + self.queue_depth
+
+    def statistics(self):
+        return self.received, self.dropped
+
+    @property
+    def queue_depth(self):
+        return self.__queue.qsize()
+
+    @property
+    def error(self):
+        return self.__error
+
+    def start(self):
+        writer = self.__writer_factory()
+        self.__thread = threading.Thread(
+            target=self.__run, args=(writer,), name="fit-pcap-writer", daemon=True
+        )
+        self.__thread.start()
+
+    def put(self, data, timestamp, linktype=None, wirelen=None):
+        # Never block the capture thread: a full queue means the disk cannot
+        # keep up, and the loss is counted instead of growing memory.
+        try:
+            self.__queue.put_nowait((data, timestamp, linktype, wirelen))
+            return True
+        except queue.Full:
+            with self.__lock:
+                self.dropped += 1
+            return False
+
+    def close(self):
+        if self.__thread is None:
+            return
+        self.__queue.put(None)
+        self.__thread.join()
+        self.__thread = None
+
+        if self.__error is not None:
+            raise self.__error
+
+    def __run(self, writer):
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    item = self.__queue.get(timeout=self.__flush_interval)
+                except queue.Empty:
+                    item = False
+
+                if item is None:
+                    break
+
+                if item:
+                    self.bytes_written += writer.write_packet(*item)
+                    self.packets_written += 1
+
+                # Periodic flushes keep a usable partial capture on disk if
+                # the process dies before stop().
+                if time.monotonic() - last_flush >= self.__flush_interval:
+                    writer.flush()
+                    last_flush = time.monotonic()
+        except Exception as e:
+            self.__error = e
+            self.__drain()
+        finally:
+            try:
+                writer.close()
+            except Exception as e:
+                self.__error = self.__error or e
+
+    def __drain(self):
+        while True:
+            try:
+                if self.__queue.get_nowait() is None:
+                    return
+            except queue.Empty:
+                time.sleep(self.__flush_interval / 10)
@@ -9,34 +9,53 @@
 
 
 import os
+import time
 
+from fit_common.core import debug, get_context
 from PySide6.QtCore import QObject, Signal
 
 from fit_acquisition.class_names import class_names
-from fit_acquisition.tasks.tasks_handler import TasksHandler
+from fit_acquisition.task_graph import TaskGraph, TaskNode
+
+# Each post acquisition task declares what it needs and what it leaves in the
+# acquisition directory; independent tasks run at the same time.
+POST_ACQUISITION_NODES = (
+    TaskNode(class_names.SAVE_CASE_INFO, provides=("case_info",)),
+    TaskNode(class_names.ZIP_AND_REMOVE_FOLDER, provides=("archives",)),
+    TaskNode(
+        class_names.HASH, requires=("case_info", "archives"), provides=("hash",)
+    ),
+    TaskNode(class_names.REPORT, requires=("hash",), provides=("report",)),
+    TaskNode(class_names.TIMESTAMP, requires=("report",), provides=("timestamp",)),
+    TaskNode(
+        class_names.PEC_AND_DOWNLOAD_EML,
+        requires=("report", "timestamp"),
+        provides=("pec",),
+    ),
+)
 
 
 class PostAcquisition(QObject):
     finished = Signal()
 
-    def __init__(self):
-        self.task_handler = TasksHandler()
+    def __init__(self, task_handler, nodes=POST_ACQUISITION_NODES):
         super().__init__()
+        self.task_handler = task_handler
+        self.graph = TaskGraph(nodes)
+        self.durations = dict()
+        self.__started = dict()
+        self.__completed = set()
 
     def start_post_acquisition_sequence(self, increment, options):
         self.options = options
         self.increment = increment
-        self.__save_case_info()
-
-    def __save_case_info(self):
-        task = self.task_handler.get_task(class_names.SAVE_CASE_INFO)
-        if task:
-            task.finished.connect(self.__zip_and_remove)
-            task.options = self.options
-            task.increment = self.increment
-            task.start()
+        self.durations = dict()
+        self.__started = dict()
+        self.__completed = set()
+        self.__set_content_options()
+        self.__start_ready_tasks()
 
-    def __zip_and_remove(self):
+    def __set_content_options(self):
         if (
             self.options.get("type") == "web"
             or self.options.get("type") == "entire_website"
@@ -55,56 +74,45 @@ class PostAcquisition(QObject):
         elif self.options.get("type") == "video":
             self.options["acquisition_content_directory"] = self.options.get("url_dir")
 
-        task = self.task_handler.get_task(class_names.ZIP_AND_REMOVE_FOLDER)
-        if task:
-            task.finished.connect(self.__calculate_acquisition_file_hash)
-            task.options = self.options
-            task.increment = self.increment
-            task.start()
-
-    def __calculate_acquisition_file_hash(self):
-        task = self.task_handler.get_task(class_names.HASH)
-        if task:
-            task.finished.connect(self.__generate_pdf_report)
-            task.options = self.options
-            task.increment = self.increment
-            task.start()
-
-    def __generate_pdf_report(self):
-        task = self.task_handler.get_task(class_names.REPORT)
-        if (
-            self.options.get("type") == "web"
-            or self.options.get("type") == "entire_website"
+        if self.options.get("type") in (
+            "web",
+            "entire_website",
+            "email",
+            "instagram",
+            "video",
         ):
             self.options["pdf_filename"] = "acquisition_report.pdf"
-        elif self.options.get("type") == "email":
-            self.options["pdf_filename"] = "acquisition_report.pdf"
-        elif self.options.get("type") == "instagram":
-            self.options["pdf_filename"] = "acquisition_report.pdf"
-        elif self.options.get("type") == "video":
-            self.options["pdf_filename"] = "acquisition_report.pdf"
-        if task:
-            task.finished.connect(self.__generate_timestamp_report)
-            task.options = self.options
-            task.increment = self.increment
-            task.start()
 
-    def __generate_timestamp_report(self):
-        task = self.task_handler.get_task(class_names.TIMESTAMP)
-        if task:
-            task.finished.connect(self.__send_pec_and_download_eml)
-            task.options = self.options
-            task.increment = self.increment
-            task.start()
-        else:
-            task.finished.connect(self.finished.emit)
+    def __start_ready_tasks(self):
+        ready = self.graph.ready(self.__completed, self.__started)
+
+        for name in ready:
+            self.__started[name] = time.monotonic()
 
-    def __send_pec_and_download_eml(self):
-        task = self.task_handler.get_task(class_names.PEC_AND_DOWNLOAD_EML)
-        if task:
-            task.finished.connect(self.finished.emit)
+        for name in ready:
+            task = self.task_handler.get_task(name)
+            if task is None:
+                self.__task_finished(name)
+                continue
+            task.finished.connect(lambda name=name: self.__task_finished(name))
             task.options = self.options
             task.increment = self.increment
             task.start()
-        else:
-            self.finished.emit()
+
+    def __task_finished(self, name):
+        if name in self.__completed:
+            return
+
+        self.durations[name] = time.monotonic() - self.__started[name]
+        self.__completed.add(name)
+
+        if len(self.__completed) < len(self.graph.names):
+            self.__start_ready_tasks()
+            return
+
+        path, total = self.graph.critical_path(self.durations)
+        debug(
+            f"ℹ️ PostAcquisition: critical path {' -> '.join(path)} ({total:.3f}s)",
+            context=get_context(self),
+        )
+        self.finished.emit()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+
+class TaskNode:
+    def __init__(self, name, requires=(), provides=()):
+        self.name = name
+        self.requires = tuple(requires)
+        self.provides = tuple(provides)
+
+    def __repr__(self):
+        return f"TaskNode({self.name!r}, requires={self.requires}, provides={self.provides})"
+
+
+class TaskGraph:
+    def __init__(self, nodes):
+        self.__nodes = dict()
+        producers = dict()
+
+        for node in nodes:
+            if node.name in self.__nodes:
+                raise ValueError(f"Duplicate task in graph: {node.name}")
+            self.__nodes[node.name] = node
+            for artifact in node.provides:
+                if artifact in producers:
+                    raise ValueError(f"Artifact provided twice: {artifact}")
+                producers[artifact] = node.name
+
+        self.__dependencies = dict()
+        for node in self.__nodes.values():
+            missing = [a for a in node.requires if a not in producers]
+            if missing:
+                raise ValueError(
+                    f"{node.name} requires artifacts nobody provides: {missing}"
+                )
+            self.__dependencies[node.name] = {producers[a] for a in node.requires}
+
+        self.__order = self.__topological_order()
+
+    @property
+    def names(self):
+        return list(self.__nodes)
+
+    @property
+    def order(self):
+        return list(self.__order)
+
+    def dependencies(self, name):
+        return set(self.__dependencies[name])
+
+    def __topological_order(self):
+        order = []
+        pending = dict(self.__dependencies)
+        while pending:
+            ready = [
+                name
+                for name, dependencies in pending.items()
+                if dependencies.issubset(order)
+            ]
+            if not ready:
+                raise ValueError(f"Cycle between tasks: {sorted(pending)}")
+            for name in ready:
+                order.append(name)
+                pending.pop(name)
+        return order
+
+    def ready(self, completed, started=()):
+        completed = set(completed)
+        started = set(started)
+        return [
+            name
+            for name in self.__nodes
+            if name not in completed
+            and name not in started
+            and self.__dependencies[name].issubset(completed)
+        ]
+
+    def critical_path(self, durations):
+        finish = dict()
+        previous = dict()
+
+        for name in self.__order:
+            dependencies = self.__dependencies[name]
+            slowest = max(dependencies, key=lambda d: finish[d], default=None)
+            start = finish[slowest] if slowest is not None else 0.0
+            finish[name] = start + durations.get(name, 0.0)
+            previous[name] = slowest
+
+        if not finish:
+            return [], 0.0
+
+        name = max(self.__order, key=lambda n: finish[n])
+        total = finish[name]
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+
+        return list(reversed(path)), total
@@ -9,27 +9,97 @@
 
 import logging
 import os
+import threading
+from importlib.metadata import PackageNotFoundError, version
 
-import scapy.all as scapy
 from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
 from fit_configurations.controller.tabs.packet_capture.packet_capture import (
     PacketCaptureController,
 )
-from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtCore import Signal
 
+from fit_acquisition.capture_backend import (
+    CAPTURE_BACKEND_RAW,
+    CAPTURE_BACKEND_SCAPY,
+    CAPTURE_BACKEND_SUBPROCESS,
+    RawSocketSniffer,
+    SubprocessSniffer,
+    find_capture_program,
+)
+from fit_acquisition.capture_filter import build_capture_filter
+from fit_acquisition.capture_metrics import (
+    DEFAULT_METRICS_INTERVAL,
+    CaptureMetrics,
+    format_bytes,
+)
+from fit_acquisition.hash_registry import open_hashed
+from fit_acquisition.lazy_import import LazyImport
+from fit_acquisition.pcap_writer import (
+    CAPTURE_FORMAT_PCAPNG,
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_SNAPLEN,
+    PcapFileWriter,
+    PcapngFileWriter,
+    SegmentedPacketWriter,
+    StreamingPacketWriter,
+)
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
 
+# scapy.all takes about a second to import; it is loaded when the capture
+# starts, not when the task is discovered.
+scapy = LazyImport("scapy.all")
+
 logging.getLogger("scapy").setLevel(logging.CRITICAL)
 
 
+def tool_version():
+    try:
+        return version("fit-acquisition")
+    except PackageNotFoundError:
+        return "unknown"
+
+
 class PacketCaptureWorker(TaskWorker):
+    metrics_updated = Signal(object)
 
     def __init__(self):
         super().__init__()
         self.output_file = None
         self.sniffer = None
+        self.writer = None
+        self.__kernel_drops = None
+        self.__metrics = None
+        self.__metrics_thread = None
+        self.__metrics_stop = threading.Event()
+
+    def get_metrics(self):
+        if self.__metrics is None:
+            return dict()
+        return self.__metrics.latest
+
+    def __publish_metrics(self, interval):
+        while not self.__metrics_stop.wait(interval):
+            self.metrics_updated.emit(self.__metrics.sample())
+
+    def __start_metrics(self):
+        self.__metrics = CaptureMetrics(self.writer, self.__kernel_drops)
+        self.__metrics_stop.clear()
+        self.__metrics_thread = threading.Thread(
+            target=self.__publish_metrics,
+            args=(self.options.get("metrics_interval", DEFAULT_METRICS_INTERVAL),),
+            name="fit-capture-metrics",
+            daemon=True,
+        )
+        self.__metrics_thread.start()
+
+    def __stop_metrics(self):
+        self.__metrics_stop.set()
+        if self.__metrics_thread is not None:
+            self.__metrics_thread.join()
+            self.__metrics_thread = None
 
     @TaskWorker.options.getter
     def options(self):
@@ -42,11 +112,127 @@ class PacketCaptureWorker(TaskWorker):
         )
         self._options = options
 
+    def __open_segment(self, filename):
+        snaplen = self.options.get("snaplen", DEFAULT_SNAPLEN)
+
+        if self.options.get("capture_format") == CAPTURE_FORMAT_PCAPNG:
+            case_info = self.options.get("case_info") or dict()
+            return PcapngFileWriter(
+                open_hashed(filename, registry=self.digest_registry),
+                snaplen=snaplen,
+                comments=(
+                    f"case: {case_info.get('name', '')}",
+                    f"acquisition directory: {self.options['acquisition_directory']}",
+                ),
+                application=f"fit-acquisition {tool_version()}",
+                statistics=self.__capture_statistics,
+            )
+
+        return PcapFileWriter(
+            open_hashed(filename, registry=self.digest_registry), snaplen=snaplen
+        )
+
+    def __open_pcap(self):
+        max_bytes = int(self.options.get("segment_size_mb", 0) * 1024 * 1024)
+        max_seconds = self.options.get("segment_duration", 0)
+
+        if not (max_bytes or max_seconds):
+            return self.__open_segment(self.options.get("output_file"))
+
+        return SegmentedPacketWriter(
+            self.options.get("output_file"),
+            self.__open_segment,
+            max_bytes=max_bytes,
+            max_seconds=max_seconds,
+            keep=self.options.get("segment_keep", 0),
+            on_segment_removed=(
+                self.digest_registry.discard
+                if self.digest_registry is not None
+                else None
+            ),
+        )
+
+    def __capture_statistics(self):
+        received, dropped = self.writer.statistics()
+        kernel_drops = self.__kernel_drops() if self.__kernel_drops else None
+        return received, dropped, kernel_drops
+
+    def __close_writer(self):
+        if self.writer is not None:
+            self.writer.close()
+
+    def __enqueue_packet(self, packet):
+        self.writer.put(
+            bytes(packet),
+            float(packet.time),
+            scapy.conf.l2types.layer2num.get(type(packet)),
+        )
+
+    def __capture_filter(self):
+        capture_filter = self.options.get("capture_filter")
+        if capture_filter or not self.options.get("filter_to_target", False):
+            return capture_filter or None
+
+        return build_capture_filter(
+            self.options.get("url"),
+            self.options.get("extra_hosts"),
+            self.options.get("capture_dns", True),
+        )
+
+    def __create_sniffer(self):
+        capture_filter = self.__capture_filter()
+        iface = self.options.get("iface")
+        backend = self.options.get("capture_backend", CAPTURE_BACKEND_SCAPY)
+
+        debug(
+            f"ℹ️ PacketCaptureWorker: backend={backend} "
+            f"filter={capture_filter!r} iface={iface!r}",
+            context=get_context(self),
+        )
+
+        if backend == CAPTURE_BACKEND_SUBPROCESS:
+            program = find_capture_program()
+            if program:
+                return SubprocessSniffer(
+                    self.writer.put,
+                    program,
+                    filter=capture_filter,
+                    iface=iface,
+                    snaplen=self.options.get("snaplen", DEFAULT_SNAPLEN),
+                )
+            debug(
+                "ℹ️ PacketCaptureWorker: dumpcap/tcpdump not found, using raw sockets",
+                context=get_context(self),
+            )
+            backend = CAPTURE_BACKEND_RAW
+
+        if backend == CAPTURE_BACKEND_RAW:
+            return RawSocketSniffer(
+                self.writer.put, scapy.conf.L2listen, filter=capture_filter, iface=iface
+            )
+
+        arguments = {"prn": self.__enqueue_packet, "store": False}
+        if capture_filter:
+            arguments["filter"] = capture_filter
+        if iface:
+            arguments["iface"] = iface
+        return scapy.AsyncSniffer(**arguments)
+
     def start(self):
         try:
+            self.writer = StreamingPacketWriter(
+                self.__open_pcap,
+                max_queue=self.options.get("queue_size", DEFAULT_QUEUE_SIZE),
+                flush_interval=self.options.get(
+                    "flush_interval", DEFAULT_FLUSH_INTERVAL
+                ),
+            )
+            self.writer.start()
             if self.sniffer is None:
-                self.sniffer = scapy.AsyncSniffer()
+                self.sniffer = self.__create_sniffer()
+            self.__kernel_drops = getattr(self.sniffer, "kernel_drops", None)
             self.sniffer.start()
+            self.__start_metrics()
             self.started.emit()
         except Exception as e:
             log_exception(e, context=get_context(self))
@@ -55,6 +241,13 @@ class PacketCaptureWorker(TaskWorker):
                 str(e),
                 context=get_context(self),
             )
+            self.sniffer = None
+            # Nothing will be captured, so the writer thread and the pcap file
+            # it holds open are released now rather than left to stop().
+            try:
+                self.__close_writer()
+            except Exception as close_error:
+                log_exception(close_error, context=get_context(self))
             self.error.emit(
                 {
                     "title": self.translations["PACKET_CAPTURE"],
@@ -66,15 +259,28 @@ class PacketCaptureWorker(TaskWorker):
     def stop(self):
         try:
             if self.sniffer is None:
+                self.__close_writer()
                 self.finished.emit()
                 return
-            self.sniffer.stop()
-            loop = QEventLoop()
-            QTimer.singleShot(1000, loop.quit)
-            loop.exec()
-            scapy.wrpcap(self.options.get("output_file"), self.sniffer.results)
+            # Whatever was captured before the capture program failed is still
+            # flushed to disk before the failure is reported.
+            try:
+                self.sniffer.stop()
+            finally:
+                self.sniffer = None
+                self.__stop_metrics()
+                self.__close_writer()
+            if self.__metrics is not None:
+                metrics = self.__metrics.sample()
+                self.metrics_updated.emit(metrics)
+                debug(
+                    f"ℹ️ PacketCaptureWorker: wrote {metrics['packets_written']} "
+                    f"packets ({metrics['bytes_written']} bytes), "
+                    f"{metrics['dropped']} dropped, "
+                    f"{metrics['kernel_drops']} dropped by the kernel",
+                    context=get_context(self),
+                )
             self.finished.emit()
-            self.sniffer = None
         except Exception as e:
             log_exception(e, context=get_context(self))
             debug(
@@ -92,7 +298,7 @@ class PacketCaptureWorker(TaskWorker):
 
 
 class TaskPacketCapture(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
@@ -100,6 +306,23 @@ class TaskPacketCapture(Task):
             label="PACKET_CAPTURE",
             is_infinite_loop=True,
             worker_class=PacketCaptureWorker,
+            task_handler=task_handler,
+        )
+        self.metrics = dict()
+        self.worker.metrics_updated.connect(self.__update_metrics)
+
+    def __update_metrics(self, metrics):
+        self.metrics = metrics
+
+    def get_metrics_summary(self):
+        if not self.metrics:
+            return ""
+        return self.translations["PACKET_CAPTURE_METRICS"].format(
+            self.metrics["packets_per_second"],
+            format_bytes(self.metrics["bytes_per_second"]),
+            self.metrics["queue_depth"],
+            format_bytes(self.metrics["bytes_written"]),
+            self.metrics["dropped"] + (self.metrics["kernel_drops"] or 0),
         )
 
     @Task.options.getter
@@ -109,8 +332,12 @@ class TaskPacketCapture(Task):
     @options.setter
     def options(self, options):
         folder = options["acquisition_directory"]
+        url = options.get("url")
+        case_info = options.get("case_info")
         options = PacketCaptureController().configuration
         options["acquisition_directory"] = folder
+        options["url"] = url
+        options["case_info"] = case_info
         self._options = options
 
     def start(self):
@@ -383,7 +383,7 @@ class ScreenRecorderWorker(TaskWorker):
 
 
 class TaskScreenRecorder(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
@@ -391,6 +391,7 @@ class TaskScreenRecorder(Task):
             label="SCREEN_RECORDER",
             is_infinite_loop=True,
             worker_class=ScreenRecorderWorker,
+            task_handler=task_handler,
         )
 
     @Task.options.setter
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import asyncio
+import concurrent.futures
+import contextlib
+import socket
+import ssl
+import threading
+
+DEFAULT_BLOCKING_WORKERS = 4
+
+
+class NetworkEngine:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "_initialized"):
+            self.__loop = None
+            self.__thread = None
+            self.__loop_lock = threading.Lock()
+            self.__addresses = dict()
+            self.__ssl_context = None
+            # Client libraries without an asyncio API (requests, python-whois,
+            # nslookup) share this executor, so probing many targets never
+            # needs more than a handful of threads.
+            self.__executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DEFAULT_BLOCKING_WORKERS,
+                thread_name_prefix="network-engine",
+            )
+            self._initialized = True
+
+    @property
+    def loop(self):
+        with self.__loop_lock:
+            if self.__loop is None:
+                self.__loop = asyncio.new_event_loop()
+                self.__thread = threading.Thread(
+                    target=self.__loop.run_forever,
+                    name="network-engine-loop",
+                    daemon=True,
+                )
+                self.__thread.start()
+        return self.__loop
+
+    @property
+    def ssl_context(self):
+        if self.__ssl_context is None:
+            self.__ssl_context = ssl.create_default_context()
+        return self.__ssl_context
+
+    def submit(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine, timeout=None):
+        return self.submit(coroutine).result(timeout)
+
+    async def run_blocking(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, function, *args)
+
+    async def resolve(self, host, port=443):
+        loop = asyncio.get_running_loop()
+        if loop is not self.__loop:
+            addresses = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            return addresses[0][4][0]
+
+        key = (host, port)
+        # Probes against the same host wait on one lookup instead of each
+        # resolving it again.
+        if key not in self.__addresses:
+            self.__addresses[key] = asyncio.ensure_future(
+                loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            )
+        try:
+            addresses = await asyncio.shield(self.__addresses[key])
+        except OSError:
+            self.__addresses.pop(key, None)
+            raise
+        return addresses[0][4][0]
+
+    async def peer_certificate(self, host, port=443, timeout=10):
+        address = await self.resolve(host, port)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                address, port, ssl=self.ssl_context, server_hostname=host
+            ),
+            timeout,
+        )
+        try:
+            return writer.get_extra_info("ssl_object").getpeercert(True)
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError, ssl.SSLError):
+                await writer.wait_closed()
+
+    def clear_cache(self):
+        with self.__loop_lock:
+            loop = self.__loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self.__addresses.clear)
+
+
+class EngineWorkerThread:
+    def __init__(self, worker):
+        self.__worker = worker
+        self.__future = None
+
+    def start(self):
+        self.__future = self.__worker.submit()
+
+    def isRunning(self):
+        return self.__future is not None and not self.__future.done()
+
+    def isFinished(self):
+        return self.__future is not None and self.__future.done()
+
+    # Nothing to stop: the worker holds no thread of its own while its
+    # coroutine is scheduled on the engine loop.
+    def quit(self):
+        pass
+
+    def wait(self, timeout=None):
+        if self.__future is None:
+            return True
+        done, _ = concurrent.futures.wait([self.__future], timeout)
+        return bool(done)
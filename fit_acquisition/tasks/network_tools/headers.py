@@ -10,15 +10,17 @@
 import logging
 from urllib.parse import urlparse
 
-import requests
 from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
 
+from fit_acquisition.lazy_import import LazyImport
 from fit_acquisition.tasks.task import Task
-from fit_acquisition.tasks.task_worker import TaskWorker
+from fit_acquisition.tasks.task_worker import AsyncTaskWorker
 
+requests = LazyImport("requests")
 
-class HeadersWorker(TaskWorker):
+
+class HeadersWorker(AsyncTaskWorker):
     logger = logging.getLogger("headers")
 
     def __get_headers_information(self, url, verify_tls=True):
@@ -52,12 +54,16 @@ class HeadersWorker(TaskWorker):
         except requests.exceptions.RequestException as e:
             raise ConnectionError(str(e))
 
-    def start(self):
+    async def run(self):
         self.started.emit()
         try:
             verify_tls = self.options.get("verify_tls", True)
-            headers = self.__get_headers_information(self.options["url"], verify_tls)
+            headers = await self.engine.run_blocking(
+                self.__get_headers_information, self.options["url"], verify_tls
+            )
             headers = dict(headers)
+            if self.is_cancelled:
+                return
             for key, value in headers.items():
                 self.logger.info(f"{key}: {value}")
             self.finished.emit()
@@ -109,13 +115,14 @@ class HeadersWorker(TaskWorker):
 
 
 class TaskHeaders(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="HEADERS",
             worker_class=HeadersWorker,
+            task_handler=task_handler,
         )
 
     def start(self):
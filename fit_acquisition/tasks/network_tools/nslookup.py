@@ -15,13 +15,15 @@ from fit_common.gui.utils import Status
 from fit_configurations.controller.tabs.network.network_check import (
     NetworkCheckController,
 )
-from nslookup import Nslookup
 
+from fit_acquisition.lazy_import import LazyImport
 from fit_acquisition.tasks.task import Task
-from fit_acquisition.tasks.task_worker import TaskWorker
+from fit_acquisition.tasks.task_worker import AsyncTaskWorker
 
+Nslookup = LazyImport("nslookup", "Nslookup")
 
-class NslookupWorker(TaskWorker):
+
+class NslookupWorker(AsyncTaskWorker):
     logger = logging.getLogger("nslookup")
 
     def __nslookup(self, url, dns_server, enable_verbose_mode, enable_tcp):
@@ -44,15 +46,18 @@ class NslookupWorker(TaskWorker):
         else:
             raise RuntimeError(self.translations["NSLOOKUP_NO_RESPONSE"].format(netloc))
 
-    def start(self):
+    async def run(self):
         self.started.emit()
         try:
-            result = self.__nslookup(
+            result = await self.engine.run_blocking(
+                self.__nslookup,
                 self.options["url"],
                 self.options["nslookup_dns_server"],
                 self.options["nslookup_enable_verbose_mode"],
                 self.options["nslookup_enable_tcp"],
             )
+            if self.is_cancelled:
+                return
             self.logger.info(result)
             self.finished.emit()
 
@@ -87,13 +92,14 @@ class NslookupWorker(TaskWorker):
 
 
 class TaskNslookup(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="NSLOOKUP",
             worker_class=NslookupWorker,
+            task_handler=task_handler,
         )
 
     @Task.options.getter
@@ -103,8 +109,10 @@ class TaskNslookup(Task):
     @options.setter
     def options(self, options):
         url = options["url"]
+        logger_scope = options.get("logger_scope")
         options = NetworkCheckController().configuration
         options["url"] = url
+        options["logger_scope"] = logger_scope
         self._options = options
 
     def start(self):
@@ -15,67 +15,40 @@ from urllib.parse import urlparse
 from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
 
+from fit_acquisition.hash_registry import open_hashed
 from fit_acquisition.tasks.task import Task
-from fit_acquisition.tasks.task_worker import TaskWorker
+from fit_acquisition.tasks.task_worker import AsyncTaskWorker
 
 
-class SSLCertificateWorker(TaskWorker):
+class SSLCertificateWorker(AsyncTaskWorker):
 
-    def __check_if_peer_certificate_exist(self, url):
+    async def __get_peer_PEM_cert(self, url, timeout=10):
         parsed_url = urlparse(url)
         if not parsed_url.netloc:
             raise ValueError(self.translations["MALFORMED_URL_ERROR"])
 
-        host = parsed_url.hostname
-        port = parsed_url.port or 443
-
-        context = ssl.create_default_context()
-        with socket.create_connection((host, port), timeout=10) as sock:
-            with context.wrap_socket(sock, server_hostname=host) as ssock:
-                cert = ssock.getpeercert()
-                return bool(cert)
-
-    def __get_peer_PEM_cert(self, url, port=443, timeout=10):
-        parsed_url = urlparse(url)
-        netloc = parsed_url.netloc
-
-        if not netloc:
-            raise ValueError(self.translations["MALFORMED_URL_ERROR"])
-
-        if ":" in netloc:
-            netloc, port = netloc.split(":")
-            port = int(port)
-
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-
-        conn = socket.create_connection((netloc, port), timeout=timeout)
-        sock = context.wrap_socket(conn, server_hostname=netloc)
-
-        try:
-            der_cert = sock.getpeercert(True)
-        finally:
-            sock.close()
-
+        # The certificate is read from the same verified handshake that
+        # proves it exists, instead of connecting to the server twice.
+        der_cert = await self.engine.peer_certificate(
+            parsed_url.hostname, parsed_url.port or 443, timeout
+        )
         if not der_cert:
-            raise ValueError("Empty certificate received")
+            return None
 
         return ssl.DER_cert_to_PEM_cert(der_cert)
 
     def __save_PEM_cert_to_CER_cert(self, filename, certificate):
-        with open(filename, "w") as cer_file:
+        with open_hashed(filename, "w", registry=self.digest_registry) as cer_file:
             cer_file.write(certificate)
 
-    def start(self):
+    async def run(self):
         self.started.emit()
         try:
-            is_peer_certificate_exist = self.__check_if_peer_certificate_exist(
-                self.options["url"]
-            )
+            certificate = await self.__get_peer_PEM_cert(self.options["url"])
+            if self.is_cancelled:
+                return
 
-            if is_peer_certificate_exist:
-                certificate = self.__get_peer_PEM_cert(self.options["url"])
+            if certificate:
                 self.__save_PEM_cert_to_CER_cert(
                     os.path.join(self.options["acquisition_directory"], "server.cer"),
                     certificate,
@@ -144,13 +117,14 @@ class SSLCertificateWorker(TaskWorker):
 
 
 class TaskSSLCertificate(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="SSLCERTIFICATE",
             worker_class=SSLCertificateWorker,
+            task_handler=task_handler,
         )
 
     def start(self):
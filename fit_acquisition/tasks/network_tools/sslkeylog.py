@@ -23,13 +23,14 @@ class SSLKeyLogWorker(TaskWorker):
 
 
 class TaskSSLKeyLog(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="SSLKEYLOG",
             worker_class=SSLKeyLogWorker,
+            task_handler=task_handler,
         )
     
     def start(self):
@@ -10,13 +10,15 @@
 import os
 from urllib.parse import urlparse
 
-import scapy.all as scapy
 from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
 
+from fit_acquisition.lazy_import import LazyImport
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
 
+scapy = LazyImport("scapy.all")
+
 
 class TracerouteWorker(TaskWorker):
 
@@ -30,14 +32,19 @@ class TracerouteWorker(TaskWorker):
 
             netloc = netloc.split(":")[0]
 
-            with open(filename, "w") as f:
-                ans, unans = scapy.sr(
-                    scapy.IP(dst=netloc, ttl=(1, 22), id=scapy.RandShort())
-                    / scapy.TCP(flags=0x2),
-                    timeout=10,
-                    verbose=False,
-                )
+            ans, unans = scapy.sr(
+                scapy.IP(dst=netloc, ttl=(1, 22), id=scapy.RandShort())
+                / scapy.TCP(flags=0x2),
+                timeout=self.options.get("traceroute_timeout", 10),
+                verbose=False,
+            )
 
+            # Once cancelled, nothing may be written next to files that the
+            # post acquisition is already hashing.
+            if self.is_cancelled:
+                return
+
+            with open(filename, "w") as f:
                 for snd, rcv in ans:
                     line = (
                         f"TTL={snd.ttl} IP={rcv.src} "
@@ -71,13 +78,14 @@ class TracerouteWorker(TaskWorker):
 
 
 class TaskTraceroute(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="TRACEROUTE",
             worker_class=TracerouteWorker,
+            task_handler=task_handler,
         )
 
     def start(self):
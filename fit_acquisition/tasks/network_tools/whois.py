@@ -12,13 +12,17 @@ import socket
 
 from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
-from whois import IPV4_OR_V6, NICClient, extract_domain
 
+from fit_acquisition.lazy_import import LazyImport
 from fit_acquisition.tasks.task import Task
-from fit_acquisition.tasks.task_worker import TaskWorker
+from fit_acquisition.tasks.task_worker import AsyncTaskWorker
 
+IPV4_OR_V6 = LazyImport("whois", "IPV4_OR_V6")
+NICClient = LazyImport("whois", "NICClient")
+extract_domain = LazyImport("whois", "extract_domain")
 
-class WhoisWorker(TaskWorker):
+
+class WhoisWorker(AsyncTaskWorker):
     logger = logging.getLogger("whois")
 
     def __whois(self, url, flags=0):
@@ -48,10 +52,12 @@ class WhoisWorker(TaskWorker):
 
         return result
 
-    def start(self):
+    async def run(self):
         self.started.emit()
         try:
-            result = self.__whois(self.options["url"])
+            result = await self.engine.run_blocking(self.__whois, self.options["url"])
+            if self.is_cancelled:
+                return
             self.logger.info(result)
             self.finished.emit()
         except socket.herror as e:
@@ -99,13 +105,14 @@ class WhoisWorker(TaskWorker):
 
 
 class TaskWhois(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="WHOIS",
             worker_class=WhoisWorker,
+            task_handler=task_handler,
         )
 
     def start(self):
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import time
+from collections import deque
+
+from fit_common.core import debug, get_context
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from fit_acquisition.lang import load_translations
+from fit_acquisition.tasks.network_engine import NetworkEngine
+
+
+class NetworkToolsRunner(QObject):
+    finished = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.__translations = load_translations()
+        self.__queue = deque()
+        self.__running = dict()
+        self.__max_concurrent = 0
+        self.__deadline = 0
+        self.__done = True
+        self.latencies = dict()
+        self.cancelled = list()
+
+        self.__deadline_timer = QTimer(self)
+        self.__deadline_timer.setSingleShot(True)
+        self.__deadline_timer.timeout.connect(self.__deadline_expired)
+
+    @property
+    def is_running(self):
+        return bool(self.__queue or self.__running)
+
+    def run(self, tasks, max_concurrent=0, deadline=0):
+        self.__queue = deque(tasks)
+        self.__running = dict()
+        self.__max_concurrent = max_concurrent or len(self.__queue) or 1
+        self.__deadline = deadline
+        self.__done = False
+        self.latencies = dict()
+        self.cancelled = list()
+        # Addresses are only shared by the probes of one run: a later
+        # acquisition must not record what a host resolved to earlier.
+        NetworkEngine().clear_cache()
+
+        if deadline:
+            self.__deadline_timer.start(int(deadline * 1000))
+
+        self.__start_next()
+        self.__check_done()
+
+    def __start_next(self):
+        while self.__queue and len(self.__running) < self.__max_concurrent:
+            task = self.__queue.popleft()
+            self.__running[task] = time.monotonic()
+            task.finished.connect(lambda task=task: self.__task_finished(task))
+            task.start()
+
+    def __task_finished(self, task):
+        started = self.__running.pop(task, None)
+        if started is None:
+            return
+
+        self.latencies[task.__class__.__name__] = time.monotonic() - started
+        self.__start_next()
+        self.__check_done()
+
+    def cancel(self, task, details=""):
+        if task in self.__queue:
+            self.__queue.remove(task)
+            self.cancelled.append(task.__class__.__name__)
+            task.cancel(details)
+            self.__check_done()
+        elif task in self.__running:
+            self.cancelled.append(task.__class__.__name__)
+            task.cancel(details)
+
+    def __deadline_expired(self):
+        details = self.__translations["NETWORK_TOOLS_DEADLINE_EXCEEDED"].format(
+            self.__deadline
+        )
+        # Tools still waiting are dropped before the running ones, so none of
+        # them gets started by a slot freed during cancellation.
+        for task in list(self.__queue) + list(self.__running):
+            self.cancel(task, details)
+
+    def __check_done(self):
+        if self.__done or self.is_running:
+            return
+
+        self.__done = True
+        self.__deadline_timer.stop()
+        NetworkEngine().clear_cache()
+        debug(
+            "ℹ️ NetworkToolsRunner: "
+            + ", ".join(
+                f"{name}={latency:.3f}s" for name, latency in self.latencies.items()
+            )
+            + (f" cancelled={self.cancelled}" if self.cancelled else ""),
+            context=get_context(self),
+        )
+        self.finished.emit(dict(self.latencies))
@@ -7,12 +7,35 @@
 # -----
 ######
 
-import hashlib
 import logging
 import os
+import time
 
+from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
 
+from fit_acquisition.hash_engine import (
+    BACKEND_BUFFERED,
+    DEFAULT_ALGORITHMS,
+    DEFAULT_LARGE_FILE_THRESHOLD,
+    get_algorithm_label,
+    hash_file,
+    hash_files,
+    normalize_algorithms,
+    select_backend,
+    throughput_mb_s,
+)
+from fit_acquisition.hash_manifest import (
+    build_record,
+    manifest_filename,
+    walk_files,
+    write_manifest,
+)
+from fit_acquisition.hash_verifier import (
+    DEFAULT_EXCLUDE,
+    VerificationCache,
+    verify_directory,
+)
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
 
@@ -20,54 +43,192 @@ from fit_acquisition.tasks.task_worker import TaskWorker
 class HashWorker(TaskWorker):
     logger = logging.getLogger("hashreport")
 
-    def __calculate_hash(self, filename, algorithm):
-        with open(filename, "rb") as f:
-            file_hash = hashlib.new(algorithm)
-            while chunk := f.read(8192):
-                file_hash.update(chunk)
+    def __init__(self):
+        super().__init__()
+        self.throughput = 0.0
+        self.report = None
 
-            return file_hash.hexdigest()
+    def __calculate_hashes(self, filename, algorithms):
+        if (
+            self.options.get("hash_reuse_precomputed", False)
+            and self.digest_registry is not None
+        ):
+            digests = self.digest_registry.lookup(filename, algorithms)
+            if digests is not None:
+                return digests
+
+        return self.__read_hashes(filename, algorithms)
+
+    def __read_hashes(self, filename, algorithms):
+        backend = select_backend(
+            os.stat(filename).st_size,
+            self.options.get("hash_backend", BACKEND_BUFFERED),
+            self.options.get("hash_backend_threshold", DEFAULT_LARGE_FILE_THRESHOLD),
+        )
+        return hash_file(filename, algorithms, backend=backend)
 
     def start(self):
         self.started.emit()
 
-        files = [
-            f.name
-            for f in os.scandir(self.options["acquisition_directory"])
-            if f.is_file()
-        ]
+        if self.options.get("hash_verify"):
+            self.__verify()
+            return
+
+        algorithms = normalize_algorithms(
+            self.options.get("hash_algorithms", DEFAULT_ALGORITHMS)
+        )
+        acquisition_directory = self.options["acquisition_directory"]
+        manifest_format = self.options.get("hash_manifest")
+
         self.options["exclude_list"].append("acquisition.hash")
         self.options["exclude_list"].append("acquisition.log")
         self.options["exclude_list"].append("sslkey.log")
-        for file in files:
-            if file not in self.options["exclude_list"]:
-                filename = os.path.join(self.options["acquisition_directory"], file)
-                file_stats = os.stat(filename)
+
+        try:
+            if manifest_format:
+                self.options["exclude_list"].append(manifest_filename(manifest_format))
+                files = walk_files(acquisition_directory, self.options["exclude_list"])
+            else:
+                files = [
+                    f.name
+                    for f in os.scandir(acquisition_directory)
+                    if f.is_file() and f.name not in self.options["exclude_list"]
+                ]
+
+            filenames = [os.path.join(acquisition_directory, file) for file in files]
+            files_stats = [os.stat(filename) for filename in filenames]
+
+            start_time = time.perf_counter()
+            results = hash_files(
+                filenames,
+                algorithms,
+                max_workers=self.options.get("hash_max_workers", 1),
+                hasher=self.__calculate_hashes,
+            )
+            elapsed = time.perf_counter() - start_time
+
+            for file, file_stats, digests in zip(files, files_stats, results):
+                # acquisition.hash keeps listing the top level files only
+                if "/" in file:
+                    continue
                 self.logger.info(
                     "========================================================="
                 )
                 self.logger.info(f"Name: {file}")
                 self.logger.info(f"Size: {file_stats.st_size}")
-                algorithm = "md5"
-                self.logger.info(f"MD5: {self.__calculate_hash(filename, algorithm)}")
-                algorithm = "sha1"
-                self.logger.info(f"SHA-1: {self.__calculate_hash(filename, algorithm)}")
-                algorithm = "sha256"
-                self.logger.info(
-                    f"SHA-256: {self.__calculate_hash(filename, algorithm)}"
+                for algorithm in algorithms:
+                    self.logger.info(
+                        f"{get_algorithm_label(algorithm)}: {digests[algorithm]}"
+                    )
+
+            if manifest_format:
+                write_manifest(
+                    os.path.join(
+                        acquisition_directory, manifest_filename(manifest_format)
+                    ),
+                    [
+                        build_record(file, file_stats, digests)
+                        for file, file_stats, digests in zip(
+                            files, files_stats, results
+                        )
+                    ],
+                    manifest_format,
                 )
+        except (OSError, ValueError) as e:
+            log_exception(e, context=get_context(self))
+            debug(
+                "Start hash failed",
+                str(e),
+                context=get_context(self),
+            )
+            self.error.emit(
+                {
+                    "title": self.translations["HASHFILE"],
+                    "message": self.translations["CALCULATE_HASHFILE_ERROR"],
+                    "details": str(e),
+                }
+            )
+            return
+        finally:
+            if self.digest_registry is not None:
+                self.digest_registry.discard_directory(acquisition_directory)
+
+        total_size = sum(file_stats.st_size for file_stats in files_stats)
+        self.throughput = throughput_mb_s(total_size, elapsed)
+        debug(
+            f"ℹ️ HashWorker: hashed {len(files)} files ({total_size} bytes) "
+            f"in {elapsed:.3f}s, {self.throughput:.1f} MB/s",
+            context=get_context(self),
+        )
 
         self.finished.emit()
 
+    def __verify(self):
+        cache = VerificationCache(self.options.get("hash_verify_cache"))
+        try:
+            self.report = verify_directory(
+                self.options["acquisition_directory"],
+                manifest=self.options.get("hash_verify_manifest"),
+                cache=cache,
+                full=self.options.get("hash_verify_full", False),
+                max_workers=self.options.get("hash_max_workers", 1),
+                # Files skipped by exclude_from_hash_calculation were never
+                # in the manifest, so they are not reported as added.
+                exclude=DEFAULT_EXCLUDE + tuple(self.options["exclude_list"]),
+                hasher=self.__read_hashes,
+            )
+            cache.save()
+        except (OSError, ValueError) as e:
+            log_exception(e, context=get_context(self))
+            debug(
+                "Start hash verification failed",
+                str(e),
+                context=get_context(self),
+            )
+            self.error.emit(
+                {
+                    "title": self.translations["HASHFILE"],
+                    "message": self.translations["CALCULATE_HASHFILE_ERROR"],
+                    "details": str(e),
+                }
+            )
+            return
+
+        debug(
+            f"ℹ️ HashWorker: verification {self.report.summary()}",
+            context=get_context(self),
+        )
+
+        if self.report.is_valid:
+            self.finished.emit()
+            return
+
+        details = [self.report.summary()]
+        for label, paths in (
+            ("modified", self.report.modified),
+            ("missing", self.report.missing),
+            ("added", self.report.added),
+        ):
+            details.extend(f"{label}: {path}" for path in paths)
+
+        self.error.emit(
+            {
+                "title": self.translations["HASHFILE"],
+                "message": self.translations["HASH_VERIFICATION_FAILED"],
+                "details": "\n".join(details),
+            }
+        )
+
 
 class TaskHash(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="HASHFILE",
             worker_class=HashWorker,
+            task_handler=task_handler,
         )
 
     @Task.options.getter
@@ -82,6 +243,10 @@ class TaskHash(Task):
         ):
             options["exclude_list"] = options["exclude_from_hash_calculation"]
 
+        options["hash_algorithms"] = normalize_algorithms(
+            options.get("hash_algorithms")
+        )
+
         self._options = options
 
     def start(self):
@@ -82,13 +82,14 @@ class PecAndDownloadEmlWorker(TaskWorker):
 
 
 class TaskPecAndDownloadEml(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="PEC_AND_DOWNLOAD_EML",
             worker_class=PecAndDownloadEmlWorker,
+            task_handler=task_handler,
         )
 
         self.worker.sentpec.connect(self.__on_pec_sent)
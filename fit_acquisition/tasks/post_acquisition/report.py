@@ -9,7 +9,6 @@
 
 
 from fit_common.core import debug, get_context, get_ntp_date_and_time, log_exception
-from fit_common.core.pdf_report_builder import PdfReportBuilder, ReportType
 from fit_common.gui.utils import Status
 from fit_configurations.controller.tabs.general.legal_proceeding_type import (
     LegalProceedingTypeController,
@@ -26,9 +25,13 @@ from fit_configurations.controller.tabs.screen_recorder.screen_recorder import (
 from fit_configurations.utils import get_language
 
 from fit_acquisition.lang import load_translations
+from fit_acquisition.lazy_import import LazyImport
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
 
+PdfReportBuilder = LazyImport("fit_common.core.pdf_report_builder", "PdfReportBuilder")
+ReportType = LazyImport("fit_common.core.pdf_report_builder", "ReportType")
+
 
 class ReportWorker(TaskWorker):
 
@@ -82,13 +85,14 @@ class ReportWorker(TaskWorker):
 
 
 class TaskReport(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="REPORTFILE",
             worker_class=ReportWorker,
+            task_handler=task_handler,
         )
 
     def start(self):
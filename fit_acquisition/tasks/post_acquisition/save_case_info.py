@@ -14,6 +14,7 @@ import os
 from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
 
+from fit_acquisition.hash_registry import open_hashed
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
 
@@ -33,7 +34,7 @@ class SaveCaseInfoWorker(TaskWorker):
                 __logo_bin = base64.b64encode(logo_bin)
                 case_info["logo_bin"] = str(__logo_bin, encoding="utf-8")
 
-            with open(file, "w") as f:
+            with open_hashed(file, "w", registry=self.digest_registry) as f:
                 json.dump(self.options.get("case_info"), f, ensure_ascii=False)
 
             case_info["logo_bin"] = logo_bin
@@ -57,13 +58,14 @@ class SaveCaseInfoWorker(TaskWorker):
 
 
 class TaskSaveCaseInfo(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="SAVE_CASE_INFO",
             worker_class=SaveCaseInfoWorker,
+            task_handler=task_handler,
         )
 
     def start(self):
@@ -9,15 +9,19 @@
 
 import os
 
-import requests
-from fit_acquisition.timestamp_verifier import request_timestamp_token
 from fit_common.core import debug, get_context, log_exception
 from fit_common.gui.utils import Status
 from fit_configurations.controller.tabs.timestamp.timestamp import TimestampController
 
+from fit_acquisition.lazy_import import LazyImport
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
 
+requests = LazyImport("requests")
+request_timestamp_token = LazyImport(
+    "fit_acquisition.timestamp_verifier", "request_timestamp_token"
+)
+
 
 class TimestampWorker(TaskWorker):
 
@@ -105,13 +109,14 @@ class TimestampWorker(TaskWorker):
 
 
 class TaskTimestamp(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="TIMESTAMP",
             worker_class=TimestampWorker,
+            task_handler=task_handler,
         )
 
     @Task.options.getter
@@ -9,19 +9,80 @@
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from fit_common.core import AcquisitionType, debug, get_context
 from fit_common.gui.utils import Status
 
+from fit_acquisition.hash_engine import resolve_max_workers
+from fit_acquisition.hash_registry import open_hashed
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
+from fit_acquisition.zip_engine import (
+    DEFAULT_COMPRESSLEVEL,
+    make_zip,
+    member_digests_filename,
+    write_member_digests,
+)
 
 
 class ZipAndRemoveFolderWorker(TaskWorker):
+    def __make_archive(self, folder, member_executor):
+        # The archive bytes are digested on their way to disk, so the hash
+        # stage does not have to read the archives back.
+        member_digests = dict()
+        with open_hashed(folder + ".zip", registry=self.digest_registry) as fileobj:
+            archive_name = make_zip(
+                folder,
+                folder,
+                member_executor,
+                self.options.get("zip_compresslevel", DEFAULT_COMPRESSLEVEL),
+                fileobj=fileobj,
+                member_digests=member_digests,
+            )
+
+        # Per-member digests outlive the removed folders, so a single file can
+        # later be proven by streaming just its member out of the archive.
+        if self.options.get("zip_member_digests", True):
+            with open_hashed(
+                member_digests_filename(archive_name),
+                "w",
+                encoding="utf-8",
+                registry=self.digest_registry,
+            ) as f:
+                write_member_digests(f, member_digests)
+
+        return archive_name
+
+    def __zip_folders(self, folders):
+        max_workers = resolve_max_workers(
+            self.options.get("zip_max_workers"), os.cpu_count() or 1
+        )
+
+        # The archives are written concurrently, each by its own thread, while
+        # the deflate work of their small members is shared on a second pool.
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fit-zip-member"
+        ) as member_executor, ThreadPoolExecutor(
+            max_workers=len(folders), thread_name_prefix="fit-zip"
+        ) as archive_executor:
+            futures = [
+                archive_executor.submit(
+                    self.__make_archive,
+                    folder,
+                    member_executor if max_workers > 1 else None,
+                )
+                for folder in folders
+            ]
+            for future in futures:
+                future.result()
+
     def start(self):
         debug("ℹ️ ZipAndRemoveFolderWorker.start: begin", context=get_context(self))
         self.started.emit()
 
+        folders = []
+
         acquisition_content_directory = None
         if self.options.get("type") != AcquisitionType.WEB:
             acquisition_content_directory = self.options.get(
@@ -35,32 +96,7 @@ class ZipAndRemoveFolderWorker(TaskWorker):
                     context=get_context(self),
                 )
             else:
-                debug(
-                    f"ℹ️ zipping acquisition_content_directory={acquisition_content_directory}",
-                    context=get_context(self),
-                )
-                try:
-                    shutil.make_archive(
-                        acquisition_content_directory,
-                        "zip",
-                        acquisition_content_directory,
-                    )
-                except (OSError, shutil.Error) as exc:
-                    debug(
-                        f"❌ zip acquisition_content_directory failed: {exc}",
-                        context=get_context(self),
-                    )
-                    self.error.emit(
-                        {
-                            "title": self.translations["ZIP_AND_REMOVE_FOLDER"],
-                            "message": self.translations["ZIP_AND_REMOVE_FOLDER_ERROR"],
-                            "details": str(exc),
-                        }
-                    )
-                    return
-                debug(
-                    "✅ zipped acquisition_content_directory", context=get_context(self)
-                )
+                folders.append(acquisition_content_directory)
 
         has_files_downloads_folder = []
         has_files_screenshot_folder = []
@@ -93,38 +129,16 @@ class ZipAndRemoveFolderWorker(TaskWorker):
             )
 
         if len(has_files_downloads_folder) > 0:
-            debug(
-                f"ℹ️ zipping downloads_folder={downloads_folder}",
-                context=get_context(self),
-            )
-            try:
-                shutil.make_archive(downloads_folder, "zip", downloads_folder)
-            except (OSError, shutil.Error) as exc:
-                debug(
-                    f"❌ zip downloads_folder failed: {exc}",
-                    context=get_context(self),
-                )
-                self.error.emit(
-                    {
-                        "title": self.translations["ZIP_AND_REMOVE_FOLDER"],
-                        "message": self.translations["ZIP_AND_REMOVE_FOLDER_ERROR"],
-                        "details": str(exc),
-                    }
-                )
-                return
-            debug("✅ zipped downloads_folder", context=get_context(self))
+            folders.append(downloads_folder)
         if len(has_files_screenshot_folder) > 0:
-            debug(
-                f"ℹ️ zipping screenshot_folder={screenshot_folder}",
-                context=get_context(self),
-            )
+            folders.append(screenshot_folder)
+
+        if folders:
+            debug(f"ℹ️ zipping folders={folders}", context=get_context(self))
             try:
-                shutil.make_archive(screenshot_folder, "zip", screenshot_folder)
-            except (OSError, shutil.Error) as exc:
-                debug(
-                    f"❌ zip screenshot_folder failed: {exc}",
-                    context=get_context(self),
-                )
+                self.__zip_folders(folders)
+            except (OSError, ValueError) as exc:
+                debug(f"❌ zip folders failed: {exc}", context=get_context(self))
                 self.error.emit(
                     {
                         "title": self.translations["ZIP_AND_REMOVE_FOLDER"],
@@ -133,7 +147,8 @@ class ZipAndRemoveFolderWorker(TaskWorker):
                     }
                 )
                 return
-            debug("✅ zipped screenshot_folder", context=get_context(self))
+            debug("✅ zipped folders", context=get_context(self))
+
         try:
             if acquisition_content_directory and os.path.isdir(
                 acquisition_content_directory
@@ -179,13 +194,14 @@ class ZipAndRemoveFolderWorker(TaskWorker):
 
 
 class TaskZipAndRemoveFolder(Task):
-    def __init__(self, logger, progress_bar=None, status_bar=None):
+    def __init__(self, logger, progress_bar=None, status_bar=None, task_handler=None):
         super().__init__(
             logger,
             progress_bar,
             status_bar,
             label="ZIP_AND_REMOVE_FOLDER",
             worker_class=ZipAndRemoveFolderWorker,
+            task_handler=task_handler,
         )
 
     def start(self):
@@ -10,12 +10,14 @@
 from datetime import datetime, timedelta
 
 from fit_common.gui.utils import State, Status
-from PySide6.QtCore import QEventLoop, QObject, QThread, QTimer, Signal
+from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QLabel, QStatusBar
 from shiboken6 import isValid
 
 from fit_acquisition.lang import load_translations
-from fit_acquisition.tasks.tasks_handler import TasksHandler
+from fit_acquisition.tasks.network_engine import EngineWorkerThread
+from fit_acquisition.tasks.task_worker import AsyncTaskWorker
+from fit_acquisition.tasks.worker_pool import PooledWorkerThread
 
 
 class Task(QObject):
@@ -32,9 +34,12 @@ class Task(QObject):
         label=None,
         is_infinite_loop=False,
         worker_class=None,
+        task_handler=None,
     ):
         super().__init__()
 
+        self.task_handler = None
+
         self.logger = logger
         self.progress_bar = progress_bar
         self.status_bar = status_bar
@@ -56,17 +61,18 @@ class Task(QObject):
 
         self.is_infinite_loop = is_infinite_loop
 
-        self.task_handler = TasksHandler()
-        self.task_handler.add_task(self)
+        if task_handler is not None:
+            task_handler.add_task(self)
 
         self.worker = None
         self.worker_thread = None
 
         if worker_class:
-            self.worker_thread = QThread()
             self.worker = worker_class()
-            self.worker.moveToThread(self.worker_thread)
-            self.worker_thread.started.connect(self.worker.start)
+            if isinstance(self.worker, AsyncTaskWorker):
+                self.worker_thread = EngineWorkerThread(self.worker)
+            else:
+                self.worker_thread = PooledWorkerThread(self.worker)
 
             self.worker.started.connect(self._started)
             self.worker.finished.connect(self._finished)
@@ -109,6 +115,8 @@ class Task(QObject):
     @state.setter
     def state(self, state):
         self.__state = state
+        if self.task_handler is not None:
+            self.task_handler.update_task_state(self, state)
 
     @property
     def status(self):
@@ -160,6 +168,10 @@ class Task(QObject):
 
         if self.worker and self.worker_thread:
             self.worker.options = self.options
+            if self.task_handler is not None:
+                self.worker.digest_registry = self.task_handler.digest_registry
+                if isinstance(self.worker_thread, PooledWorkerThread):
+                    self.worker_thread.pool = self.task_handler.worker_pool
             self.worker_thread.start()
 
     def stop_task(self, message):
@@ -192,6 +204,11 @@ class Task(QObject):
         self.started.emit()
 
     def _finished(self, status=Status.SUCCESS, details="", message=""):
+        # A cancelled worker may still report back once its blocking call
+        # returns; the task has already been completed by cancel().
+        if self.__is_cancelled() and self.state == State.COMPLETED:
+            return
+
         self.__end_time = datetime.now()
         self.logger.info(message)
         self.set_message_on_the_statusbar(message)
@@ -199,13 +216,22 @@ class Task(QObject):
         self.update_task(State.COMPLETED, status, details)
         self.finished.emit()
 
-        if self.worker_thread:
-            loop = QEventLoop()
-            QTimer.singleShot(1000, loop.quit)
-            loop.exec()
+        # The pool thread is released when the worker returns from start(),
+        # so wait() ends exactly when the worker is done.
+        if self.worker_thread and not self.__is_cancelled():
             self.worker_thread.quit()
             self.worker_thread.wait()
 
+    def __is_cancelled(self):
+        return self.worker is not None and getattr(self.worker, "is_cancelled", False)
+
+    def cancel(self, details=""):
+        if self.state == State.COMPLETED:
+            return
+        if self.worker is not None:
+            self.worker.cancel()
+        self._finished(Status.FAILURE, details)
+
     def _handle_error(self, error):
         self._finished(Status.FAILURE, error.get("details"))
 
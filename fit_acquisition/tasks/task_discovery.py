@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import os
+import pkgutil
+import sys
+import threading
+from importlib import import_module
+from inspect import getmembers, isclass
+
+
+class TaskDiscovery:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "_initialized"):
+            self.__cache = dict()
+            self.__lock = threading.Lock()
+            self._initialized = True
+
+    def discover(self, package_name):
+        try:
+            package = import_module(package_name)
+        except ModuleNotFoundError:
+            return None
+
+        signature = self.__signature(package)
+        with self.__lock:
+            cached = self.__cache.get(package_name)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        task_modules = self.__walk(package)
+        with self.__lock:
+            self.__cache[package_name] = (signature, task_modules)
+        return task_modules
+
+    def clear(self):
+        with self.__lock:
+            self.__cache.clear()
+
+    # Only file metadata is read here: a package whose files have not changed
+    # is neither walked with pkgutil nor introspected again.
+    def __signature(self, package):
+        signature = list()
+        for path in getattr(package, "__path__", []):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                for filename in sorted(files):
+                    if filename.endswith(".py"):
+                        filename = os.path.join(root, filename)
+                        signature.append((filename, os.stat(filename).st_mtime_ns))
+        return tuple(signature)
+
+    def __walk(self, package):
+        task_modules = dict()
+
+        for importer, modname, ispkg in pkgutil.walk_packages(
+            path=package.__path__, prefix=package.__name__ + ".", onerror=lambda x: None
+        ):
+            if modname not in sys.modules and not ispkg:
+                import_module(modname)
+
+            if modname in sys.modules and not ispkg:
+                module = sys.modules[modname]
+
+                for name, obj in getmembers(module, isclass):
+                    if getattr(obj, "__is_task__", False):
+                        task_modules.setdefault(name, []).append(modname)
+
+        return task_modules
@@ -1,5 +1,11 @@
+import asyncio
+import logging
+import threading
+
 from PySide6.QtCore import QObject, Signal
 from fit_acquisition.lang import load_translations
+from fit_acquisition.logger_names import scoped_logger_name
+from fit_acquisition.tasks.network_engine import NetworkEngine
 
 
 class TaskWorker(QObject):
@@ -10,6 +16,8 @@ class TaskWorker(QObject):
     def __init__(self):
         QObject.__init__(self)
         self.__translations = load_translations()
+        self.__cancelled = threading.Event()
+        self.digest_registry = None
 
     @property
     def options(self):
@@ -19,12 +27,54 @@ class TaskWorker(QObject):
     def options(self, options):
         self._options = options
 
+        # Workers writing through a named logger follow the acquisition's
+        # logger scope, so concurrent acquisitions keep separate files.
+        logger = getattr(type(self), "logger", None)
+        scope = options.get("logger_scope") if isinstance(options, dict) else None
+        if scope and isinstance(logger, logging.Logger):
+            self.logger = logging.getLogger(scoped_logger_name(scope, logger.name))
+
     @property
     def translations(self):
         return self.__translations
 
+    @property
+    def is_cancelled(self):
+        return self.__cancelled.is_set()
+
+    def cancel(self):
+        self.__cancelled.set()
+
     def start(self):
         pass
 
     def stop(self):
         pass
+
+
+class AsyncTaskWorker(TaskWorker):
+    def __init__(self):
+        super().__init__()
+        self.__future = None
+
+    @property
+    def engine(self):
+        return NetworkEngine()
+
+    def submit(self):
+        self.__future = self.engine.submit(self.run())
+        return self.__future
+
+    # Called directly, the worker keeps the TaskWorker contract and runs to
+    # completion on the caller's thread; Task schedules it on the engine loop
+    # through submit() instead.
+    def start(self):
+        asyncio.run(self.run())
+
+    def cancel(self):
+        super().cancel()
+        if self.__future is not None:
+            self.__future.cancel()
+
+    async def run(self):
+        pass
@@ -1,57 +1,96 @@
-#!/usr/bin/env python3
-# -*- coding:utf-8 -*-
-######
-# -----
-# Copyright (c) 2023 FIT-Project
-# SPDX-License-Identifier: GPL-3.0-only
-# -----
-######
-
-from PySide6.QtCore import QObject, Signal
-
-
-class TasksHandler(QObject):
-    all_tasks_completed = Signal()
-
-    _instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        if not hasattr(self, "_initialized"):
-            super().__init__()
-            self.__tasks = []
-            self._initialized = True
-
-    def add_task(self, task):
-        self.__tasks.append(task)
-
-    def get_tasks(self):
-        return self.__tasks
-
-    def get_task(self, name):
-        return next(
-            (task for task in self.__tasks if task.__class__.__name__ == name), None
-        )
-
-    def clear_tasks(self):
-        self.__tasks = list()
-
-    def are_task_names_in_the_same_state(self, names, state):
-        are_completed = False
-        __state = list()
-
-        for name in names:
-            task = self.get_task(name)
-            if task:
-                __state.append(task.state)
-
-        if __state:
-            __state = list(set(__state))
-            if len(__state) == 1 and __state[0] == state:
-                are_completed = True
-
-        return are_completed
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+from collections import Counter
+
+from PySide6.QtCore import QObject, Signal
+
+from fit_acquisition.tasks.worker_pool import WorkerPool
+
+
+class TasksHandler(QObject):
+    all_tasks_completed = Signal()
+
+    def __init__(self, digest_registry=None, worker_pool=None):
+        super().__init__()
+        # Both are scoped to the acquisition owning this handler, so
+        # concurrent acquisitions never share recorded digests or a thread cap.
+        # Without a registry, writers do not hash what they write.
+        self.digest_registry = digest_registry
+        self.worker_pool = worker_pool or WorkerPool()
+        self.clear_tasks()
+
+    def add_task(self, task):
+        name = task.__class__.__name__
+        if self.__index.get(name) is task:
+            return
+
+        self.__tasks.append(task)
+        if hasattr(task, "task_handler"):
+            task.task_handler = self
+
+        if name in self.__index:
+            return
+
+        state = getattr(task, "state", None)
+        self.__index[name] = task
+        self.__states[name] = state
+        self.__state_counts[state] += 1
+        for group in self.__name_groups.get(name, ()):
+            self.__groups[group][state] += 1
+
+    def get_tasks(self):
+        return self.__tasks
+
+    def get_task(self, name):
+        return self.__index.get(name)
+
+    def clear_tasks(self):
+        self.__tasks = list()
+        self.__index = dict()
+        self.__states = dict()
+        self.__state_counts = Counter()
+        self.__groups = dict()
+        self.__name_groups = dict()
+
+    def update_task_state(self, task, state):
+        name = task.__class__.__name__
+        if self.__index.get(name) is not task:
+            return
+
+        previous = self.__states[name]
+        if previous == state:
+            return
+
+        self.__states[name] = state
+        self.__state_counts[previous] -= 1
+        self.__state_counts[state] += 1
+        for group in self.__name_groups.get(name, ()):
+            self.__groups[group][previous] -= 1
+            self.__groups[group][state] += 1
+
+    def count_tasks_in_state(self, state):
+        return self.__state_counts[state]
+
+    def __group(self, names):
+        key = frozenset(names)
+        if key not in self.__groups:
+            # Counters for a set of names are built on the first query and
+            # kept up to date by update_task_state() afterwards.
+            self.__groups[key] = Counter(
+                self.__states[name] for name in key if name in self.__states
+            )
+            for name in key:
+                self.__name_groups.setdefault(name, []).append(key)
+        return self.__groups[key]
+
+    def are_task_names_in_the_same_state(self, names, state):
+        group = self.__group(names)
+        present = sum(group.values())
+        return present > 0 and group[state] == present
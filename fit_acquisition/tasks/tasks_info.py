@@ -13,14 +13,13 @@ from fit_common.gui.utils import Status
 from PySide6 import QtCore, QtWidgets
 
 from fit_acquisition.lang import load_translations
-from fit_acquisition.tasks.tasks_handler import TasksHandler
 from fit_acquisition.tasks.tasks_info_ui import Ui_tasks_info
 
 
 class TasksInfo(QtWidgets.QWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, *, task_handler):
         super(TasksInfo, self).__init__(parent)
-        self.__task_handler = TasksHandler()
+        self.__task_handler = task_handler
         self.__pending_tasks = set()
         self.__init_ui()
         self.__connect_task_signals()
@@ -57,6 +56,7 @@ class TasksInfo(QtWidgets.QWidget):
         if active_tasks:
             lines = [
                 f"🟡 {task.label} ({task.get_elapsed_time().seconds}s)"
+                + self.__metrics_summary(task)
                 for task in active_tasks
             ]
             text = self.__translations["ACTIVE_TASKS_HEADER"] + "\n".join(lines)
@@ -65,6 +65,12 @@ class TasksInfo(QtWidgets.QWidget):
 
         self.active_tasks_label.setText(text)
 
+    def __metrics_summary(self, task):
+        summary = ""
+        if hasattr(task, "get_metrics_summary"):
+            summary = task.get_metrics_summary()
+        return f" - {summary}" if summary else ""
+
     def __connect_task_signals(self):
         tasks = self.__task_handler.get_tasks()
         for task in tasks:
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import threading
+
+from PySide6.QtCore import QRunnable, QThread, QThreadPool
+
+DEFAULT_MIN_THREADS = 8
+DEFAULT_EXPIRY_TIMEOUT = 60000
+
+
+class WorkerRunnable(QRunnable):
+    def __init__(self, function, done):
+        super().__init__()
+        self.__function = function
+        self.__done = done
+        self.setAutoDelete(True)
+
+    def run(self):
+        try:
+            self.__function()
+        finally:
+            self.__done.set()
+
+
+class BoundedWorkerPool:
+    def __init__(self, max_thread_count=None):
+        self.__pool = QThreadPool()
+        # Idle threads are kept for a while, so consecutive acquisitions
+        # reuse them instead of creating new ones.
+        self.__pool.setExpiryTimeout(DEFAULT_EXPIRY_TIMEOUT)
+        self.max_thread_count = max_thread_count
+
+    @property
+    def max_thread_count(self):
+        return self.__pool.maxThreadCount()
+
+    @max_thread_count.setter
+    def max_thread_count(self, max_thread_count):
+        if not max_thread_count:
+            max_thread_count = max(QThread.idealThreadCount(), DEFAULT_MIN_THREADS)
+        self.__pool.setMaxThreadCount(int(max_thread_count))
+
+    @property
+    def active_thread_count(self):
+        return self.__pool.activeThreadCount()
+
+    def submit(self, function):
+        done = threading.Event()
+        self.__pool.start(WorkerRunnable(function, done))
+        return done
+
+    def wait_for_done(self, msecs=-1):
+        return self.__pool.waitForDone(msecs)
+
+
+class WorkerPool(BoundedWorkerPool):
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, "_initialized"):
+            super().__init__()
+            self._initialized = True
+
+
+class PooledWorkerThread:
+    def __init__(self, worker, pool=None):
+        self.__worker = worker
+        self.__pool = pool or WorkerPool()
+        self.__done = None
+
+    @property
+    def pool(self):
+        return self.__pool
+
+    @pool.setter
+    def pool(self, pool):
+        self.__pool = pool or WorkerPool()
+
+    def start(self):
+        self.__done = self.__pool.submit(self.__worker.start)
+
+    def isRunning(self):
+        return self.__done is not None and not self.__done.is_set()
+
+    def isFinished(self):
+        return self.__done is not None and self.__done.is_set()
+
+    # Nothing to stop: the pool thread is released as soon as the worker
+    # returns from start().
+    def quit(self):
+        pass
+
+    def wait(self, timeout=None):
+        if self.__done is None:
+            return True
+        return self.__done.wait(timeout)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+######
+# -----
+# Copyright (c) 2023 FIT-Project
+# SPDX-License-Identifier: GPL-3.0-only
+# -----
+######
+
+import hashlib
+import os
+import sys
+import zipfile
+import zlib
+from collections import deque
+
+DEFAULT_COMPRESSLEVEL = 6
+COPY_BUFFER_SIZE = 1024 * 1024
+PARALLEL_MEMBER_LIMIT = 8 * 1024 * 1024
+MEMBER_DIGEST_ALGORITHM = "sha256"
+
+# Members deflated on worker threads are written through zipfile internals,
+# which are only relied on for the Python versions this package supports.
+# Anywhere else every member is streamed through ZipFile.open().
+RAW_MEMBER_PYTHON_VERSIONS = ((3, 11), (3, 14))
+RAW_MEMBER_ATTRIBUTES = (
+    "fp",
+    "start_dir",
+    "filelist",
+    "NameToInfo",
+    "_didModify",
+    "_writecheck",
+)
+
+# Members that are already compressed only cost CPU time when deflated again.
+STORED_EXTENSIONS = (
+    ".mp4",
+    ".mkv",
+    ".mov",
+    ".webm",
+    ".mp3",
+    ".m4a",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".gz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".zip",
+    ".7z",
+    ".wacz",
+)
+
+
+def compression_for(filename) -> int:
+    if str(filename).lower().endswith(STORED_EXTENSIONS):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def iter_entries(root_dir):
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames.sort()
+        relative_dirpath = os.path.relpath(dirpath, root_dir)
+        for name in dirnames:
+            yield (
+                os.path.join(dirpath, name),
+                os.path.normpath(os.path.join(relative_dirpath, name)),
+            )
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            if os.path.isfile(path):
+                yield path, os.path.normpath(os.path.join(relative_dirpath, name))
+
+
+def supports_raw_members(archive) -> bool:
+    oldest, newest = RAW_MEMBER_PYTHON_VERSIONS
+    return oldest <= sys.version_info[:2] < newest and all(
+        hasattr(archive, attribute) for attribute in RAW_MEMBER_ATTRIBUTES
+    )
+
+
+def _deflate_member(path, compresslevel):
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    member_digest = hashlib.new(MEMBER_DIGEST_ALGORITHM)
+    chunks = []
+    crc = 0
+    size = 0
+
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_BUFFER_SIZE):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            member_digest.update(chunk)
+            chunks.append(compressor.compress(chunk))
+    chunks.append(compressor.flush())
+
+    return b"".join(chunks), crc, size, member_digest.hexdigest()
+
+
+def _write_deflated_member(archive, zinfo, data, crc, size, member_digest):
+    # zipfile has no public API for members compressed elsewhere, so this
+    # mirrors what ZipFile.open(..., "w") does once a member is closed.
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = size
+    zinfo.compress_size = len(data)
+    zinfo.CRC = crc
+    zinfo.header_offset = archive.fp.tell()
+
+    archive._writecheck(zinfo)
+    archive._didModify = True
+    archive.fp.write(zinfo.FileHeader())
+    archive.fp.write(data)
+    archive.filelist.append(zinfo)
+    archive.NameToInfo[zinfo.filename] = zinfo
+    archive.start_dir = archive.fp.tell()
+
+    return member_digest
+
+
+def _write_streamed_member(archive, zinfo, path, compresslevel):
+    zinfo.compress_type = compression_for(path)
+    if hasattr(zinfo, "compress_level"):
+        zinfo.compress_level = compresslevel
+    else:
+        zinfo._compresslevel = compresslevel
+    member_digest = hashlib.new(MEMBER_DIGEST_ALGORITHM)
+
+    with open(path, "rb") as src, archive.open(zinfo, "w") as dest:
+        while chunk := src.read(COPY_BUFFER_SIZE):
+            member_digest.update(chunk)
+            dest.write(chunk)
+
+    return member_digest.hexdigest()
+
+
+def make_zip(
+    base_name,
+    root_dir,
+    executor=None,
+    compresslevel=DEFAULT_COMPRESSLEVEL,
+    fileobj=None,
+    max_pending=16,
+    member_digests=None,
+):
+    archive_name = base_name + ".zip"
+    member_digests = member_digests if member_digests is not None else dict()
+    output = fileobj if fileobj is not None else open(archive_name, "wb")
+    pending = deque()
+
+    # Members keep their on-disk order, whatever finishes compressing first.
+    def drain(limit):
+        while len(pending) > limit:
+            zinfo, future = pending.popleft()
+            member_digests[zinfo.filename] = _write_deflated_member(
+                archive, zinfo, *future.result()
+            )
+
+    try:
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+            if not supports_raw_members(archive):
+                executor = None
+
+            for path, arcname in iter_entries(root_dir):
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+
+                if zinfo.is_dir():
+                    drain(0)
+                    zinfo.compress_size = 0
+                    zinfo.CRC = 0
+                    archive.mkdir(zinfo)
+                elif (
+                    executor is not None
+                    and compression_for(path) == zipfile.ZIP_DEFLATED
+                    and zinfo.file_size <= PARALLEL_MEMBER_LIMIT
+                ):
+                    pending.append(
+                        (zinfo, executor.submit(_deflate_member, path, compresslevel))
+                    )
+                    drain(max_pending)
+                else:
+                    drain(0)
+                    member_digests[zinfo.filename] = _write_streamed_member(
+                        archive, zinfo, path, compresslevel
+                    )
+
+            drain(0)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if fileobj is None:
+            output.close()
+
+    return archive_name
+
+
+def member_digests_filename(archive_name) -> str:
+    return f"{archive_name}.{MEMBER_DIGEST_ALGORITHM}"
+
+
+# The sidecar uses the sha256sum layout, so an extracted archive can also be
+# checked with "sha256sum -c".
+def write_member_digests(fileobj, member_digests):
+    for member, member_digest in member_digests.items():
+        fileobj.write(f"{member_digest}  {member}\n")
+
+
+def load_member_digests(filename) -> dict:
+    member_digests = dict()
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            member_digest, separator, member = line.rstrip("\n").partition("  ")
+            if separator:
+                member_digests[member] = member_digest
+    return member_digests
+
+
+def verify_member(archive_name, member, member_digests=None) -> bool:
+    if member_digests is None:
+        member_digests = load_member_digests(member_digests_filename(archive_name))
+
+    expected = member_digests.get(member)
+    if expected is None:
+        raise KeyError(f"No digest recorded for member: {member}")
+
+    member_digest = hashlib.new(MEMBER_DIGEST_ALGORITHM)
+    with zipfile.ZipFile(archive_name) as archive, archive.open(member) as f:
+        while chunk := f.read(COPY_BUFFER_SIZE):
+            member_digest.update(chunk)
+
+    return member_digest.hexdigest() == expected
@@ -33,14 +33,13 @@ def test_tasks_info_logs_start_and_finish(
     qapp, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     handler = TasksHandler()
-    handler.clear_tasks()
 
     fake_task = _FakeTask("FakeTask")
     handler.add_task(fake_task)
 
     monkeypatch.setattr(QtCore.QTimer, "singleShot", lambda _ms, fn: fn())
 
-    dialog = TasksInfo()
+    dialog = TasksInfo(task_handler=handler)
 
     fake_task.state = State.STARTED
     fake_task.started.emit()
@@ -54,4 +53,17 @@ def test_tasks_info_logs_start_and_finish(
     assert "FakeTask started" in content
     assert "FakeTask finished" in content
 
-    handler.clear_tasks()
+
+@pytest.mark.e2e
+def test_tasks_info_shows_task_metrics(qapp) -> None:
+    handler = TasksHandler()
+
+    fake_task = _FakeTask("Capture")
+    fake_task.state = State.STARTED
+    fake_task.get_metrics_summary = lambda: "10 pkt/s"
+    handler.add_task(fake_task)
+
+    dialog = TasksInfo(task_handler=handler)
+    dialog._TasksInfo__update_active_tasks_status()
+
+    assert "Capture (1s) - 10 pkt/s" in dialog.active_tasks_label.text()
@@ -41,10 +41,8 @@ def test_tasks_manager_discovers_and_initializes_task_from_package(
     monkeypatch.syspath_prepend(str(tmp_path))
 
     handler = TasksHandler()
-    handler.clear_tasks()
 
-    manager = TasksManager()
-    manager.clear_tasks()
+    manager = TasksManager(handler)
     manager.class_names_modules.clear()
     manager.task_package_names.clear()
 
@@ -56,5 +54,7 @@ def test_tasks_manager_discovers_and_initializes_task_from_package(
 
     assert task is not None
     assert task.label
+    assert task.task_handler is handler
+    assert handler.get_tasks() == [task]
 
     manager.clear_tasks()
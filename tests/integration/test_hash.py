@@ -4,6 +4,8 @@ from types import SimpleNamespace
 
 import pytest
 
+from fit_acquisition.hash_manifest import load_manifest
+from fit_acquisition.hash_registry import DigestRegistry, open_hashed
 from fit_acquisition.tasks.post_acquisition import hash as hash_module
 
 
@@ -26,8 +28,8 @@ def test_hash_worker_logs_hashes_without_real_files(monkeypatch: pytest.MonkeyPa
     monkeypatch.setattr(hash_module.os, "stat", lambda path: SimpleNamespace(st_size=12))
     monkeypatch.setattr(
         worker,
-        "_HashWorker__calculate_hash",
-        lambda filename, algorithm: f"{algorithm}-digest",
+        "_HashWorker__calculate_hashes",
+        lambda filename, algorithms: {a: f"{a}-digest" for a in algorithms},
     )
 
     events: list[str] = []
@@ -38,6 +40,27 @@ def test_hash_worker_logs_hashes_without_real_files(monkeypatch: pytest.MonkeyPa
 
     assert events == ["started", "finished"]
     assert any("MD5: md5-digest" in m for m in worker.logger.messages)
+    assert any("SHA-1: sha1-digest" in m for m in worker.logger.messages)
+    assert any("SHA-256: sha256-digest" in m for m in worker.logger.messages)
+
+
+@pytest.mark.integration
+def test_hash_worker_logs_configured_algorithms(tmp_path) -> None:
+    (tmp_path / "a.txt").write_bytes(b"abc")
+
+    worker = hash_module.HashWorker()
+    worker.logger = _Logger()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": [],
+        "hash_algorithms": ["sha512", "blake2b"],
+    }
+
+    worker.start()
+
+    assert worker.logger.messages[1:3] == ["Name: a.txt", "Size: 3"]
+    assert worker.logger.messages[3].startswith("SHA-512: ddaf35a193617aba")
+    assert worker.logger.messages[4].startswith("BLAKE2b: ba80a53f981c4d0d")
 
 
 @pytest.mark.integration
@@ -49,3 +72,202 @@ def test_task_hash_options_sets_exclude_list() -> None:
     }
 
     assert task.options["exclude_list"] == ["keep.me"]
+
+
+@pytest.mark.integration
+def test_hash_worker_parallel_mode_keeps_file_order(tmp_path) -> None:
+    for name in ("c.bin", "a.bin", "b.bin"):
+        (tmp_path / name).write_bytes(name.encode() * 1000)
+
+    names = [f.name for f in hash_module.os.scandir(tmp_path) if f.is_file()]
+
+    worker = hash_module.HashWorker()
+    worker.logger = _Logger()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": [],
+        "hash_max_workers": 3,
+    }
+
+    worker.start()
+
+    logged = [m[len("Name: "):] for m in worker.logger.messages if m.startswith("Name: ")]
+    assert logged == names
+    assert worker.throughput >= 0.0
+
+
+@pytest.mark.integration
+def test_hash_worker_reuses_digests_computed_while_writing(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    registry = DigestRegistry()
+    with open_hashed(str(tmp_path / "caseinfo.json"), registry=registry) as f:
+        f.write(b"{}")
+
+    monkeypatch.setattr(
+        hash_module,
+        "hash_file",
+        lambda *args, **kwargs: pytest.fail("precomputed digests were not reused"),
+    )
+
+    worker = hash_module.HashWorker()
+    worker.logger = _Logger()
+    worker.digest_registry = registry
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": [],
+        "hash_reuse_precomputed": True,
+    }
+
+    worker.start()
+
+    assert "MD5: 99914b932bd37a50b983c5e7c90ae93b" in worker.logger.messages
+
+
+@pytest.mark.integration
+def test_hash_worker_reads_files_back_unless_reuse_is_enabled(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    registry = DigestRegistry()
+    with open_hashed(str(tmp_path / "caseinfo.json"), registry=registry) as f:
+        f.write(b"{}")
+
+    read = []
+    hash_file = hash_module.hash_file
+    monkeypatch.setattr(
+        hash_module,
+        "hash_file",
+        lambda filename, *args, **kwargs: read.append(filename)
+        or hash_file(filename, *args, **kwargs),
+    )
+
+    worker = hash_module.HashWorker()
+    worker.logger = _Logger()
+    worker.digest_registry = registry
+    worker.options = {"acquisition_directory": str(tmp_path), "exclude_list": []}
+
+    worker.start()
+
+    assert read == [str(tmp_path / "caseinfo.json")]
+    assert "MD5: 99914b932bd37a50b983c5e7c90ae93b" in worker.logger.messages
+
+
+@pytest.mark.integration
+def test_hash_worker_writes_recursive_manifest(tmp_path) -> None:
+    (tmp_path / "downloads").mkdir()
+    (tmp_path / "top.txt").write_bytes(b"top")
+    (tmp_path / "downloads" / "inner.txt").write_bytes(b"inner")
+
+    worker = hash_module.HashWorker()
+    worker.logger = _Logger()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": [],
+        "hash_manifest": "jsonl",
+    }
+
+    worker.start()
+
+    index = load_manifest(str(tmp_path / "acquisition.hash.jsonl"))
+    assert list(index) == ["top.txt", "downloads/inner.txt"]
+    assert index["top.txt"]["size"] == 3
+    assert set(index["top.txt"]["digests"]) == {"md5", "sha1", "sha256"}
+    assert "Name: top.txt" in worker.logger.messages
+    assert "Name: downloads/inner.txt" not in worker.logger.messages
+
+
+@pytest.mark.integration
+def test_hash_worker_verifies_a_completed_acquisition(tmp_path) -> None:
+    (tmp_path / "acquisition.log").write_text("log\n", encoding="utf-8")
+    (tmp_path / "caseinfo.json").write_bytes(b"{}")
+    (tmp_path / "downloads.zip").write_bytes(b"PK" * 100)
+    (tmp_path / "downloads.zip.sha256").write_text("digests\n", encoding="utf-8")
+
+    worker = hash_module.HashWorker()
+    worker.logger = _Logger()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": [],
+        "hash_manifest": "jsonl",
+    }
+    worker.start()
+
+    # Written by the report, timestamp and PEC steps once hashing is done.
+    (tmp_path / "acquisition_report.pdf").write_bytes(b"%PDF")
+    (tmp_path / "timestamp.tsr").write_bytes(b"tsr")
+    (tmp_path / "tsa.crt").write_bytes(b"crt")
+    (tmp_path / "opec2910.20240101120000.12345.01.1.12.eml").write_bytes(b"eml")
+    (tmp_path / "acquisition.log").write_text("log\nmore\n", encoding="utf-8")
+
+    verifier = hash_module.HashWorker()
+    verifier.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": [],
+        "hash_verify": True,
+    }
+    events: list[str] = []
+    verifier.finished.connect(lambda: events.append("finished"))
+    verifier.error.connect(lambda payload: events.append(payload["details"]))
+
+    verifier.start()
+
+    assert events == ["finished"]
+    assert verifier.report.is_valid
+    assert verifier.report.added == []
+    assert verifier.report.verified == [
+        "caseinfo.json",
+        "downloads.zip",
+        "downloads.zip.sha256",
+    ]
+
+
+@pytest.mark.integration
+def test_hash_worker_verify_skips_files_excluded_from_hashing(tmp_path) -> None:
+    (tmp_path / "caseinfo.json").write_bytes(b"{}")
+    (tmp_path / "video.mp4").write_bytes(b"video")
+
+    worker = hash_module.HashWorker()
+    worker.logger = _Logger()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": ["video.mp4"],
+        "hash_manifest": "jsonl",
+    }
+    worker.start()
+
+    verifier = hash_module.HashWorker()
+    verifier.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": ["video.mp4"],
+        "hash_verify": True,
+    }
+    events: list[str] = []
+    verifier.finished.connect(lambda: events.append("finished"))
+    verifier.error.connect(lambda payload: events.append(payload["details"]))
+
+    verifier.start()
+
+    assert events == ["finished"]
+    assert verifier.report.added == []
+    assert verifier.report.verified == ["caseinfo.json"]
+
+
+@pytest.mark.integration
+def test_hash_worker_verify_mode_emits_error_on_mismatch(tmp_path) -> None:
+    (tmp_path / "a.txt").write_bytes(b"abc")
+    (tmp_path / "acquisition.hash").write_text("Name: a.txt\nSize: 3\nMD5: 0\n", encoding="utf-8")
+
+    worker = hash_module.HashWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "exclude_list": [],
+        "hash_verify": True,
+    }
+
+    errors: list[dict] = []
+    worker.error.connect(lambda payload: errors.append(payload))
+
+    worker.start()
+
+    assert worker.report.modified == ["a.txt"]
+    assert errors and "modified: a.txt" in errors[0]["details"]
@@ -1,46 +1,264 @@
 from __future__ import annotations
 
+import os
+import struct
+import sys
+import threading
 from types import SimpleNamespace
 
 import pytest
 
+from fit_acquisition import capture_backend, pcap_writer
 from fit_acquisition.tasks.infinite_loop import packet_capture as packet_module
 
 
 @pytest.mark.integration
-def test_packet_capture_worker_start_and_stop(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_packet_capture_worker_start_and_stop(tmp_path) -> None:
     worker = packet_module.PacketCaptureWorker()
     worker.options = {
-        "acquisition_directory": "/tmp/acq",
+        "acquisition_directory": str(tmp_path),
         "filename": "network.pcap",
-        "output_file": "/tmp/acq/network.pcap",
     }
 
-    calls: dict[str, int] = {"start": 0, "stop": 0, "wrpcap": 0}
+    calls: dict[str, int] = {"start": 0, "stop": 0}
 
     worker.sniffer = SimpleNamespace(
-        results=["pkt"],
         start=lambda: calls.__setitem__("start", calls["start"] + 1),
         stop=lambda: calls.__setitem__("stop", calls["stop"] + 1),
     )
 
-    monkeypatch.setattr(packet_module, "QEventLoop", lambda: SimpleNamespace(exec=lambda: None, quit=lambda: None))
-    monkeypatch.setattr(packet_module.QTimer, "singleShot", lambda ms, fn: fn())
+    events: list[str] = []
+    worker.started.connect(lambda: events.append("started"))
+    worker.finished.connect(lambda: events.append("finished"))
+
+    metrics: list[dict] = []
+    worker.metrics_updated.connect(metrics.append)
+
+    worker.start()
+    worker.writer.put(b"\x00" * 60, 1700000000.5, 1)
+    worker.stop()
+
+    assert events == ["started", "finished"]
+    assert metrics[-1]["packets_written"] == 1
+    assert metrics[-1]["bytes_written"] == 76
+    assert metrics[-1]["kernel_drops"] is None
+    assert worker.get_metrics() == metrics[-1]
+    assert calls == {"start": 1, "stop": 1}
+    assert worker.writer.packets_written == 1
+
+    data = (tmp_path / "network.pcap").read_bytes()
+    assert len(data) == 24 + 16 + 60
+
+
+@pytest.mark.integration
+def test_packet_capture_worker_streams_sniffed_packets(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    worker = packet_module.PacketCaptureWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "filename": "network.pcap",
+    }
+
+    class _Sniffer:
+        def __init__(self, prn=None, store=True):
+            self.prn = prn
+            self.store = store
+
+        def start(self):
+            packet = packet_module.scapy.Ether() / packet_module.scapy.IP()
+            packet.time = 1700000000.25
+            self.prn(packet)
+
+        def stop(self):
+            return None
+
+    monkeypatch.setattr(packet_module.scapy, "AsyncSniffer", _Sniffer)
+    monkeypatch.setattr(packet_module, "build_capture_filter", lambda *args: pytest.fail("unexpected filter"))
+
+    worker.start()
+    assert worker.sniffer.store is False
+    worker.stop()
+
+    packets = packet_module.scapy.rdpcap(str(tmp_path / "network.pcap"))
+    assert len(packets) == 1
+    assert packets[0].haslayer(packet_module.scapy.IP)
+    assert float(packets[0].time) == pytest.approx(1700000000.25)
+
+
+@pytest.mark.integration
+def test_packet_capture_worker_writes_segments(tmp_path) -> None:
+    worker = packet_module.PacketCaptureWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "filename": "network.pcap",
+        "segment_size_mb": 0.0002,
+        "segment_keep": 2,
+    }
+    worker.sniffer = SimpleNamespace(start=lambda: None, stop=lambda: None)
+
+    worker.start()
+    for index in range(10):
+        worker.writer.put(b"\x00" * 60, float(index), 1)
+    worker.stop()
+
+    assert sorted(os.listdir(tmp_path)) == ["network_00004.pcap", "network_00005.pcap"]
+
+
+@pytest.mark.integration
+def test_packet_capture_worker_applies_target_filter(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    worker = packet_module.PacketCaptureWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "filename": "network.pcap",
+        "url": "https://example.com/",
+        "filter_to_target": True,
+        "extra_hosts": "cdn.example.com",
+        "iface": "eth0",
+    }
+
+    arguments: dict = {}
     monkeypatch.setattr(
         packet_module.scapy,
-        "wrpcap",
-        lambda path, data: calls.__setitem__("wrpcap", calls["wrpcap"] + 1),
+        "AsyncSniffer",
+        lambda **kwargs: arguments.update(kwargs) or SimpleNamespace(start=lambda: None, stop=lambda: None),
+    )
+    monkeypatch.setattr(
+        packet_module,
+        "build_capture_filter",
+        lambda url, extra_hosts, include_dns: f"{url}|{extra_hosts}|{include_dns}",
+    )
+
+    worker.start()
+    worker.writer.close()
+
+    assert arguments["filter"] == "https://example.com/|cdn.example.com|True"
+    assert arguments["iface"] == "eth0"
+    assert arguments["store"] is False
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("program", ["/usr/bin/tcpdump", None])
+def test_packet_capture_worker_raw_backends(monkeypatch: pytest.MonkeyPatch, tmp_path, program) -> None:
+    worker = packet_module.PacketCaptureWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "filename": "network.pcap",
+        "capture_backend": "subprocess",
+    }
+
+    monkeypatch.setattr(packet_module, "find_capture_program", lambda: program)
+    monkeypatch.setattr(packet_module.SubprocessSniffer, "start", lambda self: None)
+    monkeypatch.setattr(packet_module.RawSocketSniffer, "start", lambda self: None)
+
+    worker.start()
+    worker.writer.close()
+
+    expected = packet_module.SubprocessSniffer if program else packet_module.RawSocketSniffer
+    assert isinstance(worker.sniffer, expected)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("failing_step", ["create", "start"])
+def test_packet_capture_worker_closes_writer_when_start_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path, failing_step: str
+) -> None:
+    worker = packet_module.PacketCaptureWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "filename": "network.pcap",
+    }
+
+    def _fail(*args, **kwargs):
+        raise OSError("no capture permission")
+
+    def _stop():
+        raise RuntimeError("Unsupported (offline or unsupported socket)")
+
+    if failing_step == "create":
+        monkeypatch.setattr(packet_module.scapy, "AsyncSniffer", _fail)
+    else:
+        # Like scapy's AsyncSniffer, stopping a sniffer that never ran raises.
+        worker.sniffer = SimpleNamespace(start=_fail, stop=_stop)
+
+    errors: list[dict] = []
+    worker.error.connect(errors.append)
+
+    worker.start()
+
+    assert errors[0]["details"] == "no capture permission"
+    assert not any(
+        thread.name == "fit-pcap-writer" for thread in threading.enumerate()
     )
+    assert (tmp_path / "network.pcap").read_bytes()[:4] == b"\xd4\xc3\xb2\xa1"
+
+    finished: list[bool] = []
+    worker.finished.connect(lambda: finished.append(True))
+    worker.stop()
+
+    assert finished == [True]
+    assert len(errors) == 1
+    assert worker.sniffer is None
+
+
+@pytest.mark.integration
+def test_packet_capture_worker_reports_capture_program_errors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    worker = packet_module.PacketCaptureWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "filename": "network.pcap",
+        "capture_backend": "subprocess",
+    }
+
+    monkeypatch.setattr(packet_module, "find_capture_program", lambda: "/usr/bin/dumpcap")
+    monkeypatch.setattr(
+        capture_backend,
+        "capture_command",
+        lambda *args: [
+            sys.executable,
+            "-c",
+            "import sys; sys.stderr.write('You do not have permission to capture');"
+            "sys.exit(2)",
+        ],
+    )
+    monkeypatch.setattr(capture_backend, "DEFAULT_STARTUP_TIMEOUT", 5)
 
     events: list[str] = []
     worker.started.connect(lambda: events.append("started"))
-    worker.finished.connect(lambda: events.append("finished"))
+    worker.error.connect(lambda payload: events.append(payload["details"]))
+
+    worker.start()
+
+    assert events == [
+        "dumpcap exited with status 2: You do not have permission to capture"
+    ]
+
+
+@pytest.mark.integration
+def test_packet_capture_worker_writes_pcapng(tmp_path) -> None:
+    worker = packet_module.PacketCaptureWorker()
+    worker.options = {
+        "acquisition_directory": str(tmp_path),
+        "filename": "network.pcapng",
+        "capture_format": "pcapng",
+        "case_info": {"name": "Case 7"},
+    }
+    worker.sniffer = SimpleNamespace(
+        start=lambda: None, stop=lambda: None, kernel_drops=lambda: 4
+    )
 
     worker.start()
+    worker.writer.put(b"\x00" * 60, 1700000000.0, 1)
     worker.stop()
 
-    assert events == ["started", "finished"]
-    assert calls == {"start": 1, "stop": 1, "wrpcap": 1}
+    data = (tmp_path / "network.pcapng").read_bytes()
+    assert data[:4] == b"\x0a\x0d\x0d\x0a"
+    assert b"case: Case 7" in data
+    assert f"acquisition directory: {tmp_path}".encode() in data
+    assert b"received=1 dropped=0 kernel_drops=4" in data
+    assert struct.pack("=HHQ", pcap_writer.ISB_IFDROP, 8, 4) in data
+    assert struct.pack("=HHQ", pcap_writer.ISB_IFRECV, 8, 5) in data
+    assert len(packet_module.scapy.rdpcap(str(tmp_path / "network.pcapng"))) == 1
 
 
 @pytest.mark.integration
@@ -56,7 +274,36 @@ def test_task_packet_capture_options_uses_controller(monkeypatch: pytest.MonkeyP
             return None
 
     task = packet_module.TaskPacketCapture(_Logger())
-    task.options = {"acquisition_directory": "/tmp/acq"}
+    task.options = {"acquisition_directory": "/tmp/acq", "url": "https://example.com/"}
 
     assert task.options["acquisition_directory"] == "/tmp/acq"
+    assert task.options["url"] == "https://example.com/"
     assert task.options["filename"] == "cap.pcap"
+
+
+@pytest.mark.integration
+def test_task_packet_capture_metrics_summary() -> None:
+    class _Logger:
+        def info(self, message: str) -> None:
+            return None
+
+    task = packet_module.TaskPacketCapture(_Logger())
+    assert task.get_metrics_summary() == ""
+
+    task.worker.metrics_updated.emit(
+        {
+            "packets_per_second": 120.4,
+            "bytes_per_second": 2048,
+            "queue_depth": 7,
+            "packets_written": 10,
+            "bytes_written": 3 * 1024 * 1024,
+            "dropped": 1,
+            "kernel_drops": 2,
+        }
+    )
+
+    summary = task.get_metrics_summary()
+    assert "120" in summary
+    assert "2.0 KB" in summary
+    assert "3.0 MB" in summary
+    assert summary.endswith("3")
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+from PySide6 import QtCore
+
+from fit_acquisition import post as post_module
+from fit_acquisition.class_names import class_names
+from fit_acquisition.tasks.tasks_handler import TasksHandler
+
+
+def _fake_task_class(name: str, events: list[str]):
+    class _FakeTask(QtCore.QObject):
+        finished = QtCore.Signal()
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.options = None
+            self.increment = 0
+
+        def start(self) -> None:
+            events.append(f"start:{name}")
+
+        def complete(self) -> None:
+            events.append(f"finish:{name}")
+            self.finished.emit()
+
+    _FakeTask.__name__ = name
+    return _FakeTask
+
+
+@pytest.mark.integration
+def test_post_acquisition_runs_independent_tasks_together() -> None:
+    handler = TasksHandler()
+    events: list[str] = []
+
+    tasks = {}
+    for key in ("SAVE_CASE_INFO", "ZIP_AND_REMOVE_FOLDER", "HASH", "REPORT", "TIMESTAMP", "PEC_AND_DOWNLOAD_EML"):
+        name = getattr(class_names, key)
+        tasks[key] = _fake_task_class(name, events)()
+        handler.add_task(tasks[key])
+
+    post = post_module.PostAcquisition(handler)
+    finished: list[bool] = []
+    post.finished.connect(lambda: finished.append(True))
+
+    options = {"type": "web", "acquisition_directory": "/tmp/acq"}
+    post.start_post_acquisition_sequence(5, options)
+
+    assert events == ["start:TaskSaveCaseInfo", "start:TaskZipAndRemoveFolder"]
+    assert options["acquisition_content_directory"] == "/tmp/acq/acquisition_page"
+    assert options["pdf_filename"] == "acquisition_report.pdf"
+
+    tasks["ZIP_AND_REMOVE_FOLDER"].complete()
+    assert events[-1] == "finish:TaskZipAndRemoveFolder"
+
+    tasks["SAVE_CASE_INFO"].complete()
+    assert events[-1] == "start:TaskHash"
+
+    for key in ("HASH", "REPORT", "TIMESTAMP", "PEC_AND_DOWNLOAD_EML"):
+        assert not finished
+        tasks[key].complete()
+
+    assert finished == [True]
+    assert events[-2:] == ["start:TaskPecAndDownloadEml", "finish:TaskPecAndDownloadEml"]
+    assert set(post.durations) == {task.__class__.__name__ for task in tasks.values()}
+    assert tasks["HASH"].increment == 5
+
+
+@pytest.mark.integration
+def test_post_acquisition_skips_missing_tasks() -> None:
+    handler = TasksHandler()
+    events: list[str] = []
+
+    report = _fake_task_class(class_names.REPORT, events)()
+    handler.add_task(report)
+
+    post = post_module.PostAcquisition(handler)
+    finished: list[bool] = []
+    post.finished.connect(lambda: finished.append(True))
+
+    post.start_post_acquisition_sequence(1, {"type": "email", "acquisition_directory": "/tmp/acq"})
+    assert events == ["start:TaskReport"]
+
+    report.complete()
+    assert finished == [True]
@@ -15,15 +15,13 @@ def test_sslcertificate_worker_saves_certificate(monkeypatch: pytest.MonkeyPatch
 
     saved: list[tuple[str, str]] = []
 
-    monkeypatch.setattr(
-        worker,
-        "_SSLCertificateWorker__check_if_peer_certificate_exist",
-        lambda url: True,
-    )
+    async def _get_peer_PEM_cert(url):
+        return "PEM-CONTENT"
+
     monkeypatch.setattr(
         worker,
         "_SSLCertificateWorker__get_peer_PEM_cert",
-        lambda url: "PEM-CONTENT",
+        _get_peer_PEM_cert,
     )
     monkeypatch.setattr(
         worker,
@@ -39,3 +37,34 @@ def test_sslcertificate_worker_saves_certificate(monkeypatch: pytest.MonkeyPatch
 
     assert events == ["started", "finished"]
     assert saved == [("/tmp/fake/server.cer", "PEM-CONTENT")]
+
+
+@pytest.mark.integration
+def test_sslcertificate_worker_reads_certificate_from_one_handshake(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    worker = ssl_module.SSLCertificateWorker()
+    worker.options = {
+        "url": "https://example.org:8443/path",
+        "acquisition_directory": "/tmp/fake",
+    }
+
+    handshakes: list[tuple[str, int]] = []
+
+    async def _peer_certificate(host, port=443, timeout=10):
+        handshakes.append((host, port))
+        return b"DER"
+
+    monkeypatch.setattr(worker.engine, "peer_certificate", _peer_certificate)
+    monkeypatch.setattr(ssl_module.ssl, "DER_cert_to_PEM_cert", lambda der: "PEM")
+    saved: list[str] = []
+    monkeypatch.setattr(
+        worker,
+        "_SSLCertificateWorker__save_PEM_cert_to_CER_cert",
+        lambda path, cert: saved.append(cert),
+    )
+
+    worker.start()
+
+    assert handshakes == [("example.org", 8443)]
+    assert saved == ["PEM"]
@@ -48,6 +48,44 @@ def test_traceroute_worker_writes_lines(monkeypatch: pytest.MonkeyPatch) -> None
     handle.write.assert_called()
 
 
+@pytest.mark.integration
+def test_traceroute_worker_cancelled_writes_nothing(monkeypatch: pytest.MonkeyPatch) -> None:
+    worker = traceroute_module.TracerouteWorker()
+    worker.options = {
+        "url": "https://example.org",
+        "acquisition_directory": "/tmp/acq",
+        "traceroute_timeout": 3,
+    }
+
+    timeouts: list[int] = []
+
+    def _sr(*args, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        worker.cancel()
+        return [], []
+
+    class _FakeIP:
+        def __truediv__(self, other):
+            return self
+
+    monkeypatch.setattr(traceroute_module.scapy, "TCP", lambda *a, **k: None)
+    monkeypatch.setattr(traceroute_module.scapy, "IP", lambda **kwargs: _FakeIP())
+    monkeypatch.setattr(traceroute_module.scapy, "RandShort", lambda: 11)
+    monkeypatch.setattr(traceroute_module.scapy, "sr", _sr)
+    mocked_open = mock_open()
+    monkeypatch.setattr("builtins.open", mocked_open)
+
+    events: list[str] = []
+    worker.finished.connect(lambda: events.append("finished"))
+    worker.error.connect(lambda payload: events.append("error"))
+
+    worker.start()
+
+    assert timeouts == [3]
+    assert events == []
+    mocked_open.assert_not_called()
+
+
 @pytest.mark.integration
 def test_task_traceroute_start_uses_translation(monkeypatch: pytest.MonkeyPatch) -> None:
     class _Logger:
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import zipfile
+from contextlib import nullcontext
+
 import pytest
 
 from fit_common.core import AcquisitionType
+from fit_acquisition.hash_engine import DEFAULT_ALGORITHMS, hash_file
+from fit_acquisition.hash_registry import DigestRegistry
 from fit_acquisition.tasks.post_acquisition import zip_and_remove_folder as zip_module
+from fit_acquisition.zip_engine import verify_member
 
 
 @pytest.mark.integration
@@ -19,10 +25,11 @@ def test_zip_worker_archives_and_removes(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setattr(zip_module.os.path, "isdir", lambda path: True)
     monkeypatch.setattr(zip_module.os, "listdir", lambda path: ["one"])
     monkeypatch.setattr(
-        zip_module.shutil,
-        "make_archive",
-        lambda base, fmt, root: calls["archive"].append(base),
+        zip_module,
+        "make_zip",
+        lambda base, root, *args, **kwargs: calls["archive"].append(base),
     )
+    monkeypatch.setattr(zip_module, "open_hashed", lambda path, *args, **kwargs: nullcontext())
     monkeypatch.setattr(
         zip_module.shutil,
         "rmtree",
@@ -55,3 +62,65 @@ def test_task_zip_start_delegates(monkeypatch: pytest.MonkeyPatch) -> None:
     task.start()
 
     assert calls == [task.translations["ZIP_AND_REMOVE_FOLDER_STARTED"]]
+
+
+@pytest.mark.integration
+def test_zip_worker_builds_archives_concurrently(tmp_path) -> None:
+    content = tmp_path / "acquisition_mail"
+    downloads = tmp_path / "downloads"
+    screenshot = tmp_path / "screenshot"
+    for folder in (content, downloads, screenshot):
+        folder.mkdir()
+    (content / "message.eml").write_bytes(b"From: a@b\n" * 100)
+    (downloads / "file.pdf").write_bytes(b"%PDF" * 100)
+    (screenshot / "full.png").write_bytes(b"PNG" * 100)
+
+    worker = zip_module.ZipAndRemoveFolderWorker()
+    worker.options = {
+        "type": AcquisitionType.EMAIL,
+        "acquisition_directory": str(tmp_path),
+        "acquisition_content_directory": str(content),
+        "zip_max_workers": 2,
+    }
+
+    events: list[str] = []
+    worker.finished.connect(lambda: events.append("finished"))
+
+    worker.start()
+
+    assert events == ["finished"]
+    for name, member in (
+        ("acquisition_mail.zip", "message.eml"),
+        ("downloads.zip", "file.pdf"),
+        ("screenshot.zip", "full.png"),
+    ):
+        with zipfile.ZipFile(tmp_path / name) as archive:
+            assert archive.testzip() is None
+            assert archive.namelist() == [member]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "acquisition_mail.zip",
+        "acquisition_mail.zip.sha256",
+        "downloads.zip",
+        "downloads.zip.sha256",
+        "screenshot.zip",
+        "screenshot.zip.sha256",
+    ]
+    assert verify_member(str(tmp_path / "downloads.zip"), "file.pdf")
+
+
+@pytest.mark.integration
+def test_zip_worker_hands_archive_digests_to_the_hash_stage(tmp_path) -> None:
+    downloads = tmp_path / "downloads"
+    downloads.mkdir()
+    (downloads / "page.html").write_bytes(b"<html></html>" * 1000)
+
+    worker = zip_module.ZipAndRemoveFolderWorker()
+    worker.digest_registry = DigestRegistry()
+    worker.options = {"type": AcquisitionType.WEB, "acquisition_directory": str(tmp_path)}
+
+    worker.start()
+
+    archive = str(tmp_path / "downloads.zip")
+    assert worker.digest_registry.lookup(archive, DEFAULT_ALGORITHMS) == hash_file(
+        archive
+    )
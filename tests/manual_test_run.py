@@ -127,7 +127,7 @@ if __name__ == "__main__":
     }
     acquisition.load_tasks()
 
-    window.tasks_info = TasksInfo(parent=window)
+    window.tasks_info = TasksInfo(parent=window, task_handler=acquisition.task_handler)
     window.tasks_info.setWindowFlags(Qt.WindowType.Widget)
     window.tasks_info.setAutoFillBackground(True)
     window.tasks_info.setGeometry(window.rect())
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+from PySide6 import QtCore
+
+from fit_acquisition import batch as batch_module
+from fit_acquisition.logger import LogConfigTools
+from fit_acquisition.tasks.network_tools import whois as whois_module
+
+
+class _FakeAcquisition(QtCore.QObject):
+    start_tasks_finished = QtCore.Signal()
+    stop_tasks_finished = QtCore.Signal()
+    post_acquisition_finished = QtCore.Signal()
+
+    instances: list["_FakeAcquisition"] = []
+    running = 0
+    max_running = 0
+
+    def __init__(self, logger, packages, logger_scope=None) -> None:
+        super().__init__()
+        self.logger = logger
+        self.logger_scope = logger_scope
+        self.events: list[str] = []
+        _FakeAcquisition.instances.append(self)
+
+    def load_tasks(self) -> None:
+        _FakeAcquisition.running += 1
+        _FakeAcquisition.max_running = max(
+            _FakeAcquisition.max_running, _FakeAcquisition.running
+        )
+        self.events.append("load")
+
+    def log_start_message(self) -> None:
+        self.events.append("log_start")
+
+    def run_start_tasks(self) -> None:
+        self.start_tasks_finished.emit()
+
+    def log_stop_message(self) -> None:
+        self.events.append("log_stop")
+
+    def run_stop_tasks(self) -> None:
+        QtCore.QTimer.singleShot(5, self.stop_tasks_finished.emit)
+
+    def start_post_acquisition(self) -> None:
+        self.post_acquisition_finished.emit()
+
+    def log_end_message(self) -> None:
+        self.events.append("log_end")
+
+    def unload_tasks(self) -> None:
+        _FakeAcquisition.running -= 1
+        self.events.append("unload")
+
+
+@pytest.fixture
+def fake_acquisition(monkeypatch: pytest.MonkeyPatch):
+    _FakeAcquisition.instances = []
+    _FakeAcquisition.running = 0
+    _FakeAcquisition.max_running = 0
+    monkeypatch.setattr(batch_module, "Acquisition", _FakeAcquisition)
+    return _FakeAcquisition
+
+
+@pytest.mark.unit
+def test_acquisition_directory_name_is_unique_and_safe() -> None:
+    assert batch_module.acquisition_directory_name(3, "https://example.org/a?b") == (
+        "0003_example.org"
+    )
+    assert batch_module.acquisition_directory_name(12, "not a url") == "0012_not_a_url"
+
+
+@pytest.mark.unit
+def test_acquisitions_per_hour() -> None:
+    assert batch_module.acquisitions_per_hour(10, 60) == 600
+    assert batch_module.acquisitions_per_hour(10, 0) == 0.0
+
+
+@pytest.mark.unit
+def test_batch_runner_runs_targets_with_bounded_concurrency(
+    qapp, tmp_path: Path, fake_acquisition
+) -> None:
+    acquired: list[tuple[str, str, str]] = []
+
+    def _acquire(target: str, directory: str) -> None:
+        acquired.append((target, directory, threading.current_thread().name))
+        if "broken" in target:
+            raise RuntimeError("capture failed")
+
+    targets = [f"https://site{i}.example" for i in range(5)] + ["https://broken.example"]
+    runner = batch_module.BatchAcquisitionRunner(
+        str(tmp_path),
+        options={"exclude_list": [], "type": "web"},
+        acquire=_acquire,
+        max_concurrent=2,
+    )
+    finished: list[dict] = []
+    runner.acquisition_finished.connect(finished.append)
+
+    report = runner.run(targets)
+
+    assert report["targets"] == 6
+    assert report["completed"] == 5
+    assert report["failed"] == 1
+    assert report["acquisitions_per_hour"] > 0
+    assert len(finished) == 6
+    assert fake_acquisition.max_running == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "0001_site0.example",
+        "0002_site1.example",
+        "0003_site2.example",
+        "0004_site3.example",
+        "0005_site4.example",
+        "0006_broken.example",
+    ]
+    assert {thread for _, _, thread in acquired} != {threading.current_thread().name}
+
+    failed = [result for result in report["results"] if result["error"]]
+    assert failed[0]["target"] == "https://broken.example"
+    assert failed[0]["error"] == "capture failed"
+
+    scopes = [acquisition.logger_scope for acquisition in fake_acquisition.instances]
+    assert len(set(scopes)) == 6
+    assert fake_acquisition.instances[0].logger.name == "batch.1.scraper.web"
+    assert fake_acquisition.instances[0].events == [
+        "load",
+        "log_start",
+        "log_stop",
+        "log_end",
+        "unload",
+    ]
+    assert "log_end" not in fake_acquisition.instances[-1].events
+
+
+@pytest.mark.unit
+def test_batch_runner_without_targets_reports_immediately(qapp, tmp_path: Path) -> None:
+    runner = batch_module.BatchAcquisitionRunner(str(tmp_path))
+
+    report = runner.run([])
+
+    assert report["targets"] == 0
+    assert report["acquisitions_per_hour"] == 0.0
+
+
+@pytest.mark.unit
+def test_log_config_scope_writes_to_its_own_directory(tmp_path: Path) -> None:
+    directories = []
+    configs = []
+    for scope in ("batch.1", "batch.2"):
+        directory = tmp_path / scope
+        directory.mkdir()
+        config = LogConfigTools()
+        config.change_filehandlers_path(str(directory))
+        config.configure_scope(scope)
+        directories.append(directory)
+        configs.append(config)
+
+    logging.getLogger("batch.1.hashreport").info("first")
+    logging.getLogger("batch.2.hashreport").info("second")
+
+    for scope, config in zip(("batch.1", "batch.2"), configs):
+        config.release_scope(scope)
+
+    assert (directories[0] / "acquisition.hash").read_text() == "first\n"
+    assert (directories[1] / "acquisition.hash").read_text() == "second\n"
+    assert logging.getLogger("batch.1.hashreport").handlers == []
+
+
+@pytest.mark.unit
+def test_worker_logger_follows_options_scope() -> None:
+    worker = whois_module.WhoisWorker()
+
+    worker.options = {"url": "example.org"}
+    assert worker.logger.name == "whois"
+
+    worker.options = {"url": "example.org", "logger_scope": "batch.7"}
+    assert worker.logger.name == "batch.7.whois"
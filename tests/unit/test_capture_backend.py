@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import io
+import socket
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from fit_acquisition import capture_backend, pcap_writer
+
+
+def _pcap_stream(frames: list[bytes]) -> bytes:
+    output = io.BytesIO()
+    output.close = lambda: None
+    writer = pcap_writer.PcapFileWriter(output, linktype=1)
+    for index, frame in enumerate(frames):
+        writer.write_packet(frame, 100.0 + index)
+    writer.close()
+    return output.getvalue()
+
+
+@pytest.mark.unit
+def test_iter_pcap_records_round_trip_and_truncation() -> None:
+    stream = _pcap_stream([b"first", b"second", b"third"])
+
+    records = list(pcap_writer.iter_pcap_records(io.BytesIO(stream[:-2])))
+
+    assert records == [(b"first", 100.0, 1, 5), (b"second", 101.0, 1, 6)]
+
+
+@pytest.mark.unit
+def test_iter_pcap_records_rejects_other_formats() -> None:
+    with pytest.raises(ValueError):
+        list(pcap_writer.iter_pcap_records(io.BytesIO(b"\x0a\x0d\x0d\x0a" + b"\x00" * 20)))
+
+
+@pytest.mark.unit
+def test_capture_command_for_each_program() -> None:
+    assert capture_backend.capture_command("/usr/bin/tcpdump", "eth0", "port 53", 128) == [
+        "/usr/bin/tcpdump", "-U", "-n", "-s", "128", "-w", "-", "-i", "eth0", "port 53",
+    ]
+    assert capture_backend.capture_command("/usr/bin/dumpcap", capture_filter="port 53", snaplen=128) == [
+        "/usr/bin/dumpcap", "-q", "-P", "-s", "128", "-w", "-", "-i", "any", "-f", "port 53",
+    ]
+
+
+@pytest.mark.unit
+def test_raw_socket_sniffer_passes_undissected_frames() -> None:
+    reader, sender = socket.socketpair()
+    received: list[tuple] = []
+    arguments: dict = {}
+
+    class _Socket:
+        def fileno(self) -> int:
+            return reader.fileno()
+
+        def recv_raw(self):
+            return None, reader.recv(65535), 42.5
+
+        def close(self) -> None:
+            reader.close()
+
+    def factory(**kwargs):
+        arguments.update(kwargs)
+        return _Socket()
+
+    sniffer = capture_backend.RawSocketSniffer(
+        lambda *packet: received.append(packet), factory, filter="port 53", timeout=0.01
+    )
+    sniffer.start()
+    sender.send(b"frame")
+    deadline = time.monotonic() + 5
+    while not received and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sniffer.stop()
+    sender.close()
+
+    assert arguments == {"filter": "port 53"}
+    assert received == [(b"frame", 42.5, None)]
+    assert sniffer.packets == 1
+
+
+@pytest.mark.unit
+def test_subprocess_sniffer_reads_pcap_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    stream = io.BytesIO(_pcap_stream([b"a", b"bb"]))
+    commands: list[list[str]] = []
+
+    def popen(command, **kwargs):
+        commands.append(command)
+        return SimpleNamespace(
+            stdout=stream,
+            terminate=lambda: None,
+            wait=lambda timeout=None: 0,
+            poll=lambda: None,
+        )
+
+    monkeypatch.setattr(capture_backend.subprocess, "Popen", popen)
+    received: list[tuple] = []
+
+    sniffer = capture_backend.SubprocessSniffer(lambda *packet: received.append(packet), "tcpdump")
+    sniffer.start()
+    sniffer.stop()
+
+    assert commands == [sniffer.command]
+    assert received == [(b"a", 100.0, 1, 1), (b"bb", 101.0, 1, 2)]
+    assert sniffer.error is None
+
+
+def _fake_program(monkeypatch: pytest.MonkeyPatch, script: str) -> None:
+    monkeypatch.setattr(
+        capture_backend,
+        "capture_command",
+        lambda *args: [sys.executable, "-c", script],
+    )
+
+
+@pytest.mark.unit
+def test_subprocess_sniffer_reports_a_program_that_fails_to_start(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _fake_program(
+        monkeypatch,
+        "import sys; sys.stderr.write('eth9: No such device exists'); sys.exit(1)",
+    )
+    sniffer = capture_backend.SubprocessSniffer(
+        lambda *packet: None, "/usr/bin/dumpcap", startup_timeout=5
+    )
+
+    with pytest.raises(RuntimeError, match="dumpcap exited with status 1: eth9: No such"):
+        sniffer.start()
+
+    sniffer.stop()
+
+
+@pytest.mark.unit
+def test_subprocess_sniffer_reports_a_program_that_dies_while_capturing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frames = _pcap_stream([b"a"])
+    _fake_program(
+        monkeypatch,
+        "import sys, time; time.sleep(0.2); "
+        f"sys.stdout.buffer.write({frames!r}); sys.stdout.flush(); "
+        "sys.stderr.write('interface went down'); sys.exit(2)",
+    )
+    received: list[tuple] = []
+    sniffer = capture_backend.SubprocessSniffer(
+        lambda *packet: received.append(packet), "tcpdump", startup_timeout=0.05
+    )
+
+    sniffer.start()
+    deadline = time.monotonic() + 5
+    while not received and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    with pytest.raises(RuntimeError, match="status 2: interface went down"):
+        sniffer.stop()
+    assert received == [(b"a", 100.0, 1, 1)]
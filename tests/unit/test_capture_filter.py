@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from fit_acquisition import capture_filter
+
+
+def _resolver(host: str) -> list[str]:
+    return {
+        "example.com": ["2606:2800:220:1::1", "93.184.216.34"],
+        "cdn.example.com": ["93.184.216.34", "203.0.113.7"],
+    }.get(host, [])
+
+
+@pytest.mark.unit
+def test_target_host_strips_scheme_port_and_credentials() -> None:
+    assert capture_filter.target_host("https://user:pw@Example.com:8443/path") == "example.com"
+    assert capture_filter.target_host("http://[2001:db8::1]/") == "2001:db8::1"
+    assert capture_filter.target_host("") is None
+
+
+@pytest.mark.unit
+def test_build_capture_filter_from_target_and_extra_hosts() -> None:
+    result = capture_filter.build_capture_filter(
+        "https://example.com/page",
+        "cdn.example.com, 10.0.0.0/8; 192.0.2.1",
+        resolver=_resolver,
+    )
+
+    assert result == (
+        "host 2606:2800:220:1::1 or host 93.184.216.34 or host 203.0.113.7 "
+        "or net 10.0.0.0/8 or host 192.0.2.1 or port 53"
+    )
+
+
+@pytest.mark.unit
+def test_build_capture_filter_without_dns() -> None:
+    result = capture_filter.build_capture_filter(
+        "https://192.0.2.10/", include_dns=False, resolver=_resolver
+    )
+
+    assert result == "host 192.0.2.10"
+
+
+@pytest.mark.unit
+def test_build_capture_filter_unresolved_target_captures_everything() -> None:
+    assert capture_filter.build_capture_filter("https://unknown.invalid/", resolver=_resolver) is None
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from fit_acquisition import capture_metrics
+
+
+@pytest.mark.unit
+def test_capture_metrics_rates_from_writer_counters() -> None:
+    now = [100.0]
+    writer = SimpleNamespace(queue_depth=3, packets_written=0, bytes_written=0, dropped=0)
+    metrics = capture_metrics.CaptureMetrics(writer, lambda: 4, clock=lambda: now[0])
+
+    writer.packets_written = 500
+    writer.bytes_written = 1024 * 1024
+    writer.dropped = 2
+    now[0] = 102.0
+    sample = metrics.sample()
+
+    assert sample == {
+        "packets_per_second": 250.0,
+        "bytes_per_second": 512 * 1024,
+        "queue_depth": 3,
+        "packets_written": 500,
+        "bytes_written": 1024 * 1024,
+        "dropped": 2,
+        "kernel_drops": 4,
+    }
+    assert metrics.latest == sample
+
+
+@pytest.mark.unit
+def test_capture_metrics_without_kernel_counters() -> None:
+    writer = SimpleNamespace(queue_depth=0, packets_written=0, bytes_written=0, dropped=0)
+    metrics = capture_metrics.CaptureMetrics(writer, clock=lambda: 1.0)
+
+    assert metrics.sample()["kernel_drops"] is None
+    assert metrics.sample()["packets_per_second"] == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [(512, "512 B"), (2048, "2.0 KB"), (5 * 1024 * 1024, "5.0 MB"), (3 * 1024**4, "3072.0 GB")],
+)
+def test_format_bytes(size: int, expected: str) -> None:
+    assert capture_metrics.format_bytes(size) == expected
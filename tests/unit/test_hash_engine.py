@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from fit_acquisition import hash_engine
+
+
+@pytest.mark.unit
+def test_hash_file_matches_hashlib_for_every_algorithm(tmp_path) -> None:
+    data = b"fit-acquisition" * 100_000
+    path = tmp_path / "evidence.bin"
+    path.write_bytes(data)
+
+    digests = hash_engine.hash_file(
+        path, ("md5", "sha1", "sha256", "sha512", "blake2b"), buffer_size=4096
+    )
+
+    for algorithm, digest in digests.items():
+        assert digest == hashlib.new(algorithm, data).hexdigest()
+
+
+@pytest.mark.unit
+def test_hash_file_reads_each_file_once(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "evidence.bin"
+    path.write_bytes(b"x" * 10)
+
+    opened: list[str] = []
+    real_open = open
+
+    def _open(file, *args, **kwargs):
+        opened.append(str(file))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", _open)
+
+    hash_engine.hash_file(path)
+
+    assert opened == [str(path)]
+
+
+@pytest.mark.unit
+def test_normalize_algorithms_defaults_and_rejects_unknown() -> None:
+    assert hash_engine.normalize_algorithms(None) == hash_engine.DEFAULT_ALGORITHMS
+    assert hash_engine.normalize_algorithms(["SHA256", "sha256"]) == ("sha256",)
+
+    with pytest.raises(ValueError):
+        hash_engine.normalize_algorithms(["not-a-hash"])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("algorithm", ["shake_128", "SHAKE_256"])
+def test_normalize_algorithms_rejects_variable_length(algorithm: str) -> None:
+    with pytest.raises(ValueError, match="Variable-length"):
+        hash_engine.normalize_algorithms(["sha256", algorithm])
+
+    with pytest.raises(ValueError, match="Variable-length"):
+        hash_engine.register_algorithm(algorithm)
+
+
+@pytest.mark.unit
+def test_algorithm_labels_keep_legacy_names() -> None:
+    assert hash_engine.get_algorithm_label("md5") == "MD5"
+    assert hash_engine.get_algorithm_label("sha1") == "SHA-1"
+    assert hash_engine.get_algorithm_label("sha256") == "SHA-256"
+
+
+@pytest.mark.unit
+def test_hash_files_parallel_keeps_input_order(tmp_path) -> None:
+    paths = []
+    for index in range(12):
+        path = tmp_path / f"file_{index:02d}.bin"
+        path.write_bytes(bytes([index]) * (1000 * (12 - index)))
+        paths.append(path)
+
+    sequential = hash_engine.hash_files(paths, ("sha256",), max_workers=1)
+    parallel = hash_engine.hash_files(paths, ("sha256",), max_workers=4)
+
+    assert parallel == sequential
+    assert parallel[3]["sha256"] == hashlib.sha256(b"\x03" * 9000).hexdigest()
+
+
+@pytest.mark.unit
+def test_resolve_max_workers_is_bounded_by_jobs() -> None:
+    assert hash_engine.resolve_max_workers(8, 3) == 3
+    assert hash_engine.resolve_max_workers(0, 3) == 1
+    assert 1 <= hash_engine.resolve_max_workers("auto", 2) <= 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", hash_engine.BACKENDS)
+def test_hash_file_backends_agree(tmp_path, backend: str) -> None:
+    data = bytes(range(256)) * 5000
+    path = tmp_path / "evidence.bin"
+    path.write_bytes(data)
+
+    digests = hash_engine.hash_file(path, buffer_size=4096, backend=backend)
+
+    assert digests == {
+        algorithm: hashlib.new(algorithm, data).hexdigest()
+        for algorithm in hash_engine.DEFAULT_ALGORITHMS
+    }
+
+
+@pytest.mark.unit
+def test_mmap_backend_handles_empty_files(tmp_path) -> None:
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    digests = hash_engine.hash_file(path, ("sha256",), backend=hash_engine.BACKEND_MMAP)
+
+    assert digests["sha256"] == hashlib.sha256(b"").hexdigest()
+
+
+@pytest.mark.unit
+def test_select_backend_uses_threshold() -> None:
+    assert hash_engine.select_backend(10, "mmap", threshold=100) == "buffered"
+    assert hash_engine.select_backend(100, "mmap", threshold=100) == "mmap"
+
+    with pytest.raises(ValueError):
+        hash_engine.select_backend(100, "unknown", threshold=100)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from fit_acquisition import hash_manifest
+
+
+def _make_tree(root) -> None:
+    (root / "downloads" / "nested").mkdir(parents=True)
+    (root / "a.txt").write_bytes(b"a")
+    (root / "downloads" / "b.bin").write_bytes(b"bb")
+    (root / "downloads" / "nested" / "c.bin").write_bytes(b"ccc")
+    (root / "acquisition.log").write_bytes(b"log")
+
+
+@pytest.mark.unit
+def test_walk_files_is_recursive_sorted_and_excludes(tmp_path) -> None:
+    _make_tree(tmp_path)
+
+    paths = hash_manifest.walk_files(tmp_path, exclude=["acquisition.log"])
+
+    assert paths == ["a.txt", "downloads/b.bin", "downloads/nested/c.bin"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("manifest_format", hash_manifest.MANIFEST_FORMATS)
+def test_manifest_roundtrip_builds_path_index(tmp_path, manifest_format: str) -> None:
+    _make_tree(tmp_path)
+    records = [
+        hash_manifest.build_record(
+            path, os.stat(tmp_path / path), {"md5": f"md5-{path}", "sha256": f"sha-{path}"}
+        )
+        for path in hash_manifest.walk_files(tmp_path)
+    ]
+    filename = str(tmp_path / hash_manifest.manifest_filename(manifest_format))
+
+    hash_manifest.write_manifest(filename, records, manifest_format)
+    index = hash_manifest.load_manifest(filename)
+
+    assert list(index) == [record["path"] for record in records]
+    assert index["downloads/nested/c.bin"] == records[3]
+
+
+@pytest.mark.unit
+def test_manifest_filename_rejects_unknown_formats() -> None:
+    assert hash_manifest.manifest_filename("csv") == "acquisition.hash.csv"
+
+    with pytest.raises(ValueError):
+        hash_manifest.manifest_filename("xml")
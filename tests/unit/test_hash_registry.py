@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import os
+
+import pytest
+
+from fit_acquisition.hash_registry import DigestRegistry, HashingFile, open_hashed
+
+
+@pytest.fixture
+def registry() -> DigestRegistry:
+    return DigestRegistry()
+
+
+@pytest.mark.unit
+def test_registries_do_not_share_records_or_algorithms(tmp_path) -> None:
+    first = DigestRegistry()
+    second = DigestRegistry(("sha512",))
+    path = tmp_path / "server.cer"
+
+    with open_hashed(str(path), registry=first) as f:
+        f.write(b"PEM")
+
+    assert first.algorithms == ("md5", "sha1", "sha256")
+    assert second.algorithms == ("sha512",)
+    assert first.lookup(str(path), ("sha256",)) is not None
+    assert second.lookup(str(path), ("sha256",)) is None
+
+
+@pytest.mark.unit
+def test_open_hashed_without_registry_records_nothing(tmp_path) -> None:
+    path = tmp_path / "out.bin"
+
+    with open_hashed(str(path)) as f:
+        assert not isinstance(f.raw, HashingFile)
+        f.write(b"abc")
+
+    assert path.read_bytes() == b"abc"
+
+
+@pytest.mark.unit
+def test_open_hashed_binary_records_digests_on_close(tmp_path, registry: DigestRegistry) -> None:
+    path = tmp_path / "capture.pcap"
+
+    with open_hashed(str(path), registry=registry) as f:
+        f.write(b"abc")
+        f.write(memoryview(b"def"))
+
+    digests = registry.lookup(str(path), ("md5", "sha256"))
+
+    assert digests == {
+        "md5": hashlib.md5(b"abcdef").hexdigest(),
+        "sha256": hashlib.sha256(b"abcdef").hexdigest(),
+    }
+
+
+@pytest.mark.unit
+def test_open_hashed_text_hashes_encoded_bytes(tmp_path, registry: DigestRegistry) -> None:
+    path = tmp_path / "caseinfo.json"
+
+    with open_hashed(str(path), "w", encoding="utf-8", registry=registry) as f:
+        f.write('{"name": "città"}')
+
+    digests = registry.lookup(str(path), ("sha1",))
+
+    assert digests == {"sha1": hashlib.sha1(path.read_bytes()).hexdigest()}
+
+
+@pytest.mark.unit
+def test_lookup_rejects_modified_files_and_missing_algorithms(
+    tmp_path, registry: DigestRegistry
+) -> None:
+    path = tmp_path / "server.cer"
+    with open_hashed(str(path), registry=registry) as f:
+        f.write(b"PEM")
+
+    assert registry.lookup(str(path), ("sha512",)) is None
+
+    with open(path, "ab") as f:
+        f.write(b"-tampered")
+    os.utime(path, ns=(0, 0))
+
+    assert registry.lookup(str(path), ("sha256",)) is None
+
+
+@pytest.mark.unit
+def test_hashing_file_reports_its_position(tmp_path, registry: DigestRegistry) -> None:
+    raw = HashingFile(str(tmp_path / "out.bin"), registry=registry)
+    raw.write(b"12345")
+
+    assert raw.tell() == 5
+    assert raw.hexdigests()["md5"] == hashlib.md5(b"12345").hexdigest()
+
+    raw.close()
+
+
+@pytest.mark.unit
+def test_discard_directory_drops_only_its_records(tmp_path, registry: DigestRegistry) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    for folder in ("a", "b"):
+        with open_hashed(str(tmp_path / folder / "f.bin"), registry=registry) as f:
+            f.write(b"x")
+
+    registry.discard_directory(str(tmp_path / "a"))
+
+    assert registry.lookup(str(tmp_path / "a" / "f.bin"), ("md5",)) is None
+    assert registry.lookup(str(tmp_path / "b" / "f.bin"), ("md5",)) is not None
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from fit_acquisition import hash_manifest, hash_verifier
+from fit_acquisition.hash_engine import hash_file
+
+
+def _write_manifest(root) -> str:
+    records = [
+        hash_manifest.build_record(path, os.stat(root / path), hash_file(root / path))
+        for path in hash_manifest.walk_files(root)
+    ]
+    filename = str(root / hash_manifest.manifest_filename("jsonl"))
+    hash_manifest.write_manifest(filename, records)
+    return filename
+
+
+def _counting_hasher(calls: list[str]):
+    def _hasher(filename, algorithms):
+        calls.append(os.path.basename(filename))
+        return hash_file(filename, algorithms)
+
+    return _hasher
+
+
+@pytest.fixture
+def acquisition(tmp_path):
+    (tmp_path / "screenshot").mkdir()
+    (tmp_path / "video.mp4").write_bytes(b"video" * 100)
+    (tmp_path / "screenshot" / "full.png").write_bytes(b"png")
+    _write_manifest(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.unit
+def test_verify_directory_uses_cache_on_second_pass(acquisition, tmp_path_factory) -> None:
+    cache_filename = str(tmp_path_factory.mktemp("cache") / "cache.json")
+    calls: list[str] = []
+
+    cache = hash_verifier.VerificationCache(cache_filename)
+    first = hash_verifier.verify_directory(
+        acquisition, cache=cache, hasher=_counting_hasher(calls)
+    )
+    cache.save()
+
+    second = hash_verifier.verify_directory(
+        acquisition,
+        cache=hash_verifier.VerificationCache(cache_filename),
+        hasher=_counting_hasher(calls),
+    )
+
+    assert first.is_valid and sorted(first.verified) == ["screenshot/full.png", "video.mp4"]
+    assert second.is_valid and sorted(second.skipped) == ["screenshot/full.png", "video.mp4"]
+    assert sorted(calls) == ["full.png", "video.mp4"]
+
+
+@pytest.mark.unit
+def test_verify_directory_full_check_ignores_cache(acquisition) -> None:
+    cache = hash_verifier.VerificationCache()
+    hash_verifier.verify_directory(acquisition, cache=cache)
+
+    report = hash_verifier.verify_directory(acquisition, cache=cache, full=True)
+
+    assert report.skipped == []
+    assert len(report.verified) == 2
+
+
+@pytest.mark.unit
+def test_verify_directory_reports_mismatches(acquisition) -> None:
+    cache = hash_verifier.VerificationCache()
+    hash_verifier.verify_directory(acquisition, cache=cache)
+
+    stats = os.stat(acquisition / "video.mp4")
+    (acquisition / "video.mp4").write_bytes(b"VIDEO" * 100)
+    os.utime(acquisition / "video.mp4", ns=(stats.st_atime_ns, stats.st_mtime_ns + 1))
+    (acquisition / "screenshot" / "full.png").unlink()
+    (acquisition / "extra.txt").write_bytes(b"x")
+
+    report = hash_verifier.verify_directory(acquisition, cache=cache)
+
+    assert not report.is_valid
+    assert report.modified == ["video.mp4"]
+    assert report.missing == ["screenshot/full.png"]
+    assert report.added == ["extra.txt"]
+
+
+@pytest.mark.unit
+def test_verify_directory_ignores_only_top_level_post_hash_outputs(acquisition) -> None:
+    (acquisition / "acquisition_report.pdf").write_bytes(b"%PDF")
+    (acquisition / "timestamp.tsr").write_bytes(b"tsr")
+    (acquisition / "message.eml").write_bytes(b"eml")
+    (acquisition / "screenshot" / "tsa.crt").write_bytes(b"crt")
+
+    report = hash_verifier.verify_directory(acquisition)
+
+    assert report.added == ["screenshot/tsa.crt"]
+    assert not report.is_valid
+    assert hash_verifier.verify_directory(
+        acquisition, post_hash_outputs=()
+    ).added == [
+        "acquisition_report.pdf",
+        "message.eml",
+        "screenshot/tsa.crt",
+        "timestamp.tsr",
+    ]
+
+
+@pytest.mark.unit
+def test_verify_directory_skips_files_excluded_from_hashing(acquisition) -> None:
+    (acquisition / "notes.txt").write_bytes(b"not hashed")
+
+    report = hash_verifier.verify_directory(
+        acquisition, exclude=hash_verifier.DEFAULT_EXCLUDE + ("notes.txt",)
+    )
+
+    assert report.added == []
+    assert report.is_valid
+    assert hash_verifier.verify_directory(acquisition).added == ["notes.txt"]
+
+
+@pytest.mark.unit
+def test_load_legacy_hash_reads_sizes_and_labels(tmp_path) -> None:
+    filename = tmp_path / "acquisition.hash"
+    filename.write_text(
+        "Name: a.txt\nSize: 3\nSHA-1: abc\nBLAKE2b: def\n", encoding="utf-8"
+    )
+
+    assert hash_verifier.load_legacy_hash(str(filename)) == {
+        "a.txt": {
+            "path": "a.txt",
+            "size": 3,
+            "digests": {"sha1": "abc", "blake2b": "def"},
+        }
+    }
+
+
+@pytest.mark.unit
+def test_verify_directory_accepts_legacy_acquisition_hash(tmp_path) -> None:
+    (tmp_path / "a.txt").write_bytes(b"abc")
+    (tmp_path / "acquisition.hash").write_text(
+        "=========================================================\n"
+        "Name: a.txt\n"
+        "Size: 3\n"
+        "MD5: 900150983cd24fb0d6963f7d28e17f72\n"
+        "SHA-256: ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad\n",
+        encoding="utf-8",
+    )
+
+    report = hash_verifier.verify_directory(tmp_path)
+
+    assert report.is_valid
+    assert report.verified == ["a.txt"]
+
+
+@pytest.mark.unit
+def test_verify_directories_reports_folders_without_manifest(tmp_path) -> None:
+    results = dict(hash_verifier.verify_directories([str(tmp_path)]))
+
+    assert isinstance(results[str(tmp_path)], FileNotFoundError)
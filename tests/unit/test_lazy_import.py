@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from fit_acquisition import lazy_import as lazy_module
+from fit_acquisition.lazy_import import LazyImport, is_loaded
+
+
+@pytest.fixture
+def fake_module(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    module = types.ModuleType("fake_heavy_dependency")
+    module.VALUE = 42
+    module.double = lambda value: value * 2
+    monkeypatch.setitem(sys.modules, "fake_heavy_dependency", module)
+    return module
+
+
+@pytest.mark.unit
+def test_lazy_import_resolves_on_first_use(fake_module) -> None:
+    lazy = LazyImport("fake_heavy_dependency")
+    double = LazyImport("fake_heavy_dependency", "double")
+
+    assert not is_loaded(lazy)
+    assert "not loaded" in repr(lazy)
+
+    assert lazy.VALUE == 42
+    assert double(4) == 8
+    assert is_loaded(lazy) and is_loaded(double)
+
+
+@pytest.mark.unit
+def test_lazy_import_forwards_attribute_patches(
+    fake_module, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lazy = LazyImport("fake_heavy_dependency")
+
+    monkeypatch.setattr(lazy, "VALUE", 7)
+    assert fake_module.VALUE == 7
+
+    monkeypatch.undo()
+    assert fake_module.VALUE == 42
+
+
+@pytest.mark.unit
+def test_lazy_import_of_missing_module_fails_on_use() -> None:
+    lazy = LazyImport("no_such_heavy_dependency")
+
+    with pytest.raises(ModuleNotFoundError):
+        lazy.anything
+    assert not is_loaded(lazy)
+
+
+@pytest.mark.unit
+def test_lazy_import_resolves_once_across_threads(
+    fake_module, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    imports: list[str] = []
+    import_module = lazy_module.import_module
+
+    def _import_module(name):
+        imports.append(name)
+        return import_module(name)
+
+    monkeypatch.setattr(lazy_module, "import_module", _import_module)
+    lazy = LazyImport("fake_heavy_dependency")
+
+    threads = [threading.Thread(target=lambda: lazy.VALUE) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert imports == ["fake_heavy_dependency"]
+
+
+@pytest.mark.unit
+def test_task_discovery_does_not_import_heavy_dependencies() -> None:
+    probe = "\n".join(
+        [
+            "import json, sys",
+            "from fit_acquisition.tasks.task_discovery import TaskDiscovery",
+            "for package in (",
+            "    'fit_acquisition.tasks.infinite_loop',",
+            "    'fit_acquisition.tasks.network_tools',",
+            "    'fit_acquisition.tasks.post_acquisition',",
+            "):",
+            "    assert TaskDiscovery().discover(package)",
+            "heavy = ('scapy', 'requests', 'whois', 'nslookup', 'rfc3161ng')",
+            "print(json.dumps([m for m in heavy if m in sys.modules]))",
+        ]
+    )
+
+    repo_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (repo_root, env.get("PYTHONPATH")) if path
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+
+    assert json.loads(output.strip().splitlines()[-1]) == []
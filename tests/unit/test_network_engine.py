@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+
+import pytest
+
+from fit_acquisition.tasks.network_engine import EngineWorkerThread, NetworkEngine
+from fit_acquisition.tasks.task_worker import AsyncTaskWorker
+
+
+class _ProbeWorker(AsyncTaskWorker):
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__()
+        self.delay = delay
+        self.threads: list[str] = []
+
+    async def run(self) -> None:
+        self.started.emit()
+        await asyncio.sleep(self.delay)
+        self.threads.append(threading.current_thread().name)
+        self.finished.emit()
+
+
+@pytest.mark.unit
+def test_network_engine_is_a_singleton() -> None:
+    assert NetworkEngine() is NetworkEngine()
+
+
+@pytest.mark.unit
+def test_async_workers_share_the_engine_loop_thread() -> None:
+    workers = [_ProbeWorker(0.05) for _ in range(20)]
+    handles = [EngineWorkerThread(worker) for worker in workers]
+
+    for handle in handles:
+        handle.start()
+    assert all(handle.wait(5) for handle in handles)
+
+    assert {name for worker in workers for name in worker.threads} == {
+        "network-engine-loop"
+    }
+    assert all(handle.isFinished() and not handle.isRunning() for handle in handles)
+
+
+@pytest.mark.unit
+def test_async_worker_start_runs_to_completion() -> None:
+    worker = _ProbeWorker()
+    events: list[str] = []
+    worker.started.connect(lambda: events.append("started"))
+    worker.finished.connect(lambda: events.append("finished"))
+
+    worker.start()
+
+    assert events == ["started", "finished"]
+
+
+@pytest.mark.unit
+def test_async_worker_cancel_stops_pending_coroutine() -> None:
+    worker = _ProbeWorker(30)
+    handle = EngineWorkerThread(worker)
+
+    handle.start()
+    worker.cancel()
+
+    assert handle.wait(5)
+    assert worker.is_cancelled
+    assert worker.threads == []
+
+
+@pytest.mark.unit
+def test_network_engine_resolves_each_host_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = NetworkEngine()
+    engine.clear_cache()
+    calls: list[str] = []
+
+    async def _getaddrinfo(self, host, port, **kwargs):
+        calls.append(host)
+        await asyncio.sleep(0.01)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", port))]
+
+    monkeypatch.setattr(type(engine.loop), "getaddrinfo", _getaddrinfo)
+
+    async def _probe_many():
+        return await asyncio.gather(
+            *(engine.resolve("example.org", 443) for _ in range(5))
+        )
+
+    assert engine.run(_probe_many(), 5) == ["10.0.0.1"] * 5
+    assert calls == ["example.org"]
+    engine.clear_cache()
+
+
+@pytest.mark.unit
+def test_network_engine_runs_blocking_calls_off_the_loop() -> None:
+    engine = NetworkEngine()
+
+    async def _probe():
+        return await engine.run_blocking(lambda: threading.current_thread().name)
+
+    assert engine.run(_probe(), 5).startswith("network-engine")
+    assert engine.run(_probe(), 5) != "network-engine-loop"
+
+
+@pytest.mark.unit
+def test_task_runs_async_worker_on_the_engine(qapp) -> None:
+    from fit_common.gui.utils import State
+
+    from fit_acquisition.tasks.task import Task
+
+    class _Logger:
+        def info(self, message: str) -> None:
+            return None
+
+    task = Task(_Logger(), None, None, label="HEADERS", worker_class=_ProbeWorker)
+    task.options = {}
+
+    assert isinstance(task.worker_thread, EngineWorkerThread)
+
+    task.start_task("")
+    assert task.worker_thread.wait(5)
+    qapp.processEvents()
+
+    assert task.state == State.COMPLETED
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+
+import pytest
+from fit_common.gui.utils import State, Status
+from PySide6 import QtCore
+
+from fit_acquisition.tasks.network_engine import NetworkEngine
+from fit_acquisition.tasks.network_tools_runner import NetworkToolsRunner
+
+
+class _FakeTool(QtCore.QObject):
+    finished = QtCore.Signal()
+
+    def __init__(self, name: str, events: list[str]) -> None:
+        super().__init__()
+        self.name = name
+        self.events = events
+        self.state = State.INITIALIZATED
+        self.status = Status.SUCCESS
+        self.details = ""
+
+    def start(self) -> None:
+        self.state = State.STARTED
+        self.events.append(f"start:{self.name}")
+
+    def complete(self) -> None:
+        self.state = State.COMPLETED
+        self.finished.emit()
+
+    def cancel(self, details: str = "") -> None:
+        self.events.append(f"cancel:{self.name}")
+        self.status = Status.FAILURE
+        self.details = details
+        self.complete()
+
+
+@pytest.mark.unit
+def test_runner_caps_concurrency_and_reports_latency(qapp) -> None:
+    events: list[str] = []
+    tools = [_FakeTool(name, events) for name in ("whois", "headers", "traceroute")]
+    runner = NetworkToolsRunner()
+    reports: list[dict] = []
+    runner.finished.connect(reports.append)
+
+    runner.run(tools, max_concurrent=2)
+    assert events == ["start:whois", "start:headers"]
+
+    tools[1].complete()
+    assert events[-1] == "start:traceroute"
+
+    tools[0].complete()
+    tools[2].complete()
+
+    assert len(reports) == 1
+    assert reports == [runner.latencies]
+    assert list(reports[0]) == ["_FakeTool"]
+    assert not runner.is_running
+
+
+@pytest.mark.unit
+def test_runner_deadline_cancels_waiting_and_running_tools(qapp) -> None:
+    events: list[str] = []
+    tools = [_FakeTool(name, events) for name in ("whois", "headers", "traceroute")]
+    runner = NetworkToolsRunner()
+    reports: list[dict] = []
+    runner.finished.connect(reports.append)
+
+    runner.run(tools, max_concurrent=1, deadline=0.05)
+    deadline = QtCore.QDeadlineTimer(5000)
+    while not reports and not deadline.hasExpired():
+        qapp.processEvents()
+
+    assert events == ["start:whois", "cancel:headers", "cancel:traceroute", "cancel:whois"]
+    assert [tool.status for tool in tools] == [Status.FAILURE] * 3
+    assert "0.05" in tools[0].details
+    assert len(runner.cancelled) == 3
+    assert len(reports) == 1
+
+
+@pytest.mark.unit
+def test_runner_without_tools_finishes_immediately(qapp) -> None:
+    runner = NetworkToolsRunner()
+    reports: list[dict] = []
+    runner.finished.connect(reports.append)
+
+    runner.run([])
+
+    assert reports == [{}]
+
+
+@pytest.mark.unit
+def test_runner_resolves_hosts_again_on_every_run(
+    qapp, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = NetworkEngine()
+    addresses = iter(["10.0.0.1", "10.0.0.2"])
+    resolved: list[str] = []
+
+    async def _getaddrinfo(self, host, port, **kwargs):
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (next(addresses), port))]
+
+    monkeypatch.setattr(type(engine.loop), "getaddrinfo", _getaddrinfo)
+
+    class _ResolvingTool(_FakeTool):
+        def start(self) -> None:
+            super().start()
+            resolved.append(engine.run(engine.resolve("example.org"), 5))
+            self.complete()
+
+    runner = NetworkToolsRunner()
+    runner.run([_ResolvingTool("whois", [])])
+    runner.run([_ResolvingTool("whois", [])])
+
+    assert resolved == ["10.0.0.1", "10.0.0.2"]
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import io
+import os
+import struct
+import threading
+
+import pytest
+
+from fit_acquisition import pcap_writer
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.packets: list[tuple] = []
+        self.flushes = 0
+        self.closed = False
+
+    def write_packet(self, data, timestamp, linktype=None, wirelen=None):
+        self.packets.append((data, timestamp, linktype))
+        return 16 + len(data)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.unit
+def test_pcap_file_writer_layout() -> None:
+    output = io.BytesIO()
+    output.close = lambda: None
+    writer = pcap_writer.PcapFileWriter(output, snaplen=8)
+
+    assert writer.write_packet(b"0123456789", 10.5, linktype=113) == 16 + 8
+    writer.close()
+
+    data = output.getvalue()
+    magic, major, minor, _, _, snaplen, linktype = struct.unpack("=IHHiIII", data[:24])
+    assert (magic, major, minor, snaplen, linktype) == (0xA1B2C3D4, 2, 4, 8, 113)
+    assert struct.unpack("=IIII", data[24:40]) == (10, 500000, 8, 10)
+    assert data[40:] == b"01234567"
+
+
+@pytest.mark.unit
+def test_pcap_file_writer_empty_capture_has_header() -> None:
+    output = io.BytesIO()
+    output.close = lambda: None
+    pcap_writer.PcapFileWriter(output).close()
+
+    assert len(output.getvalue()) == 24
+    assert struct.unpack("=I", output.getvalue()[20:24]) == (pcap_writer.DLT_EN10MB,)
+
+
+@pytest.mark.unit
+def test_streaming_writer_keeps_order_and_closes() -> None:
+    writer = _Writer()
+    streaming = pcap_writer.StreamingPacketWriter(lambda: writer, flush_interval=0.01)
+    streaming.start()
+
+    for index in range(100):
+        assert streaming.put(bytes([index]), float(index))
+    streaming.close()
+
+    assert [packet[0] for packet in writer.packets] == [bytes([i]) for i in range(100)]
+    assert streaming.packets_written == 100
+    assert streaming.bytes_written == 100 * 17
+    assert streaming.dropped == 0
+    assert writer.closed
+
+
+@pytest.mark.unit
+def test_streaming_writer_drops_when_queue_is_full() -> None:
+    release = threading.Event()
+    writer = _Writer()
+
+    def write_packet(data, timestamp, linktype=None, wirelen=None):
+        release.wait()
+        return _Writer.write_packet(writer, data, timestamp, linktype)
+
+    writer.write_packet = write_packet
+    streaming = pcap_writer.StreamingPacketWriter(lambda: writer, max_queue=2)
+    streaming.start()
+
+    results = [streaming.put(b"x", 0.0) for _ in range(10)]
+    release.set()
+    streaming.close()
+
+    assert results.count(False) == streaming.dropped
+    assert streaming.dropped >= 7
+    assert streaming.packets_written + streaming.dropped == 10
+
+
+@pytest.mark.unit
+def test_streaming_writer_reraises_write_errors() -> None:
+    writer = _Writer()
+
+    def write_packet(data, timestamp, linktype=None, wirelen=None):
+        raise OSError("disk full")
+
+    writer.write_packet = write_packet
+    streaming = pcap_writer.StreamingPacketWriter(lambda: writer, flush_interval=0.01)
+    streaming.start()
+    streaming.put(b"x", 0.0)
+    streaming.put(b"y", 0.0)
+
+    with pytest.raises(OSError):
+        streaming.close()
+    assert writer.closed
+
+
+def _open_segment(filename):
+    return pcap_writer.PcapFileWriter(open(filename, "wb"))
+
+
+@pytest.mark.unit
+def test_segment_filename_keeps_extension() -> None:
+    assert pcap_writer.segment_filename("/acq/network.pcap", 3) == "/acq/network_00003.pcap"
+
+
+@pytest.mark.unit
+def test_segmented_writer_rotates_by_size(tmp_path) -> None:
+    writer = pcap_writer.SegmentedPacketWriter(
+        str(tmp_path / "network.pcap"), _open_segment, max_bytes=120
+    )
+    for index in range(5):
+        writer.write_packet(b"x" * 40, float(index))
+    writer.close()
+
+    assert [os.path.basename(f) for f in writer.segments] == [
+        "network_00001.pcap",
+        "network_00002.pcap",
+        "network_00003.pcap",
+    ]
+    sizes = [os.path.getsize(f) for f in writer.segments]
+    assert sizes == [24 + 2 * 56, 24 + 2 * 56, 24 + 56]
+
+
+@pytest.mark.unit
+def test_segmented_writer_rotates_by_time_and_keeps_last(tmp_path) -> None:
+    removed: list[str] = []
+    writer = pcap_writer.SegmentedPacketWriter(
+        str(tmp_path / "network.pcap"),
+        _open_segment,
+        max_seconds=10,
+        keep=2,
+        on_segment_removed=removed.append,
+    )
+    for timestamp in (0.0, 5.0, 10.0, 25.0, 26.0, 40.0):
+        writer.write_packet(b"x", timestamp)
+    writer.close()
+
+    assert [os.path.basename(f) for f in writer.segments] == [
+        "network_00003.pcap",
+        "network_00004.pcap",
+    ]
+    assert sorted(os.listdir(tmp_path)) == ["network_00003.pcap", "network_00004.pcap"]
+    assert [os.path.basename(f) for f in removed] == [
+        "network_00001.pcap",
+        "network_00002.pcap",
+    ]
+
+
+@pytest.mark.unit
+def test_segmented_writer_empty_capture_creates_one_segment(tmp_path) -> None:
+    writer = pcap_writer.SegmentedPacketWriter(
+        str(tmp_path / "network.pcap"), _open_segment, max_bytes=100
+    )
+    writer.close()
+
+    assert os.listdir(tmp_path) == ["network_00001.pcap"]
+
+
+def _pcapng_blocks(data: bytes) -> list[tuple[int, bytes]]:
+    blocks = []
+    offset = 0
+    while offset < len(data):
+        block_type, length = struct.unpack("=II", data[offset : offset + 8])
+        assert struct.unpack("=I", data[offset + length - 4 : offset + length]) == (length,)
+        blocks.append((block_type, data[offset + 8 : offset + length - 4]))
+        offset += length
+    return blocks
+
+
+@pytest.mark.unit
+def test_pcapng_writer_records_metadata_and_statistics(tmp_path) -> None:
+    from scapy.utils import rdpcap
+
+    filename = tmp_path / "network.pcapng"
+    writer = pcap_writer.PcapngFileWriter(
+        open(filename, "wb"),
+        comments=("case: Case 1", "acquisition directory: /acq"),
+        application="fit-acquisition 1.0",
+        statistics=lambda: (5, 2, 3),
+    )
+    writer.write_packet(b"\x00" * 61, 1700000000.25, linktype=1)
+    writer.write_packet(b"\x01" * 20, 1700000001.0, linktype=101)
+    writer.close()
+
+    data = filename.read_bytes()
+    blocks = _pcapng_blocks(data)
+    assert [block_type for block_type, _ in blocks] == [
+        pcap_writer.PCAPNG_SHB,
+        pcap_writer.PCAPNG_IDB,
+        pcap_writer.PCAPNG_EPB,
+        pcap_writer.PCAPNG_IDB,
+        pcap_writer.PCAPNG_EPB,
+        pcap_writer.PCAPNG_ISB,
+        pcap_writer.PCAPNG_ISB,
+    ]
+    assert b"case: Case 1" in blocks[0][1]
+    assert b"acquisition directory: /acq" in blocks[0][1]
+    assert b"fit-acquisition 1.0" in blocks[0][1]
+
+    statistics = blocks[-1][1]
+    assert struct.pack("=HHQ", pcap_writer.ISB_IFRECV, 8, 8) in statistics
+    assert struct.pack("=HHQ", pcap_writer.ISB_IFDROP, 8, 3) in statistics
+    assert struct.pack("=HHQ", pcap_writer.ISB_OSDROP, 8, 2) in statistics
+    assert struct.pack("=HHQ", pcap_writer.ISB_USRDELIV, 8, 3) in statistics
+
+    packets = rdpcap(str(filename))
+    assert len(packets) == 2
+    assert float(packets[0].time) == pytest.approx(1700000000.25)
+    assert bytes(packets[0]) == b"\x00" * 61
+
+
+@pytest.mark.unit
+def test_pcapng_writer_leaves_out_unknown_kernel_drops(tmp_path) -> None:
+    filename = tmp_path / "network.pcapng"
+    writer = pcap_writer.PcapngFileWriter(
+        open(filename, "wb"), statistics=lambda: (4, 1, None)
+    )
+    writer.close()
+
+    statistics = _pcapng_blocks(filename.read_bytes())[-1][1]
+    assert struct.pack("=HHQ", pcap_writer.ISB_IFRECV, 8, 4) in statistics
+    assert struct.pack("=HHQ", pcap_writer.ISB_OSDROP, 8, 1) in statistics
+    assert struct.pack("=HH", pcap_writer.ISB_IFDROP, 8) not in statistics
+
+
+@pytest.mark.unit
+def test_pcapng_writer_empty_capture_is_valid(tmp_path) -> None:
+    filename = tmp_path / "network.pcapng"
+    pcap_writer.PcapngFileWriter(open(filename, "wb")).close()
+
+    blocks = _pcapng_blocks(filename.read_bytes())
+    assert [block_type for block_type, _ in blocks] == [
+        pcap_writer.PCAPNG_SHB,
+        pcap_writer.PCAPNG_IDB,
+    ]
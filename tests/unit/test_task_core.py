@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import time
 from types import SimpleNamespace
 
 import pytest
 from fit_common.gui.utils import State, Status
 
+from fit_acquisition.hash_registry import DigestRegistry
 from fit_acquisition.tasks.task import Task
 from fit_acquisition.tasks.task_worker import TaskWorker
 from fit_acquisition.tasks.tasks_handler import TasksHandler
+from fit_acquisition.tasks.worker_pool import BoundedWorkerPool, WorkerPool
 
 
 class _Logger:
@@ -68,14 +71,10 @@ def test_task_handle_error_sets_failure_details() -> None:
 
 
 @pytest.mark.unit
-def test_tasks_handler_singleton_and_state_match() -> None:
+def test_tasks_handlers_are_independent_and_state_match() -> None:
     handler1 = TasksHandler()
     handler2 = TasksHandler()
 
-    handler1.clear_tasks()
-    handler1.add_task(SimpleNamespace(__class__=SimpleNamespace(__name__="TaskA"), state=State.COMPLETED))
-
-    # SimpleNamespace doesn't let us set __class__.__name__ reliably for get_task.
     class _TaskA:
         state = State.COMPLETED
 
@@ -84,10 +83,133 @@ def test_tasks_handler_singleton_and_state_match() -> None:
 
     t1 = _TaskA()
     t2 = _TaskB()
-    handler1.clear_tasks()
     handler1.add_task(t1)
     handler1.add_task(t2)
 
-    assert handler1 is handler2
+    assert handler1 is not handler2
+    assert handler2.get_tasks() == []
+    assert handler2.get_task("_TaskA") is None
     assert handler1.get_task("_TaskA") is t1
     assert handler1.are_task_names_in_the_same_state(["_TaskA", "_TaskB"], State.COMPLETED) is True
+
+
+@pytest.mark.unit
+def test_tasks_handler_tracks_task_state_transitions() -> None:
+    handler = TasksHandler()
+
+    class _TaskA(Task):
+        pass
+
+    class _TaskB(Task):
+        pass
+
+    a = _TaskA(_Logger(), None, None, task_handler=handler)
+    b = _TaskB(_Logger(), None, None, task_handler=handler)
+    handler.add_task(a)
+    names = ["_TaskA", "_TaskB", "Missing"]
+
+    assert handler.get_tasks() == [a, b]
+    assert a.task_handler is handler
+    assert handler.get_task("_TaskB") is b
+    assert handler.count_tasks_in_state(State.INITIALIZATED) == 2
+    assert handler.are_task_names_in_the_same_state(names, State.STARTED) is False
+
+    a.state = State.STARTED
+    assert handler.are_task_names_in_the_same_state(names, State.STARTED) is False
+
+    b.update_task(State.STARTED, Status.SUCCESS)
+    assert handler.are_task_names_in_the_same_state(names, State.STARTED) is True
+    assert handler.count_tasks_in_state(State.STARTED) == 2
+
+    a.state = State.COMPLETED
+    assert handler.are_task_names_in_the_same_state(names, State.STARTED) is False
+    assert handler.are_task_names_in_the_same_state(["_TaskA"], State.COMPLETED) is True
+    assert handler.are_task_names_in_the_same_state(["Missing"], State.COMPLETED) is False
+    assert handler.count_tasks_in_state(State.INITIALIZATED) == 0
+
+    handler.clear_tasks()
+    assert handler.get_task("_TaskA") is None
+    assert handler.count_tasks_in_state(State.COMPLETED) == 0
+
+
+class _QuickWorker(TaskWorker):
+    def start(self) -> None:
+        self.started.emit()
+        self.finished.emit()
+
+
+@pytest.mark.unit
+def test_task_teardown_follows_worker_completion(qapp) -> None:
+    task = Task(_Logger(), None, None, label="HEADERS", worker_class=_QuickWorker)
+    task.options = {}
+
+    begin = time.perf_counter()
+    task.start_task("start-msg")
+    deadline = begin + 5
+    while task.state != State.COMPLETED and time.perf_counter() < deadline:
+        qapp.processEvents()
+    elapsed = time.perf_counter() - begin
+
+    assert task.state == State.COMPLETED
+    assert task.worker_thread.isFinished()
+    assert elapsed < 0.5
+
+
+@pytest.mark.unit
+def test_task_workers_use_their_handler_registry_and_pool(qapp) -> None:
+    bounded = BoundedWorkerPool(1)
+    handlers = [
+        TasksHandler(digest_registry=DigestRegistry(["sha512"])),
+        TasksHandler(worker_pool=bounded),
+    ]
+    tasks = [
+        Task(_Logger(), None, None, worker_class=_QuickWorker, task_handler=handler)
+        for handler in handlers
+    ]
+
+    for task in tasks:
+        task.options = {}
+        task.start_task("start-msg")
+        assert task.worker_thread.wait(5)
+
+    assert handlers[0].digest_registry.algorithms == ("sha512",)
+    assert handlers[1].digest_registry is None
+    assert [task.worker.digest_registry for task in tasks] == [
+        handler.digest_registry for handler in handlers
+    ]
+    assert tasks[0].worker_thread.pool is WorkerPool()
+    assert tasks[1].worker_thread.pool is bounded
+
+
+@pytest.mark.unit
+def test_task_cancel_completes_once_and_ignores_late_worker(qapp) -> None:
+    task = Task(_Logger(), None, None, label="HEADERS", worker_class=_QuickWorker)
+    finished: list[bool] = []
+    task.finished.connect(lambda: finished.append(True))
+
+    task.cancel("deadline")
+    task._finished()
+
+    assert task.worker.is_cancelled
+    assert task.state == State.COMPLETED
+    assert task.status == Status.FAILURE
+    assert task.details == "deadline"
+    assert finished == [True]
+
+
+@pytest.mark.unit
+def test_task_subclasses_register_with_the_given_handler(qapp) -> None:
+    from fit_acquisition.tasks.post_acquisition.hash import TaskHash
+    from fit_acquisition.tasks.post_acquisition.pec.pec_and_download_eml import (
+        TaskPecAndDownloadEml,
+    )
+
+    handler = TasksHandler()
+    tasks = [
+        TaskHash(_Logger(), task_handler=handler),
+        TaskPecAndDownloadEml(_Logger(), task_handler=handler),
+    ]
+
+    for task in tasks:
+        assert task.task_handler is handler
+        assert handler.get_task(task.__class__.__name__) is task
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from fit_acquisition.tasks import task_discovery as discovery_module
+from fit_acquisition.tasks import tasks_manager as manager_module
+from fit_acquisition.tasks.tasks_handler import TasksHandler
+from fit_acquisition.tasks.task_discovery import TaskDiscovery
+
+TASK_MODULE = "\n".join(
+    [
+        "from fit_acquisition.tasks.task import Task",
+        "",
+        "class {name}(Task):",
+        "    pass",
+    ]
+)
+
+
+def _write_package(root: Path, package: str, modules: dict[str, str]) -> Path:
+    package_root = root / package
+    package_root.mkdir(exist_ok=True)
+    (package_root / "__init__.py").write_text("", encoding="utf-8")
+    for module, name in modules.items():
+        (package_root / f"{module}.py").write_text(
+            TASK_MODULE.format(name=name), encoding="utf-8"
+        )
+    return package_root
+
+
+@pytest.fixture
+def walks(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    walk_packages = discovery_module.pkgutil.walk_packages
+
+    def _walk_packages(path, prefix, onerror):
+        calls.append(prefix)
+        return walk_packages(path=path, prefix=prefix, onerror=onerror)
+
+    monkeypatch.setattr(discovery_module.pkgutil, "walk_packages", _walk_packages)
+    TaskDiscovery().clear()
+    yield calls
+    TaskDiscovery().clear()
+
+
+@pytest.mark.unit
+def test_discovery_is_cached_until_a_module_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, walks: list[str]
+) -> None:
+    package_root = _write_package(tmp_path, "cached_tasks", {"alpha": "TaskAlpha"})
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    first = TaskDiscovery().discover("cached_tasks")
+    second = TaskDiscovery().discover("cached_tasks")
+
+    assert first["TaskAlpha"] == ["cached_tasks.alpha"]
+    assert second is first
+    assert walks == ["cached_tasks."]
+
+    stat = os.stat(package_root / "alpha.py")
+    os.utime(package_root / "alpha.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    TaskDiscovery().discover("cached_tasks")
+    assert len(walks) == 2
+
+    _write_package(tmp_path, "cached_tasks", {"beta": "TaskBeta"})
+    assert TaskDiscovery().discover("cached_tasks")["TaskBeta"] == ["cached_tasks.beta"]
+    assert len(walks) == 3
+
+
+@pytest.mark.unit
+def test_discovery_of_missing_package_returns_none(walks: list[str]) -> None:
+    assert TaskDiscovery().discover("no_such_task_package") is None
+    assert walks == []
+
+
+@pytest.mark.unit
+def test_tasks_manager_filters_cached_discovery_on_every_load(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, walks: list[str]
+) -> None:
+    _write_package(
+        tmp_path, "filtered_tasks", {"alpha": "TaskAlpha", "beta": "TaskBeta"}
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    first = manager_module.TasksManager(TasksHandler())
+    first.register_task_package("filtered_tasks")
+    first.load_all_task_modules()
+
+    monkeypatch.setattr(
+        manager_module.TasksManager,
+        "is_enabled_tasks",
+        lambda self, name: [] if name == "TaskBeta" else [name],
+    )
+    second = manager_module.TasksManager(TasksHandler())
+    second.register_task_package("filtered_tasks")
+    second.load_all_task_modules()
+
+    assert walks == ["filtered_tasks."]
+    assert "TaskBeta" in first.class_names_modules
+    assert "TaskBeta" not in second.class_names_modules
+    assert second.class_names_modules["TaskAlpha"][0].__name__ == "filtered_tasks.alpha"
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from fit_acquisition.task_graph import TaskGraph, TaskNode
+
+
+def _graph() -> TaskGraph:
+    return TaskGraph(
+        [
+            TaskNode("case", provides=("case_info",)),
+            TaskNode("zip", provides=("archives",)),
+            TaskNode("hash", requires=("case_info", "archives"), provides=("hash",)),
+            TaskNode("report", requires=("hash",), provides=("report",)),
+            TaskNode("timestamp", requires=("report",), provides=("timestamp",)),
+            TaskNode("pec", requires=("report", "timestamp")),
+        ]
+    )
+
+
+@pytest.mark.unit
+def test_task_graph_ready_follows_dependencies() -> None:
+    graph = _graph()
+
+    assert graph.ready(set()) == ["case", "zip"]
+    assert graph.ready({"case"}, {"zip"}) == []
+    assert graph.ready({"case", "zip"}) == ["hash"]
+    assert graph.dependencies("pec") == {"report", "timestamp"}
+    assert graph.order == ["case", "zip", "hash", "report", "timestamp", "pec"]
+
+
+@pytest.mark.unit
+def test_task_graph_critical_path() -> None:
+    graph = _graph()
+
+    path, total = graph.critical_path(
+        {"case": 0.1, "zip": 5.0, "hash": 2.0, "report": 1.0, "timestamp": 0.5, "pec": 3.0}
+    )
+
+    assert path == ["zip", "hash", "report", "timestamp", "pec"]
+    assert total == pytest.approx(11.5)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "nodes",
+    [
+        [TaskNode("a"), TaskNode("a")],
+        [TaskNode("a", provides=("x",)), TaskNode("b", provides=("x",))],
+        [TaskNode("a", requires=("missing",))],
+        [TaskNode("a", requires=("y",), provides=("x",)), TaskNode("b", requires=("x",), provides=("y",))],
+    ],
+)
+def test_task_graph_rejects_invalid_graphs(nodes: list[TaskNode]) -> None:
+    with pytest.raises(ValueError):
+        TaskGraph(nodes)
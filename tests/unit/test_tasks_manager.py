@@ -6,11 +6,12 @@ import pytest
 
 from fit_acquisition.class_names import class_names
 from fit_acquisition.tasks import tasks_manager as manager_module
+from fit_acquisition.tasks.tasks_handler import TasksHandler
 
 
 @pytest.mark.unit
 def test_register_task_package_accepts_only_strings() -> None:
-    manager = manager_module.TasksManager()
+    manager = manager_module.TasksManager(TasksHandler())
     manager.task_package_names.clear()
 
     manager.register_task_package("fit_acquisition.tasks.network_tools")
@@ -21,7 +22,7 @@ def test_register_task_package_accepts_only_strings() -> None:
 
 @pytest.mark.unit
 def test_is_enabled_tasks_filters_disabled_network_tools(monkeypatch: pytest.MonkeyPatch) -> None:
-    manager = manager_module.TasksManager()
+    manager = manager_module.TasksManager(TasksHandler())
 
     monkeypatch.setattr(
         manager_module,
@@ -79,7 +80,7 @@ def test_is_enabled_tasks_filters_disabled_network_tools(monkeypatch: pytest.Mon
 
 @pytest.mark.unit
 def test_get_tasks_from_class_name_returns_existing_only() -> None:
-    manager = manager_module.TasksManager()
+    manager = manager_module.TasksManager(TasksHandler())
     manager.clear_tasks()
 
     class _TaskA:
@@ -96,3 +97,30 @@ def test_get_tasks_from_class_name_returns_existing_only() -> None:
     found = manager.get_tasks_from_class_name(["_TaskA", "Missing", "_TaskB"])
 
     assert found == [a, b]
+
+
+@pytest.mark.unit
+def test_init_tasks_registers_in_each_manager_handler() -> None:
+    from fit_acquisition.tasks.task import Task
+
+    class _TaskA(Task):
+        def __init__(self, logger, progress_bar=None, status_bar=None):
+            super().__init__(logger, progress_bar, status_bar)
+
+    module = SimpleNamespace(_TaskA=_TaskA)
+    first = manager_module.TasksManager(TasksHandler())
+    second = manager_module.TasksManager(TasksHandler())
+    for manager in (first, second):
+        manager.class_names_modules["_TaskA"] = [module]
+        manager.init_tasks(["_TaskA"], None, None, None)
+
+    assert first.task_handler is not second.task_handler
+    assert first.get_task("_TaskA") is not second.get_task("_TaskA")
+    assert first.get_task("_TaskA").task_handler is first.task_handler
+    assert len(first.get_tasks()) == len(second.get_tasks()) == 1
+
+
+@pytest.mark.unit
+def test_tasks_manager_requires_a_task_handler() -> None:
+    with pytest.raises(TypeError):
+        manager_module.TasksManager()  # type: ignore[call-arg]
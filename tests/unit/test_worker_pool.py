@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from fit_acquisition.tasks.worker_pool import (
+    BoundedWorkerPool,
+    PooledWorkerThread,
+    WorkerPool,
+)
+
+
+class _Worker:
+    def __init__(self, release: threading.Event | None = None) -> None:
+        self.release = release
+        self.thread = None
+
+    def start(self) -> None:
+        self.thread = threading.current_thread()
+        if self.release is not None:
+            self.release.wait(5)
+
+
+@pytest.mark.unit
+def test_worker_pool_is_shared_and_configurable(qapp) -> None:
+    pool = WorkerPool()
+    assert pool is WorkerPool()
+
+    pool.max_thread_count = 3
+    assert pool.max_thread_count == 3
+
+    pool.max_thread_count = None
+    assert pool.max_thread_count >= 8
+
+
+@pytest.mark.unit
+def test_bounded_worker_pool_leaves_the_shared_pool_alone(qapp) -> None:
+    shared = WorkerPool().max_thread_count
+    pool = BoundedWorkerPool(2)
+
+    assert pool is not WorkerPool()
+    assert pool.max_thread_count == 2
+    assert WorkerPool().max_thread_count == shared
+
+    handle = PooledWorkerThread(_Worker())
+    handle.pool = pool
+    assert handle.pool is pool
+    handle.start()
+    assert handle.wait(5) is True
+
+
+@pytest.mark.unit
+def test_pooled_worker_thread_mirrors_qthread_lifecycle(qapp) -> None:
+    release = threading.Event()
+    worker = _Worker(release)
+    handle = PooledWorkerThread(worker)
+
+    assert not handle.isRunning()
+    assert not handle.isFinished()
+    assert handle.wait() is True
+
+    handle.start()
+    assert handle.wait(0.05) is False
+    assert handle.isRunning()
+
+    release.set()
+    handle.quit()
+    assert handle.wait(5) is True
+    assert handle.isFinished()
+    assert worker.thread is not threading.main_thread()
+
+
+@pytest.mark.unit
+def test_worker_pool_caps_concurrency(qapp) -> None:
+    pool = WorkerPool()
+    pool.max_thread_count = 2
+    running = []
+    peak = []
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def job() -> None:
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        release.wait(0.1)
+        with lock:
+            running.pop()
+
+    done = [pool.submit(job) for _ in range(6)]
+    for event in done:
+        assert event.wait(5)
+
+    assert max(peak) == 2
+    pool.max_thread_count = None
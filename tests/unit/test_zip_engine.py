@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fit_acquisition import zip_engine
+
+
+def _make_tree(root) -> None:
+    (root / "pages" / "empty").mkdir(parents=True)
+    for index in range(20):
+        (root / "pages" / f"page_{index:02d}.html").write_bytes(
+            b"<html>" + b"content " * (index + 1) * 500 + b"</html>"
+        )
+    (root / "video.mp4").write_bytes(os.urandom(4096))
+    (root / "capture.pcap.gz").write_bytes(os.urandom(1024))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("parallel", [False, True])
+def test_make_zip_matches_content_and_order(tmp_path, parallel: bool) -> None:
+    source = tmp_path / "downloads"
+    source.mkdir()
+    _make_tree(source)
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            archive_name = zip_engine.make_zip(
+                str(source), str(source), executor, max_pending=2
+            )
+    else:
+        archive_name = zip_engine.make_zip(str(source), str(source))
+
+    with zipfile.ZipFile(archive_name) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert names[:2] == ["pages/", "capture.pcap.gz"]
+        assert "pages/empty/" in names
+        assert names.index("pages/page_00.html") < names.index("pages/page_19.html")
+        assert archive.read("pages/page_03.html") == (source / "pages" / "page_03.html").read_bytes()
+        assert archive.getinfo("video.mp4").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("capture.pcap.gz").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("pages/page_03.html").compress_type == zipfile.ZIP_DEFLATED
+
+
+@pytest.mark.unit
+def test_make_zip_streams_to_unseekable_file_objects(tmp_path) -> None:
+    source = tmp_path / "screenshot"
+    source.mkdir()
+    _make_tree(source)
+
+    class _Stream:
+        def __init__(self, f) -> None:
+            self._f = f
+            self._position = 0
+
+        def write(self, data) -> int:
+            self._position += len(data)
+            return self._f.write(data)
+
+        def tell(self) -> int:
+            return self._position
+
+        def flush(self) -> None:
+            self._f.flush()
+
+    with open(tmp_path / "stream.zip", "wb") as f, ThreadPoolExecutor(2) as executor:
+        zip_engine.make_zip(str(source), str(source), executor, fileobj=_Stream(f))
+
+    with zipfile.ZipFile(tmp_path / "stream.zip") as archive:
+        assert archive.testzip() is None
+        assert len(archive.namelist()) == 24
+
+
+def _members(archive_name) -> list[tuple]:
+    with zipfile.ZipFile(archive_name) as archive:
+        assert archive.testzip() is None
+        return [
+            (
+                info.filename,
+                info.compress_type,
+                info.CRC,
+                info.file_size,
+                info.compress_size,
+                info.date_time,
+                info.external_attr,
+            )
+            for info in archive.infolist()
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    not (
+        zip_engine.RAW_MEMBER_PYTHON_VERSIONS[0]
+        <= sys.version_info[:2]
+        < zip_engine.RAW_MEMBER_PYTHON_VERSIONS[1]
+    ),
+    reason="raw zip members are only written on the supported Python versions",
+)
+def test_raw_members_match_zipfile_on_supported_pythons(tmp_path) -> None:
+    source = tmp_path / "downloads"
+    source.mkdir()
+    _make_tree(source)
+
+    with zipfile.ZipFile(tmp_path / "probe.zip", "w") as archive:
+        assert zip_engine.supports_raw_members(archive)
+
+    sequential = zip_engine.make_zip(str(tmp_path / "sequential"), str(source))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = zip_engine.make_zip(str(tmp_path / "parallel"), str(source), executor)
+
+    assert _members(parallel) == _members(sequential)
+
+
+@pytest.mark.unit
+def test_make_zip_streams_every_member_outside_supported_pythons(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "downloads"
+    source.mkdir()
+    _make_tree(source)
+
+    monkeypatch.setattr(zip_engine, "RAW_MEMBER_PYTHON_VERSIONS", ((2, 0), (3, 0)))
+    monkeypatch.setattr(
+        zip_engine,
+        "_deflate_member",
+        lambda *args: pytest.fail("members were deflated outside zipfile"),
+    )
+
+    member_digests: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        archive_name = zip_engine.make_zip(
+            str(tmp_path / "fallback"),
+            str(source),
+            executor,
+            member_digests=member_digests,
+        )
+
+    assert len(_members(archive_name)) == 24
+    assert len(member_digests) == 22
+    assert zip_engine.verify_member(archive_name, "pages/page_07.html", member_digests)
+
+
+@pytest.mark.unit
+def test_compression_for_keeps_compressed_media_stored() -> None:
+    assert zip_engine.compression_for("a/B.JPG") == zipfile.ZIP_STORED
+    assert zip_engine.compression_for("network.pcap") == zipfile.ZIP_DEFLATED
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("parallel", [False, True])
+def test_make_zip_records_member_digests(tmp_path, parallel: bool) -> None:
+    source = tmp_path / "downloads"
+    source.mkdir()
+    _make_tree(source)
+
+    member_digests: dict[str, str] = {}
+    with ThreadPoolExecutor(2) as executor:
+        archive_name = zip_engine.make_zip(
+            str(source),
+            str(source),
+            executor if parallel else None,
+            member_digests=member_digests,
+        )
+
+    assert "pages/empty/" not in member_digests
+    assert member_digests["video.mp4"] == hashlib.sha256(
+        (source / "video.mp4").read_bytes()
+    ).hexdigest()
+    assert len(member_digests) == 22
+
+    with open(zip_engine.member_digests_filename(archive_name), "w", encoding="utf-8") as f:
+        zip_engine.write_member_digests(f, member_digests)
+
+    assert zip_engine.load_member_digests(archive_name + ".sha256") == member_digests
+    assert zip_engine.verify_member(archive_name, "pages/page_07.html")
+
+
+@pytest.mark.unit
+def test_verify_member_detects_tampering(tmp_path) -> None:
+    source = tmp_path / "screenshot"
+    source.mkdir()
+    (source / "full.png").write_bytes(b"png")
+    archive_name = zip_engine.make_zip(str(source), str(source))
+
+    assert zip_engine.verify_member(archive_name, "full.png", {"full.png": "0" * 64}) is False
+
+    with pytest.raises(KeyError):
+        zip_engine.verify_member(archive_name, "missing.png", {})